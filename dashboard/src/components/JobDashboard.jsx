@@ -1,26 +1,61 @@
 import React, { useState, useMemo } from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell, RadarChart, PolarGrid, PolarAngleAxis, PolarRadiusAxis, Radar } from 'recharts';
 import jobs from "../data/jobs.json";
+// code → label (scrapers/dimensions.py, xuất bởi csv_to_json.py)
+import dimensions from "../data/dimensions.json";
+
+// Top N city trên chart, còn lại gộp vào "Others"
+const TOP_CITIES = 5;
 
 
 const JobDashboard = () => {
     const [selectedPlatform, setSelectedPlatform] = useState('all');
     const [selectedLocation, setSelectedLocation] = useState('all');
+    const [selectedRole, setSelectedRole] = useState('all');
+    const [selectedSeniority, setSelectedSeniority] = useState('all');
 
-    // Process data based on filters
+    // Filter theo code (int) đã tính sẵn → so sánh bằng, không scan string
     const filteredJobs = useMemo(() => {
-        return jobs.filter(job => {
-            const platformMatch = selectedPlatform === 'all' || job.platform === selectedPlatform;
-            const locationMatch = selectedLocation === 'all' ||
-                job.location.toLowerCase().includes(selectedLocation.toLowerCase());
-            return platformMatch && locationMatch;
+        const city = selectedLocation === 'all' ? null : Number(selectedLocation);
+        const role = selectedRole === 'all' ? null : Number(selectedRole);
+        const seniority = selectedSeniority === 'all' ? null : Number(selectedSeniority);
+        return jobs.filter(job =>
+            (selectedPlatform === 'all' || job.platform === selectedPlatform) &&
+            (city === null || job.city === city) &&
+            (role === null || job.role === role) &&
+            (seniority === null || job.seniority === seniority)
+        );
+    }, [selectedPlatform, selectedLocation, selectedRole, selectedSeniority]);
+
+    // Option của filter: chỉ các code có trong data, nhiều job trước
+    const filterOptions = useMemo(() => {
+        const options = (field) => {
+            const counts = {};
+            jobs.forEach(job => {
+                if (job[field]) counts[job[field]] = (counts[job[field]] || 0) + 1;
+            });
+            return Object.keys(counts)
+                .sort((a, b) => counts[b] - counts[a])
+                .map(code => ({ code, label: dimensions[field][code] }));
+        };
+        return { city: options('city'), role: options('role'), seniority: options('seniority') };
+    }, []);
+
+    // 1 cluster = 1 opening (cùng job đăng trên nhiều platform, xem dedup_jobs.py)
+    const uniqueJobs = useMemo(() => {
+        const seen = new Set();
+        return filteredJobs.filter(job => {
+            const key = job.cluster_id || `${job.platform}|${job.title}|${job.location}`;
+            if (seen.has(key)) return false;
+            seen.add(key);
+            return true;
         });
-    }, [selectedPlatform, selectedLocation]);
+    }, [filteredJobs]);
 
     // Calculate top skills
     const skillCounts = useMemo(() => {
         const counts = {};
-        filteredJobs.forEach(job => {
+        uniqueJobs.forEach(job => {
             job.skills.forEach(skill => {
                 counts[skill] = (counts[skill] || 0) + 1;
             });
@@ -29,7 +64,7 @@ const JobDashboard = () => {
             .map(([skill, count]) => ({ skill, count }))
             .sort((a, b) => b.count - a.count)
             .slice(0, 20);
-    }, [filteredJobs]);
+    }, [uniqueJobs]);
 
     // Platform distribution
     const platformData = useMemo(() => {
@@ -48,14 +83,23 @@ const JobDashboard = () => {
     const locationData = useMemo(() => {
         const counts = {};
         filteredJobs.forEach(job => {
-            const city = job.location.includes('Hà Nội') || job.location.includes('Ha Noi') ? 'Hanoi' :
-                job.location.includes('Hồ Chí Minh') ? 'Ho Chi Minh' :
-                    job.location.includes('Cần Thơ') ? 'Can Tho' : 'Others';
-            counts[city] = (counts[city] || 0) + 1;
+            counts[job.city] = (counts[job.city] || 0) + 1;
         });
-        return Object.entries(counts).map(([city, count]) => ({ city, count }));
+        const known = Object.entries(counts)
+            .filter(([code]) => code !== '0')
+            .sort((a, b) => b[1] - a[1]);
+        const others = (counts[0] || 0) +
+            known.slice(TOP_CITIES).reduce((sum, [, count]) => sum + count, 0);
+        const data = known.slice(0, TOP_CITIES)
+            .map(([code, count]) => ({ city: dimensions.city[code], count }));
+        return others ? [...data, { city: 'Others', count: others }] : data;
     }, [filteredJobs]);
 
+    const cityCount = useMemo(
+        () => new Set(filteredJobs.map(job => job.city).filter(Boolean)).size,
+        [filteredJobs]
+    );
+
     // Skill categories
     const skillCategories = useMemo(() => {
         const languages = ['Python', 'Java', 'TypeScript', 'JavaScript', 'Golang', 'SQL'];
@@ -86,7 +130,7 @@ const JobDashboard = () => {
                         Vietnam Tech Job Market Analysis
                     </h1>
                     <p className="text-slate-600">
-                        Real-time analysis of {filteredJobs.length} tech job postings • January 2025
+                        Real-time analysis of {filteredJobs.length} tech job postings ({uniqueJobs.length} unique openings) • January 2025
                     </p>
                 </div>
 
@@ -105,7 +149,7 @@ const JobDashboard = () => {
                         <div className="text-slate-600 text-sm mt-1">Platforms</div>
                     </div>
                     <div className="bg-white rounded-xl p-6 shadow-lg border border-slate-200">
-                        <div className="text-3xl font-bold text-emerald-600">{locationData.length}</div>
+                        <div className="text-3xl font-bold text-emerald-600">{cityCount}</div>
                         <div className="text-slate-600 text-sm mt-1">Cities</div>
                     </div>
                 </div>
@@ -134,9 +178,35 @@ const JobDashboard = () => {
                                 className="w-full px-4 py-2 border border-slate-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
                             >
                                 <option value="all">All Locations</option>
-                                <option value="hanoi">Hanoi</option>
-                                <option value="ho chi minh">Ho Chi Minh</option>
-                                <option value="can tho">Can Tho</option>
+                                {filterOptions.city.map(({ code, label }) => (
+                                    <option key={code} value={code}>{label}</option>
+                                ))}
+                            </select>
+                        </div>
+                        <div className="flex-1 min-w-[200px]">
+                            <label className="block text-sm font-medium text-slate-700 mb-2">Role</label>
+                            <select
+                                value={selectedRole}
+                                onChange={(e) => setSelectedRole(e.target.value)}
+                                className="w-full px-4 py-2 border border-slate-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+                            >
+                                <option value="all">All Roles</option>
+                                {filterOptions.role.map(({ code, label }) => (
+                                    <option key={code} value={code}>{label}</option>
+                                ))}
+                            </select>
+                        </div>
+                        <div className="flex-1 min-w-[200px]">
+                            <label className="block text-sm font-medium text-slate-700 mb-2">Seniority</label>
+                            <select
+                                value={selectedSeniority}
+                                onChange={(e) => setSelectedSeniority(e.target.value)}
+                                className="w-full px-4 py-2 border border-slate-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+                            >
+                                <option value="all">All Levels</option>
+                                {filterOptions.seniority.map(({ code, label }) => (
+                                    <option key={code} value={code}>{label}</option>
+                                ))}
                             </select>
                         </div>
                     </div>
@@ -1,9 +1,13 @@
 import requests
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
 from abc import ABC, abstractmethod
+import logging
 import time
-import random
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Optional, Tuple
 
 # Selenium
 from selenium import webdriver
@@ -14,12 +18,62 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+from .driver_pool import DriverPool
+from .fetch_router import FETCH_MODES, FetchRouter
+from .html_archive import HtmlArchive
+from .http_cache import ResponseCache
+from .parsers import make_soup, resolve_parser
+from .rate_limiter import HostRateLimiter, get_limiter, parse_retry_after
+from .telemetry import Telemetry, get_telemetry
+
+logger = logging.getLogger(__name__)
+
 
 class BaseScraper(ABC):
     """
     Base class cho toàn bộ scraper (ITViec, TopCV, VietnamWorks).
     """
 
+    # Tên platform (key trong raw_data / archive), set ở subclass
+    PLATFORM = ""
+
+    # auto fetch mode: selector chắc chắn có khi trang đã đủ nội dung, theo kind
+    CONTENT_SELECTORS: Dict[str, str] = {}
+
+    # Text chỉ có trên trang hợp lệ nhưng không có kết quả (vd. trang list cuối
+    # rỗng) → kết quả rỗng hợp lệ, không tính là requests fail / escalate
+    EMPTY_MARKERS: Dict[str, Tuple[str, ...]] = {}
+
+    # Profile "fast": chặn tài nguyên không bao giờ parse (ảnh, font, ads, analytics)
+    BLOCKED_URL_PATTERNS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.svg",
+        "*.ico",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.otf",
+        "*.mp4",
+        "*.webm",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*facebook.net*",
+        "*connect.facebook.com*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*analytics.tiktok.com*",
+    ]
+
+    # ChromeDriverManager().install() chỉ chạy 1 lần / process
+    _chromedriver_path: Optional[str] = None
+    _chromedriver_lock = threading.Lock()
+
     def __init__(
         self,
         base_url: str,
@@ -27,21 +81,78 @@ class BaseScraper(ABC):
         selenium_mode: str = "reuse",
         retries: int = 2,
         wait_time: int = 12,
+        max_per_host: int = 4,
+        pool_size: int = 3,
+        cache: Optional[ResponseCache] = None,
+        parser: str = "auto",
+        rate_limit: Optional[dict] = None,
+        browser_profile: str = "default",
+        blocked_url_patterns: Optional[List[str]] = None,
+        archive: Optional[HtmlArchive] = None,
+        telemetry: Optional[Telemetry] = None,
+        fetch_mode: Optional[str] = None,
     ):
         self.base_url = base_url
-        self.use_selenium = use_selenium
-        self.selenium_mode = selenium_mode  # "reuse" hoặc "fresh"
+
+        # "requests" / "selenium" / "auto" (requests trước, thiếu nội dung → Selenium)
+        # Không truyền → theo use_selenium như cũ
+        fetch_mode = fetch_mode or ("selenium" if use_selenium else "requests")
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch_mode: {fetch_mode} (choose {FETCH_MODES})")
+        self.fetch_mode = fetch_mode
+        self.fetch_router = FetchRouter()
+
+        # use_selenium = được phép dùng browser
+        self.use_selenium = fetch_mode != "requests"
+        self.selenium_mode = selenium_mode  # "reuse", "fresh" hoặc "pool"
+        self.pool_size = pool_size
 
         # Defaults luôn hợp lệ
         self.retries = retries or 2
         self.wait_time = wait_time or 12
 
+        # Số request async tối đa đang chạy cùng lúc trên mỗi host
+        self.max_per_host = max_per_host or 4
+
+        # Histogram phase / bytes / retries / errors (mặc định: registry của process)
+        self.telemetry = telemetry or get_telemetry()
+
         # Requests session
         self.session = self._setup_requests_session()
 
-        # Selenium driver (only reuse mode)
-        if use_selenium and selenium_mode == "reuse":
-            self.driver = self._setup_selenium_driver()
+        # Cache response trên đĩa (opt-in)
+        self.cache = cache
+
+        # Archive HTML đã fetch để re-parse offline (opt-in)
+        self.archive = archive
+
+        # HTML parser backend: "auto" (lxml nếu có), "lxml", "html.parser"
+        self.parser = resolve_parser(parser)
+
+        # Option cho HostRateLimiter (rate, max_rate, ...), dùng khi tạo lần đầu
+        self.rate_limit = rate_limit or {}
+
+        # "default" hoặc "fast" (eager load + chặn asset)
+        self.browser_profile = browser_profile
+        self.blocked_url_patterns = (
+            blocked_url_patterns
+            if blocked_url_patterns is not None
+            else self.BLOCKED_URL_PATTERNS
+        )
+
+        # Timing từng trang Selenium (navigation / wait / bytes)
+        self.page_timings: List[Dict] = []
+        self._timings_lock = threading.Lock()
+
+        # Selenium driver (reuse mode) / driver pool (pool mode)
+        # reuse: 1 driver dùng chung → khoá khi nhiều thread cùng gọi
+        self._driver_lock = threading.RLock()
+        self.driver = None
+        self.driver_pool: Optional[DriverPool] = None
+
+        # auto: chỉ mở Chrome khi có trang đầu tiên cần escalate
+        if self.fetch_mode == "selenium":
+            self._ensure_browser()
 
     # ============================================================
     # Unified entrypoint
@@ -51,13 +162,135 @@ class BaseScraper(ABC):
         url: str,
         retries: Optional[int] = None,
         wait_selector: Optional[str] = None,
+        kind: Optional[str] = None,
     ) -> BeautifulSoup:
-
+        """
+        kind: "list" / "detail" → lưu HTML vào archive (nếu có) để re-parse offline
+        """
         retries = retries or self.retries
 
-        if self.use_selenium:
-            return self._get_page_selenium(url, retries, wait_selector)
-        return self._get_page_requests(url, retries)
+        if self.fetch_mode == "auto":
+            return self._get_page_auto(url, retries, wait_selector, kind)
+
+        html = self._get_html(url, retries, wait_selector, self.fetch_mode)
+        self._archive_page(url, html, kind)
+        return self._make_soup(html)
+
+    def _get_html(
+        self,
+        url: str,
+        retries: int,
+        wait_selector: Optional[str],
+        backend: str,
+    ) -> str:
+        if self.cache is not None:
+            return self._get_html_cached(url, retries, wait_selector, backend)
+        if backend == "selenium":
+            return self._fetch_selenium_html(url, retries, wait_selector)
+        return self._fetch_requests(url, retries).text
+
+    # ============================================================
+    # Auto fetch mode — requests trước, Selenium khi cần
+    # ============================================================
+    def _get_page_auto(
+        self,
+        url: str,
+        retries: int,
+        wait_selector: Optional[str],
+        kind: Optional[str],
+    ) -> BeautifulSoup:
+        if self.fetch_router.choose(url, kind) == "requests":
+            try:
+                # 1 attempt: lỗi (403, chặn bot, ...) → escalate luôn
+                html = self._get_html(url, 1, wait_selector, "requests")
+                soup = self._make_soup(html)
+                ok = self.has_content(soup, kind, wait_selector)
+            except Exception as e:
+                logger.debug(f"↗️ Requests failed {url}: {e}", extra={"url": url})
+                ok = False
+
+            self.fetch_router.record(url, ok, kind)
+            if ok:
+                self._archive_page(url, html, kind)
+                return soup
+
+            self.telemetry.incr(self.PLATFORM, "escalations")
+            logger.debug(f"↗️ Escalate → Selenium {url}", extra={"url": url})
+
+        html = self._get_html(url, retries, wait_selector, "selenium")
+        self._archive_page(url, html, kind)
+        return self._make_soup(html)
+
+    def has_content(
+        self,
+        soup: BeautifulSoup,
+        kind: Optional[str] = None,
+        wait_selector: Optional[str] = None,
+    ) -> bool:
+        """
+        Trang lấy bằng requests đã đủ nội dung để parse chưa (auto mode).
+        Mặc định: có wait_selector / CONTENT_SELECTORS[kind], hoặc là trang
+        rỗng hợp lệ (EMPTY_MARKERS[kind]); subclass override được khi cần
+        điều kiện phức tạp hơn.
+
+        Không khai báo selector → False: trang challenge / JS shell cũng có
+        <body>, chỉ có <body> không chứng minh được gì.
+        """
+        selector = wait_selector or self.CONTENT_SELECTORS.get(kind)
+        if selector and soup.select_one(selector) is not None:
+            return True
+        return self.is_empty_result(soup, kind)
+
+    def is_empty_result(self, soup: BeautifulSoup, kind: Optional[str] = None) -> bool:
+        """Trang hợp lệ nhưng không có kết quả (EMPTY_MARKERS[kind])."""
+        markers = self.EMPTY_MARKERS.get(kind)
+        if not markers or soup.body is None:
+            return False
+        text = soup.body.get_text(" ", strip=True).lower()
+        return any(marker.lower() in text for marker in markers)
+
+    def _archive_page(self, url: str, content: str, kind: Optional[str]):
+        if self.archive is None or not kind:
+            return
+        try:
+            self.archive.put(url, content, self.PLATFORM, kind)
+        except Exception as e:
+            # Archive lỗi không được làm hỏng crawl
+            logger.warning(f"⚠️ Archive failed {url}: {e}", extra={"url": url})
+
+    def _make_soup(self, html: str) -> BeautifulSoup:
+        with self.timed("parse"):
+            return make_soup(html, self.parser)
+
+    def timed(self, phase: str):
+        """Context manager đo 1 phase của platform này (telemetry)."""
+        return self.telemetry.timer(self.PLATFORM, phase)
+
+    def _observe_attempt(
+        self,
+        attempt: int,
+        elapsed: float,
+        error: Optional[Exception] = None,
+        nbytes: int = 0,
+        phase: str = "fetch",
+    ):
+        telemetry = self.telemetry
+        telemetry.observe(self.PLATFORM, phase, elapsed)
+        telemetry.incr(self.PLATFORM, "requests")
+        if attempt > 1:
+            telemetry.incr(self.PLATFORM, "retries")
+        if error is not None:
+            telemetry.error(self.PLATFORM, phase, error)
+        if nbytes:
+            telemetry.incr(self.PLATFORM, "bytes_received", nbytes)
+
+    def _limiter(self, url: str) -> HostRateLimiter:
+        """Limiter của host, dùng chung cho mọi worker trong process."""
+        return get_limiter(url, **self.rate_limit)
+
+    @property
+    def rate_limiter(self) -> HostRateLimiter:
+        return self._limiter(self.base_url)
 
     # ============================================================
     # Requests section
@@ -77,25 +310,323 @@ class BaseScraper(ABC):
         )
         return session
 
-    def _get_page_requests(self, url: str, retries: int) -> BeautifulSoup:
+    def _fetch_requests(
+        self,
+        url: str,
+        retries: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        limiter = self._limiter(url)
+
         for attempt in range(1, retries + 1):
+            # Chờ token / backoff của host thay cho sleep cố định
+            limiter.acquire()
+            started = time.monotonic()
+            recorded = False
             try:
-                print(f"➡️ [Requests] GET {url} (Attempt {attempt})")
+                logger.debug(
+                    f"➡️ [Requests] GET {url} (Attempt {attempt})",
+                    extra={"url": url, "attempt": attempt},
+                )
 
-                r = self.session.get(url, timeout=15)
+                r = self.session.get(url, timeout=15, headers=headers)
+                limiter.record(
+                    r.status_code,
+                    time.monotonic() - started,
+                    retry_after=parse_retry_after(r.headers.get("Retry-After")),
+                )
+                recorded = True
                 r.raise_for_status()
 
-                return BeautifulSoup(r.text, "html.parser")
+                self._observe_attempt(
+                    attempt, time.monotonic() - started, nbytes=len(r.content)
+                )
+                return r
 
             except Exception as e:
-                print(f"❌ Requests failed {attempt}: {e}")
+                self._observe_attempt(attempt, time.monotonic() - started, error=e)
+                logger.warning(
+                    f"❌ Requests failed {attempt}: {e}",
+                    extra={"url": url, "attempt": attempt},
+                )
+                if not recorded:
+                    limiter.record(None, time.monotonic() - started, error=True)
                 if attempt == retries:
                     raise
-                time.sleep(random.uniform(1, 2))
+
+    # ============================================================
+    # Cache section
+    # ============================================================
+    def _get_html_cached(
+        self,
+        url: str,
+        retries: int,
+        wait_selector: Optional[str],
+        backend: str,
+    ) -> str:
+        entry, html = self._cache_lookup(url, backend)
+        if html is not None:
+            return html
+
+        # Selenium: TTL-only, hết hạn → load lại page_source
+        if backend == "selenium":
+            self.cache.record("miss")
+            html = self._fetch_selenium_html(url, retries, wait_selector)
+            self.cache.put(url, html, backend="selenium")
+            return html
+
+        r = self._fetch_requests(
+            url, retries, headers=self._revalidation_headers(entry) or None
+        )
+        return self._cache_response(url, entry, r.status_code, r.text, r.headers)
+
+    def _cache_lookup(self, url: str, backend: str):
+        """(entry, html): html != None khi entry còn trong TTL → dùng luôn."""
+        cache = self.cache
+        entry = cache.get(url)
+
+        # Còn trong TTL → không đụng tới network / browser
+        # (auto escalate → không dùng lại bản requests vừa thiếu nội dung)
+        usable = entry is not None and (
+            backend == "requests" or entry.backend == "selenium"
+        )
+        if usable and cache.is_fresh(entry):
+            cache.record("hit", len(entry.html))
+            logger.debug(f"💾 [Cache] HIT {url}", extra={"url": url})
+            return entry, entry.html
+        return entry, None
+
+    @staticmethod
+    def _revalidation_headers(entry) -> Dict[str, str]:
+        """Requests: revalidate bằng ETag / Last-Modified."""
+        headers = {}
+        if entry is not None and entry.backend == "requests":
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _cache_response(self, url: str, entry, status: int, text: str, headers) -> str:
+        """304 → dùng lại bản cache; còn lại → lưu response mới."""
+        cache = self.cache
+        if status == 304 and entry is not None:
+            cache.touch(url)
+            cache.record("revalidated", len(entry.html))
+            logger.debug(f"💾 [Cache] 304 Not Modified {url}", extra={"url": url})
+            return entry.html
+
+        cache.record("miss")
+        cache.put(
+            url,
+            text,
+            backend="requests",
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        return text
+
+    # ============================================================
+    # Async section (aiohttp)
+    # ============================================================
+    async def iter_pages_async(
+        self,
+        urls: List[str],
+        retries: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Optional[BeautifulSoup]]]:
+        """
+        Fetch nhiều URL song song, yield (url, soup) theo thứ tự hoàn thành.
+
+        - Dùng chung 1 ClientSession → tái sử dụng kết nối (keep-alive)
+        - Tối đa `max_per_host` request đang chạy trên mỗi host
+        - URL lỗi sau khi hết retries → yield (url, None)
+        """
+        retries = retries or self.retries
+
+        connector = aiohttp.TCPConnector(
+            limit=0, limit_per_host=self.max_per_host, ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=15)
+
+        async with aiohttp.ClientSession(
+            headers=dict(self.session.headers), connector=connector, timeout=timeout
+        ) as session:
+            tasks = [
+                asyncio.create_task(self._fetch_async(session, url, retries))
+                for url in urls
+            ]
+            try:
+                for fut in asyncio.as_completed(tasks):
+                    url, html = await fut
+                    if html is None:
+                        yield url, None
+                        continue
+                    self._archive_page(url, html, kind)
+                    yield url, self._make_soup(html)
+            finally:
+                # Caller dừng sớm → huỷ các request còn lại
+                for task in tasks:
+                    task.cancel()
+
+    async def get_pages_async(
+        self,
+        urls: List[str],
+        retries: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> List[Tuple[str, Optional[BeautifulSoup]]]:
+        return [item async for item in self.iter_pages_async(urls, retries, kind)]
+
+    def get_pages(
+        self,
+        urls: List[str],
+        retries: Optional[int] = None,
+        kind: Optional[str] = None,
+    ) -> List[Tuple[str, Optional[BeautifulSoup]]]:
+        """Bản sync của get_pages_async (dùng khi không có event loop)."""
+        return asyncio.run(self.get_pages_async(urls, retries, kind))
+
+    async def _fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        retries: int,
+    ) -> Tuple[str, Optional[str]]:
+        # Cùng response cache với get_page (TTL + ETag / Last-Modified)
+        entry = None
+        headers = None
+        if self.cache is not None:
+            entry, html = self._cache_lookup(url, "requests")
+            if html is not None:
+                return url, html
+            headers = self._revalidation_headers(entry) or None
+
+        limiter = self._limiter(url)
+
+        for attempt in range(1, retries + 1):
+            await limiter.acquire_async()
+            started = time.monotonic()
+            recorded = False
+            try:
+                logger.debug(
+                    f"⚡ [Async] GET {url} (Attempt {attempt})",
+                    extra={"url": url, "attempt": attempt},
+                )
+
+                async with session.get(url, headers=headers) as r:
+                    limiter.record(
+                        r.status,
+                        time.monotonic() - started,
+                        retry_after=parse_retry_after(r.headers.get("Retry-After")),
+                    )
+                    recorded = True
+                    r.raise_for_status()
+                    body = await r.read()
+                    html = await r.text()
+
+                self._observe_attempt(
+                    attempt, time.monotonic() - started, nbytes=len(body)
+                )
+                if self.cache is not None:
+                    html = self._cache_response(url, entry, r.status, html, r.headers)
+                return url, html
+
+            except Exception as e:
+                self._observe_attempt(attempt, time.monotonic() - started, error=e)
+                logger.warning(
+                    f"❌ Async failed {attempt}: {e}",
+                    extra={"url": url, "attempt": attempt},
+                )
+                if not recorded:
+                    limiter.record(None, time.monotonic() - started, error=True)
+                if attempt == retries:
+                    return url, None
+
+    async def scrape_job_details_async(
+        self,
+        job_urls: List[str],
+    ) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """
+        Chạy parse_job_detail trên kết quả của iter_pages_async.
+        Yield (job_url, detail) theo thứ tự hoàn thành, detail=None nếu lỗi.
+        """
+        async for url, soup in self.iter_pages_async(job_urls, kind="detail"):
+            if soup is None:
+                yield url, None
+                continue
+
+            try:
+                with self.timed("extract"):
+                    detail = self.parse_job_detail(soup, url)
+            except Exception as e:
+                logger.error(f"❌ Error parsing detail {url}: {e}", extra={"url": url})
+                yield url, None
+                continue
+
+            yield url, detail
+
+    # ============================================================
+    # Batch detail fetch (chọn backend song song phù hợp)
+    # ============================================================
+    def scrape_job_details(
+        self, job_urls: List[str]
+    ) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Scrape nhiều detail, trả về (job_url, detail) theo thứ tự hoàn thành.
+
+        - requests → aiohttp (scrape_job_details_async)
+        - auto → thread pool (max_per_host), trang nào cần thì escalate
+        - Selenium pool → mỗi thread mượn 1 driver trong pool
+        - reuse / fresh → tuần tự
+        """
+        if self.fetch_mode == "requests":
+
+            async def _collect():
+                return [item async for item in self.scrape_job_details_async(job_urls)]
+
+            return iter(asyncio.run(_collect()))
+
+        if self.fetch_mode == "auto":
+            return self._scrape_job_details_threaded(job_urls, self.max_per_host)
+
+        if self.selenium_mode == "pool":
+            return self._scrape_job_details_threaded(job_urls, self.pool_size)
+
+        return ((url, self._scrape_job_detail_safe(url)) for url in job_urls)
+
+    def _scrape_job_details_threaded(
+        self, job_urls: List[str], workers: int
+    ) -> Iterator[Tuple[str, Optional[Dict]]]:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._scrape_job_detail_safe, url): url
+                for url in job_urls
+            }
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
+
+    def _scrape_job_detail_safe(self, job_url: str) -> Optional[Dict]:
+        try:
+            return self.scrape_job_detail(job_url)
+        except Exception as e:
+            logger.error(
+                f"❌ Error scraping detail {job_url}: {e}", extra={"url": job_url}
+            )
+            return None
 
     # ============================================================
     # Selenium section
     # ============================================================
+    def _ensure_browser(self):
+        """Tạo driver (reuse) / driver pool (pool) nếu chưa có."""
+        with self._driver_lock:
+            if self.selenium_mode == "reuse" and self.driver is None:
+                self.driver = self._setup_selenium_driver()
+            elif self.selenium_mode == "pool" and self.driver_pool is None:
+                self.driver_pool = DriverPool(
+                    self._setup_selenium_driver, self.pool_size
+                )
+
     def _setup_selenium_driver(self):
         chrome_options = Options()
         chrome_options.add_argument("--headless")
@@ -108,43 +639,82 @@ class BaseScraper(ABC):
             "Chrome/120.0.0.0 Safari/537.36"
         )
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.browser_profile == "fast":
+            # Trả về ngay khi DOMContentLoaded, không chờ load event
+            chrome_options.page_load_strategy = "eager"
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs",
+                {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2,
+                },
+            )
+
+        self._configure_chrome_options(chrome_options)
+
+        # Khởi động Chrome (đắt nhất ở mode "fresh": mỗi request 1 lần)
+        with self.timed("driver_setup"):
+            service = Service(self._get_chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+
+            if self.browser_profile == "fast" and self.blocked_url_patterns:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": self.blocked_url_patterns}
+                )
 
         return driver
 
-    def _get_page_selenium(
+    def _configure_chrome_options(self, chrome_options: Options):
+        """Hook cho subclass thêm option / capability riêng."""
+        pass
+
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path is None:
+                cls._chromedriver_path = ChromeDriverManager().install()
+            return cls._chromedriver_path
+
+    def _fetch_selenium_html(
         self,
         url: str,
         retries: int,
         wait_selector: Optional[str],
-    ) -> BeautifulSoup:
+    ) -> str:
 
         for attempt in range(1, retries + 1):
             driver = None
             try:
-                print(
-                    f"🌐 [Selenium] GET {url} (Attempt {attempt}, mode={self.selenium_mode})"
+                logger.debug(
+                    f"🌐 [Selenium] GET {url} (Attempt {attempt}, mode={self.selenium_mode})",
+                    extra={"url": url, "attempt": attempt},
                 )
+                if attempt > 1:
+                    self.telemetry.incr(self.PLATFORM, "retries")
+
+                self._ensure_browser()
+
+                # If pool → mượn driver warm, tự reset khi trả lại
+                if self.selenium_mode == "pool":
+                    with self.driver_pool.driver() as pooled:
+                        return self._load_with_driver(pooled, url, wait_selector)
 
                 # If fresh → create new driver each request
                 if self.selenium_mode == "fresh":
                     driver = self._setup_selenium_driver()
-                else:
-                    driver = self.driver
-
-                driver.get(url)
+                    return self._load_with_driver(driver, url, wait_selector)
 
-                if wait_selector:
-                    WebDriverWait(driver, self.wait_time).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
-                    )
-
-                time.sleep(1.5)
-                return BeautifulSoup(driver.page_source, "html.parser")
+                # reuse → 1 driver dùng chung
+                with self._driver_lock:
+                    return self._load_with_driver(self.driver, url, wait_selector)
 
             except Exception as e:
-                print(f"❌ Selenium failed {attempt}: {e}")
+                logger.warning(
+                    f"❌ Selenium failed {attempt}: {e}",
+                    extra={"url": url, "attempt": attempt},
+                )
                 if attempt == retries:
                     raise
 
@@ -152,14 +722,146 @@ class BaseScraper(ABC):
                 if self.selenium_mode == "fresh" and driver:
                     driver.quit()
 
+    def _load_with_driver(
+        self,
+        driver,
+        url: str,
+        wait_selector: Optional[str],
+    ) -> str:
+        timing = self._navigate(driver, url, wait_selector)
+        html = driver.page_source
+        self._record_page_timing(url, html_bytes=len(html), **timing)
+        return html
+
+    def _navigate(
+        self,
+        driver,
+        url: str,
+        wait_selector: Optional[str] = None,
+        wait_until: Optional[Callable] = None,
+    ) -> Dict:
+        """
+        driver.get(url) qua rate limiter của host, đo navigation / wait.
+
+        wait_until(driver): điều kiện chờ riêng thay cho wait_selector (vd.
+        VietnamWorks chờ XHR search). Trả về timing cho _record_page_timing
+        (caller tự thêm html_bytes sau khi lấy nội dung).
+        """
+        limiter = self._limiter(url)
+        limiter.acquire()
+        started = time.monotonic()
+        phase = "navigation"
+
+        try:
+            driver.get(url)
+            navigated = time.monotonic()
+            phase = "wait"
+
+            # Có wait_selector → trả về ngay khi element xuất hiện
+            if wait_selector:
+                WebDriverWait(driver, self.wait_time).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            if wait_until:
+                wait_until(driver)
+        except Exception as e:
+            # Timeout / lỗi load → coi như host đang quá tải
+            limiter.record(None, time.monotonic() - started, error=True)
+            self.telemetry.error(self.PLATFORM, phase, e)
+            raise
+
+        finished = time.monotonic()
+
+        # Selenium không có status code → chỉ dựa vào latency
+        limiter.record(None, finished - started)
+
+        return {
+            "navigation": navigated - started,
+            "wait": finished - navigated,
+            "transfer_bytes": self._transfer_bytes(driver),
+        }
+
+    def _transfer_bytes(self, driver) -> Optional[int]:
+        """Tổng bytes qua mạng của trang hiện tại (Resource Timing API)."""
+        try:
+            return driver.execute_script(
+                "return performance.getEntriesByType('navigation')"
+                ".concat(performance.getEntriesByType('resource'))"
+                ".reduce((sum, e) => sum + (e.transferSize || 0), 0);"
+            )
+        except Exception:
+            return None
+
+    def _record_page_timing(self, url: str, **timing):
+        timing["url"] = url
+        timing["total"] = timing["navigation"] + timing["wait"]
+        with self._timings_lock:
+            self.page_timings.append(timing)
+
+        telemetry = self.telemetry
+        telemetry.observe(self.PLATFORM, "navigation", timing["navigation"])
+        telemetry.observe(self.PLATFORM, "wait", timing["wait"])
+        telemetry.incr(self.PLATFORM, "requests")
+        telemetry.incr(self.PLATFORM, "bytes_html", timing["html_bytes"])
+        if timing["transfer_bytes"]:
+            telemetry.incr(self.PLATFORM, "bytes_transferred", timing["transfer_bytes"])
+
+    def timing_summary(self) -> Dict:
+        """Thống kê timing các trang Selenium đã load (theo profile hiện tại)."""
+        with self._timings_lock:
+            timings = list(self.page_timings)
+
+        summary = {"profile": self.browser_profile, "pages": len(timings)}
+        if not timings:
+            return summary
+
+        def pct(values, q):
+            values = sorted(values)
+            return round(values[min(len(values) - 1, int(q * len(values)))], 3)
+
+        for key in ("navigation", "wait", "total"):
+            values = [t[key] for t in timings]
+            summary[key] = {
+                "avg": round(sum(values) / len(values), 3),
+                "p50": pct(values, 0.5),
+                "p95": pct(values, 0.95),
+            }
+
+        transfer = [
+            t["transfer_bytes"] for t in timings if t["transfer_bytes"] is not None
+        ]
+        if transfer:
+            summary["avg_transfer_bytes"] = int(sum(transfer) / len(transfer))
+        summary["avg_html_bytes"] = int(
+            sum(t["html_bytes"] for t in timings) / len(timings)
+        )
+
+        return summary
+
     # ============================================================
     # Cleanup
     # ============================================================
     def close(self):
-        if self.use_selenium and self.selenium_mode == "reuse":
-            if hasattr(self, "driver"):
-                self.driver.quit()
-                print("🔒 Selenium driver closed.")
+        if self.driver is not None:
+            self.driver.quit()
+            logger.info("🔒 Selenium driver closed.")
+
+        if self.driver_pool is not None:
+            self.driver_pool.close()
+
+        if self.fetch_mode == "auto":
+            logger.info(f"🔀 Fetch backends: {self.fetch_router.snapshot()}")
+
+        if self.cache is not None:
+            logger.info(f"💾 Cache stats: {self.cache.stats()}")
+
+        if self.archive is not None:
+            logger.info(f"🗄️ Archive stats: {self.archive.stats()}")
+
+        logger.info(f"🚦 Rate limiter: {self.rate_limiter.snapshot()}")
+
+        if self.page_timings:
+            logger.info(f"⏱️ Page timings ({self.base_url}): {self.timing_summary()}")
 
     # ============================================================
     # ABSTRACT METHODS
@@ -171,3 +873,14 @@ class BaseScraper(ABC):
     @abstractmethod
     def scrape_job_detail(self, job_url: str) -> Dict:
         pass
+
+    # ============================================================
+    # PARSE-ONLY (không fetch) — dùng cho async / offline
+    # ============================================================
+    @abstractmethod
+    def parse_job_list(self, soup: BeautifulSoup) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def parse_job_detail(self, soup: BeautifulSoup, job_url: str) -> Dict:
+        pass
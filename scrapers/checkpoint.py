@@ -0,0 +1,79 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCheckpoint:
+    """
+    Trạng thái crawl của 1 (platform, category URL), ghi atomic ra JSON.
+
+    - page: list page kế tiếp cần fetch
+    - collected: số job đã ghi ra raw file
+    - in_flight: job (job_list_item) đã lấy từ list page nhưng chưa ghi
+    - done: crawl đã chạy xong
+    """
+
+    def __init__(
+        self,
+        platform_name: str,
+        base_url: str,
+        directory: str = "raw_data/checkpoints",
+    ):
+        self.platform_name = platform_name
+        self.base_url = base_url
+
+        key = hashlib.sha1(base_url.encode("utf-8")).hexdigest()[:10]
+        self.path = os.path.join(directory, f"{platform_name}-{key}.json")
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Checkpoint hỏng, bỏ qua: {self.path} ({e})")
+            return None
+
+    def save(
+        self,
+        page: int,
+        collected: int,
+        in_flight: List[Dict],
+        done: bool = False,
+    ):
+        state = {
+            "platform": self.platform_name,
+            "base_url": self.base_url,
+            "page": page,
+            "collected": collected,
+            "in_flight": in_flight,
+            "done": done,
+            "updated_at": int(time.time()),
+        }
+
+        # Ghi file tạm rồi os.replace → không bao giờ để lại checkpoint dở dang
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def resume_state(self) -> Optional[Dict]:
+        """State để resume, None nếu không có hoặc crawl trước đã xong."""
+        state = self.load()
+        if not state or state.get("done"):
+            return None
+        return state
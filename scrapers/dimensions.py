@@ -0,0 +1,396 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# ============================================================
+# Bảng dimension: (code, label, [regex alias trên text đã fold])
+#
+# Thứ tự trong bảng = độ ưu tiên khi 1 text khớp nhiều dòng
+# (city: nơi nhắc đến trước; role: cụ thể hơn thắng; seniority: cao hơn thắng).
+# Code 0 = không xác định. Code đã phát hành thì không đổi / không tái sử dụng.
+# ============================================================
+
+UNKNOWN = 0
+REMOTE = 98
+
+CITIES: List[Tuple[int, str, List[str]]] = [
+    (1, "Hà Nội", [r"ha noi", r"hanoi", r"hn"]),
+    (
+        2,
+        "Hồ Chí Minh",
+        [r"ho chi minh", r"hochiminh", r"tp\.? ?hcm", r"hcm", r"sai gon", r"saigon"],
+    ),
+    (3, "Đà Nẵng", [r"da nang", r"danang"]),
+    (4, "Hải Phòng", [r"hai phong", r"haiphong"]),
+    (5, "Cần Thơ", [r"can tho", r"cantho"]),
+    (6, "Bình Dương", [r"binh duong", r"thu dau mot"]),
+    (7, "Đồng Nai", [r"dong nai", r"bien hoa"]),
+    (8, "Bắc Ninh", [r"bac ninh"]),
+    (9, "Hưng Yên", [r"hung yen"]),
+    (10, "Hải Dương", [r"hai duong"]),
+    (11, "Quảng Ninh", [r"quang ninh", r"ha long"]),
+    (12, "Khánh Hòa", [r"khanh hoa", r"nha trang"]),
+    (13, "Huế", [r"thua thien hue", r"hue"]),
+    (14, "Bà Rịa - Vũng Tàu", [r"ba ria", r"vung tau"]),
+    (15, "Long An", [r"long an"]),
+    (16, "Nghệ An", [r"nghe an"]),
+    (17, "Thái Nguyên", [r"thai nguyen"]),
+    (18, "Vĩnh Phúc", [r"vinh phuc"]),
+    (19, "Bắc Giang", [r"bac giang"]),
+    (20, "Đắk Lắk", [r"dak lak", r"daklak", r"buon ma thuot"]),
+    (21, "Lâm Đồng", [r"lam dong", r"da lat", r"dalat"]),
+    (22, "Bình Định", [r"binh dinh", r"quy nhon"]),
+    (23, "Quảng Nam", [r"quang nam", r"hoi an"]),
+    (REMOTE, "Remote", [r"remote", r"lam viec tu xa", r"work from home", r"wfh"]),
+    (
+        99,
+        "Nước ngoài",
+        [r"nuoc ngoai", r"overseas", r"nhat ban", r"japan", r"singapore", r"han quoc"],
+    ),
+]
+
+_DEV = r"(?:developer|dev|engineer|programmer|lap trinh vien|team lead(?:er)?|lead)"
+_BACKEND_LANG = (
+    r"(?:java|\.net|dot ?net|golang|go|php|python|ruby|node ?\.?js|nest ?js|c#|c\+\+)"
+)
+
+ROLES: List[Tuple[int, str, List[str]]] = [
+    (3, "Fullstack", [r"full ?-?stack"]),
+    (
+        4,
+        "Mobile",
+        [
+            r"mobile",
+            r"android",
+            r"ios",
+            r"flutter",
+            r"react native",
+            r"kotlin",
+            r"swift",
+        ],
+    ),
+    (
+        2,
+        "Frontend",
+        [
+            r"front ?-?end",
+            r"reactjs",
+            rf"react {_DEV}",
+            r"angular",
+            r"vue ?js",
+            r"ui dev",
+        ],
+    ),
+    (
+        1,
+        "Backend",
+        [
+            r"back ?-?end",
+            r"server ?-?side",
+            rf"{_BACKEND_LANG} ?{_DEV}",
+        ],
+    ),
+    (
+        5,
+        "DevOps / Cloud",
+        [r"devops", r"devsecops", r"sre", r"site reliability", r"cloud", r"aws"],
+    ),
+    (
+        6,
+        "Data / AI",
+        [
+            r"data(?:ops)?",
+            r"du lieu",
+            r"machine learning",
+            r"ml",
+            r"ai",
+            r"deep learning",
+            r"bi",
+            r"business intelligence",
+            r"nlp",
+            r"computer vision",
+            r"llm",
+            r"database",
+            r"dba",
+            r"co so du lieu",
+        ],
+    ),
+    (
+        7,
+        "QA / Tester",
+        [
+            r"qa",
+            r"qc",
+            r"test(?:er|ing)?",
+            r"kiem thu",
+            r"quality assurance",
+            r"quality engineer",
+        ],
+    ),
+    (
+        8,
+        "Security",
+        [r"security", r"bao mat", r"pentest", r"penetration", r"cyber ?security"],
+    ),
+    (
+        9,
+        "Embedded / Hardware",
+        [r"embedded", r"firmware", r"nhung", r"hardware", r"iot", r"fpga", r"pcb"],
+    ),
+    (10, "Game", [r"game", r"unity", r"unreal"]),
+    (
+        11,
+        "BA / PM / Product",
+        [
+            r"business analyst",
+            r"ba",
+            r"product owner",
+            r"product manager",
+            r"project manager",
+            r"pm",
+            r"po",
+            r"scrum master",
+            r"quan ly du an",
+            r"brse",
+            r"bridge",
+            r"(?:system|business) analyst",
+        ],
+    ),
+    (16, "Architect", [r"architect(?:ure)?", r"kien truc"]),
+    (
+        17,
+        "ERP / Consultant",
+        [r"erp", r"sap", r"odoo", r"salesforce", r"dynamics", r"crm", r"consultant"],
+    ),
+    (12, "Design", [r"ui ?/ ?ux", r"ux", r"designer", r"thiet ke", r"graphic"]),
+    (
+        13,
+        "Network / System",
+        [
+            r"network",
+            r"system admin",
+            r"sysadmin",
+            r"system engineer",
+            r"quan tri he thong",
+            r"(?:ky su|quan tri|ha tang) mang",
+        ],
+    ),
+    (
+        14,
+        "IT Support",
+        [
+            r"helpdesk",
+            r"help desk",
+            r"it support",
+            r"technical support",
+            r"ho tro ky thuat",
+            r"application support",
+            r"ho tro ung dung",
+        ],
+    ),
+    (
+        15,
+        "Software (general)",
+        [
+            r"software",
+            r"developer",
+            r"programmer",
+            r"lap trinh vien",
+            r"ky su phan mem",
+        ],
+    ),
+    (
+        18,
+        "Engineering Management",
+        [
+            r"(?:engineering|it|delivery) manager",
+            r"director",
+            r"head of",
+            r"cto",
+            r"chief technology officer",
+        ],
+    ),
+]
+
+SENIORITIES: List[Tuple[int, str, List[str]]] = [
+    (
+        7,
+        "Director / Head",
+        [
+            r"director",
+            r"head of",
+            r"vice president",
+            r"vp",
+            r"cto",
+            r"cio",
+            r"chief \w+ officer",
+            r"giam doc",
+        ],
+    ),
+    (
+        6,
+        "Lead / Manager",
+        [
+            r"lead(?:er)?",
+            r"principal",
+            r"staff engineer",
+            r"architect",
+            r"manager",
+            r"truong nhom",
+            r"truong phong",
+            r"quan ly",
+        ],
+    ),
+    (5, "Senior", [r"senior", r"sr\.?", r"cao cap", r"chuyen gia", r"expert"]),
+    (4, "Middle", [r"middle", r"mid-?level", r"mid"]),
+    (3, "Junior", [r"junior", r"jr\.?"]),
+    (
+        2,
+        "Fresher",
+        [
+            r"fresher",
+            r"entry level",
+            r"graduate",
+            r"moi tot nghiep",
+            r"khong yeu cau kinh nghiem",
+            r"chua co kinh nghiem",
+        ],
+    ),
+    (1, "Intern", [r"intern(?:ship)?", r"thuc tap(?: sinh)?", r"trainee"]),
+]
+
+# "3 năm", "5+ years", "5 YOE", "dưới 1 năm" (text đã fold)
+YEARS_RE = re.compile(
+    r"(?P<under>duoi|under|<)?\s*(?P<years>\d+(?:[.,]\d+)?)\s*\+?\s*"
+    r"(?:nam|years?|yrs?|yoe)(?!\w)"
+)
+
+# Số năm kinh nghiệm tối thiểu → seniority (khi title không nói rõ)
+YEARS_TO_SENIORITY = ((1, 2), (2, 3), (4, 4), (float("inf"), 5))
+
+
+# ============================================================
+# Fold + regex gộp
+# ============================================================
+
+
+def fold_text(text: str) -> str:
+    """lowercase + bỏ dấu tiếng Việt (Hồ Chí Minh → ho chi minh)."""
+    text = unicodedata.normalize("NFKD", text.lower().replace("đ", "d"))
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def _compile(table: List[Tuple[int, str, List[str]]]) -> Pattern:
+    """
+    1 regex / dimension: (?<!\\w)(?:(?P<d_1>alias|...)|(?P<d_2>...))(?!\\w)
+    → lastgroup cho biết dòng nào khớp. Khoảng trắng trong alias khớp cả
+    "-", "_", "." ("ha-noi", "tp.hcm").
+    """
+    groups = []
+    for code, _, aliases in table:
+        alternatives = "|".join(a.replace(" ", r"[\s\-_.]*") for a in aliases)
+        groups.append(f"(?P<d_{code}>{alternatives})")
+    return re.compile(rf"(?<!\w)(?:{'|'.join(groups)})(?!\w)")
+
+
+CITY_RE = _compile(CITIES)
+ROLE_RE = _compile(ROLES)
+SENIORITY_RE = _compile(SENIORITIES)
+
+CITY_LABELS: Dict[int, str] = {UNKNOWN: "Khác", **{c: l for c, l, _ in CITIES}}
+ROLE_LABELS: Dict[int, str] = {UNKNOWN: "Khác", **{c: l for c, l, _ in ROLES}}
+SENIORITY_LABELS: Dict[int, str] = {
+    UNKNOWN: "Không rõ",
+    **{c: l for c, l, _ in SENIORITIES},
+}
+
+# group name → (priority, code)
+_RANKS = {
+    table_re: {f"d_{code}": (rank, code) for rank, (code, _, _) in enumerate(table)}
+    for table_re, table in (
+        (CITY_RE, CITIES),
+        (ROLE_RE, ROLES),
+        (SENIORITY_RE, SENIORITIES),
+    )
+}
+
+
+def _match(pattern: Pattern, folded: str, first: bool = False) -> int:
+    """
+    first=True → dòng được nhắc đến trước (city).
+    first=False → dòng ưu tiên cao nhất trong mọi match (role / seniority).
+    """
+    ranks = _RANKS[pattern]
+    if first:
+        m = pattern.search(folded)
+        return ranks[m.lastgroup][1] if m else UNKNOWN
+
+    best = None
+    for m in pattern.finditer(folded):
+        rank = ranks[m.lastgroup]
+        if best is None or rank < best:
+            best = rank
+    return best[1] if best else UNKNOWN
+
+
+# ============================================================
+# Public API (cache theo text — location / title lặp lại rất nhiều)
+# ============================================================
+
+
+@lru_cache(maxsize=65536)
+def city_code(location: Optional[str]) -> int:
+    if not location:
+        return UNKNOWN
+    return _match(CITY_RE, fold_text(location), first=True)
+
+
+@lru_cache(maxsize=65536)
+def role_code(title: Optional[str]) -> int:
+    if not title:
+        return UNKNOWN
+    return _match(ROLE_RE, fold_text(title))
+
+
+def years_to_seniority(years: float) -> int:
+    for limit, code in YEARS_TO_SENIORITY:
+        if years < limit:
+            return code
+    return UNKNOWN
+
+
+@lru_cache(maxsize=65536)
+def seniority_code(title: Optional[str], experience: Optional[str] = None) -> int:
+    """Title ("Senior", "Thực tập sinh", ...) → nếu không có: số năm kinh nghiệm."""
+    text = fold_text(" | ".join(t for t in (title, experience) if t))
+    code = _match(SENIORITY_RE, text)
+    if code:
+        return code
+
+    m = YEARS_RE.search(text)
+    if m:
+        years = float(m.group("years").replace(",", "."))
+        return years_to_seniority(years - 1 if m.group("under") else years)
+    return UNKNOWN
+
+
+def dimension_codes(job: Dict) -> Dict[str, int]:
+    """Normalized job → {"city", "role", "seniority"} (int)."""
+    location = job.get("location")
+    if isinstance(location, list):
+        location = ", ".join(str(x) for x in location if x)
+
+    experience = job.get("experience")
+    return {
+        "city": city_code(location if isinstance(location, str) else None),
+        "role": role_code(job.get("title")),
+        "seniority": seniority_code(
+            job.get("title"), experience if isinstance(experience, str) else None
+        ),
+    }
+
+
+def dimension_labels() -> Dict[str, Dict[int, str]]:
+    """code → label cho dashboard / báo cáo."""
+    return {"city": CITY_LABELS, "role": ROLE_LABELS, "seniority": SENIORITY_LABELS}
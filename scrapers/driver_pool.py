@@ -0,0 +1,168 @@
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# checkout() chờ tối đa bấy nhiêu giây khi mọi driver đều đang được mượn
+CHECKOUT_TIMEOUT = 120
+
+
+class DriverPool:
+    """
+    Pool N Chrome driver đã khởi động sẵn (warm), thread-safe.
+
+    - checkout() / context manager `driver()` để mượn 1 driver
+    - Trước khi trả về pool: reset cookies + storage + về about:blank
+      → mỗi lần fetch vẫn "sạch" như mode "fresh"
+    - Driver crash / không phản hồi → quit, slot để trống (None) và
+      checkout sau tạo driver mới → factory() lỗi không làm pool co lại
+    """
+
+    def __init__(self, factory: Callable, size: int = 3):
+        self.factory = factory
+        self.size = max(1, size)
+
+        self._idle = queue.Queue()
+        self._all: List = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        try:
+            for _ in range(self.size):
+                driver = self.factory()
+                self._all.append(driver)
+                self._idle.put(driver)
+        except Exception:
+            # Driver thứ N không lên → quit N-1 Chrome đã start, tránh leak process
+            logger.error(
+                f"❌ Driver pool init failed after {len(self._all)}/{self.size} drivers"
+            )
+            drivers, self._all = self._all, []
+            for driver in drivers:
+                self._quit(driver)
+            raise
+
+        logger.info(f"🚗 Driver pool ready: {self.size} drivers")
+
+    # ============================================================
+    # Checkout / checkin
+    # ============================================================
+    def checkout(self, timeout: Optional[float] = CHECKOUT_TIMEOUT):
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+
+        try:
+            driver = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No idle driver after {timeout}s (pool size {self.size})"
+            ) from None
+
+        if driver is not None and not self._is_healthy(driver):
+            logger.warning("♻️ Driver unhealthy → recycle")
+            self._discard(driver)
+            driver = None
+
+        if driver is None:
+            try:
+                driver = self._create()
+            except Exception:
+                # Trả slot lại → lần checkout sau tạo lại, pool không bị co
+                self._idle.put(None)
+                raise
+
+        return driver
+
+    def checkin(self, driver, broken: bool = False):
+        if self._closed:
+            self._quit(driver)
+            return
+
+        # Không gọi factory() ở đây (checkin chạy trong finally, lỗi sẽ che
+        # exception gốc) → để slot trống, checkout sau tạo driver mới
+        if broken or not self._reset(driver):
+            self._discard(driver)
+            driver = None
+
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = CHECKOUT_TIMEOUT):
+        driver = self.checkout(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            # Lỗi trong lúc dùng → kiểm tra lại trước khi cho mượn tiếp
+            broken = not self._is_healthy(driver)
+            raise
+        finally:
+            self.checkin(driver, broken=broken)
+
+    # ============================================================
+    # Health check / isolation
+    # ============================================================
+    def _is_healthy(self, driver) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver) -> bool:
+        """Xoá cookies + local/session storage giữa các lần fetch."""
+        try:
+            # delete_all_cookies() chỉ xoá cookies của domain hiện tại
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Driver reset failed: {e}")
+            return False
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            if not self._closed:
+                self._all.append(driver)
+                return driver
+
+        # close() chạy trong lúc đang tạo → không để lọt Chrome process
+        self._quit(driver)
+        raise RuntimeError("DriverPool is closed")
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    # ============================================================
+    # Cleanup
+    # ============================================================
+    def close(self):
+        self._closed = True
+        with self._lock:
+            drivers, self._all = self._all, []
+
+        for driver in drivers:
+            self._quit(driver)
+
+        logger.info(f"🔒 Driver pool closed ({len(drivers)} drivers).")
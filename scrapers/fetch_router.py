@@ -0,0 +1,106 @@
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+FETCH_MODES = ("requests", "selenium", "auto")
+
+
+def url_pattern(url: str) -> str:
+    """
+    Nhóm URL cùng kiểu trang (bỏ query, segment có số → *).
+
+    https://itviec.com/it-jobs?page=2               → itviec.com/it-jobs
+    https://itviec.com/it-jobs/python-dev-1234      → itviec.com/it-jobs/*
+    https://www.vietnamworks.com/backend-dev-123-jv → www.vietnamworks.com/*
+    """
+    parts = urlparse(url)
+    segments = [s for s in parts.path.split("/") if s]
+
+    head = ""
+    if segments:
+        head = "*" if any(c.isdigit() for c in segments[0]) else segments[0]
+
+    pattern = f"{parts.netloc}/{head}"
+    if len(segments) > 1:
+        pattern += "/*"
+    return pattern
+
+
+class FetchRouter:
+    """
+    Chọn backend (requests / selenium) cho từng URL pattern ở fetch_mode="auto".
+
+    - Mặc định thử requests trước
+    - Trong `window` lần thử gần nhất, requests thiếu nội dung ≥ fail_ratio
+      (và ít nhất min_failures lần) → pattern đó đi thẳng Selenium
+    - Cứ probe_every trang Selenium lại thử requests 1 lần; thành công
+      → quay về requests (site đổi sang server-render, hết chặn bot, ...)
+    """
+
+    def __init__(
+        self,
+        window: int = 10,
+        min_failures: int = 2,
+        fail_ratio: float = 0.5,
+        probe_every: int = 25,
+    ):
+        self.window = window
+        self.min_failures = min_failures
+        self.fail_ratio = fail_ratio
+        self.probe_every = probe_every
+
+        self._lock = threading.Lock()
+        self._recent: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self._totals: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"requests_ok": 0, "requests_failed": 0, "selenium": 0}
+        )
+
+    def _prefers_browser(self, pattern: str) -> bool:
+        recent = self._recent[pattern]
+        failures = recent.count(False)
+        return (
+            failures >= self.min_failures and failures / len(recent) >= self.fail_ratio
+        )
+
+    @staticmethod
+    def _key(url: str, kind: Optional[str]) -> str:
+        # List và detail có thể trùng pattern nhưng render khác nhau
+        pattern = url_pattern(url)
+        return f"{kind}:{pattern}" if kind else pattern
+
+    def choose(self, url: str, kind: Optional[str] = None) -> str:
+        pattern = self._key(url, kind)
+        with self._lock:
+            if not self._prefers_browser(pattern):
+                return "requests"
+
+            totals = self._totals[pattern]
+            totals["selenium"] += 1
+            if totals["selenium"] % self.probe_every == 0:
+                return "requests"
+            return "selenium"
+
+    def record(self, url: str, ok: bool, kind: Optional[str] = None):
+        """Kết quả của 1 lần thử requests (ok = có đủ nội dung cần parse)."""
+        pattern = self._key(url, kind)
+        with self._lock:
+            if ok and self._prefers_browser(pattern):
+                # Probe thành công → bỏ lịch sử cũ, dùng lại requests
+                self._recent[pattern].clear()
+            self._recent[pattern].append(ok)
+
+            key = "requests_ok" if ok else "requests_failed"
+            self._totals[pattern][key] += 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                pattern: {
+                    "backend": (
+                        "selenium" if self._prefers_browser(pattern) else "requests"
+                    ),
+                    **totals,
+                }
+                for pattern, totals in self._totals.items()
+            }
@@ -0,0 +1,526 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from urllib.parse import urlparse
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    and_,
+    create_engine,
+    event,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+logger = logging.getLogger(__name__)
+
+# Trạng thái task
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+# Detail trước list → job của page đã lấy được xong trước khi phân trang tiếp
+PRIORITY = {"detail": 1, "list": 0}
+
+metadata = MetaData()
+
+tasks = Table(
+    "frontier_tasks",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("platform", String(32), nullable=False),
+    Column("kind", String(16), nullable=False),
+    Column("url", Text, nullable=False),
+    Column("host", String(255), nullable=False),
+    Column("payload", Text),
+    Column("priority", Integer, nullable=False, default=0),
+    Column("status", String(16), nullable=False, default=PENDING),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("available_at", Float, nullable=False, default=0.0),
+    Column("lease_owner", String(128)),
+    Column("lease_token", String(32)),
+    Column("lease_expires", Float),
+    Column("last_error", Text),
+    Column("created_at", Float, nullable=False),
+    Column("updated_at", Float, nullable=False),
+    UniqueConstraint("platform", "kind", "url", name="uq_frontier_task"),
+    Index("idx_frontier_ready", "status", "priority", "id"),
+)
+
+hosts = Table(
+    "frontier_hosts",
+    metadata,
+    Column("host", String(255), primary_key=True),
+    Column("min_interval", Float, nullable=False),
+    Column("next_allowed_at", Float, nullable=False, default=0.0),
+)
+
+results = Table(
+    "frontier_results",
+    metadata,
+    # 1 task → tối đa 1 result (exactly once)
+    Column("task_id", Integer, primary_key=True),
+    Column("platform", String(32), nullable=False),
+    Column("url", Text, nullable=False),
+    Column("record", Text, nullable=False),
+    Column("created_at", Float, nullable=False),
+    Column("exported_at", Float),
+    Index("idx_frontier_results_export", "platform", "exported_at"),
+)
+
+
+class NewTask(NamedTuple):
+    platform: str
+    kind: str  # "list" / "detail"
+    url: str
+    payload: Optional[dict] = None
+
+
+class Task(NamedTuple):
+    id: int
+    platform: str
+    kind: str
+    url: str
+    payload: dict
+    attempts: int
+    lease_token: str
+
+
+class Frontier:
+    """
+    URL frontier dùng chung giữa nhiều worker / nhiều máy (SQLAlchemy Core).
+
+    - SQLite (1 máy, nhiều process) hoặc Postgres (nhiều node):
+      sqlite:///raw_data/frontier.sqlite, postgresql://user:pw@host/db
+    - lease(): mượn task trong lease_seconds; worker chết → hết hạn →
+      worker khác lease lại (attempts += 1, quá max_attempts → failed)
+    - complete(): ghi result + task con + đánh dấu done trong CÙNG 1
+      transaction, chỉ khi lease_token còn khớp → mỗi task xong đúng 1 lần
+    - Politeness: mỗi host chỉ được lease 1 task / min_interval giây
+      (tính chung cho mọi worker)
+    - heartbeat(): gia hạn lease trong lúc task chạy (Selenium detail có thể
+      lâu hơn lease_seconds) → không bị lease lại cho worker thứ 2
+    """
+
+    def __init__(
+        self,
+        url: str = "sqlite:///raw_data/frontier.sqlite",
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        host_interval: float = 1.0,
+        host_intervals: Optional[Dict[str, float]] = None,
+        retry_backoff: float = 30.0,
+    ):
+        self.url = url
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.host_interval = host_interval
+        self.host_intervals = host_intervals or {}
+        self.retry_backoff = retry_backoff
+
+        connect_args = {"timeout": 30} if url.startswith("sqlite") else {}
+        self.engine = create_engine(url, future=True, connect_args=connect_args)
+
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _sqlite_pragmas)
+
+        metadata.create_all(self.engine)
+
+    # ============================================================
+    # Enqueue
+    # ============================================================
+    def enqueue(self, new_tasks: Iterable[NewTask]) -> int:
+        """Thêm task (trùng platform + kind + url → bỏ qua). Trả về số task mới."""
+        with self.engine.begin() as conn:
+            return self._enqueue(conn, list(new_tasks), time.time())
+
+    def _enqueue(self, conn, new_tasks: List[NewTask], now: float) -> int:
+        added = 0
+        for task in new_tasks:
+            host = urlparse(task.url).netloc
+            self._insert_ignore(
+                conn,
+                hosts,
+                {
+                    "host": host,
+                    "min_interval": self.host_intervals.get(host, self.host_interval),
+                    "next_allowed_at": 0.0,
+                },
+            )
+            added += self._insert_ignore(
+                conn,
+                tasks,
+                {
+                    "platform": task.platform,
+                    "kind": task.kind,
+                    "url": task.url,
+                    "host": host,
+                    "payload": json.dumps(task.payload or {}, ensure_ascii=False),
+                    "priority": PRIORITY.get(task.kind, 0),
+                    "status": PENDING,
+                    "attempts": 0,
+                    "available_at": 0.0,
+                    "created_at": now,
+                    "updated_at": now,
+                },
+            )
+        return added
+
+    def _insert_ignore(self, conn, table: Table, row: dict) -> int:
+        dialect = conn.dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite.insert(table).values(**row).on_conflict_do_nothing()
+        elif dialect == "postgresql":
+            stmt = postgresql.insert(table).values(**row).on_conflict_do_nothing()
+        else:
+            raise ValueError(f"Unsupported frontier backend: {dialect}")
+        return conn.execute(stmt).rowcount
+
+    # ============================================================
+    # Lease
+    # ============================================================
+    def lease(
+        self,
+        worker_id: str,
+        kinds: Optional[Sequence[str]] = None,
+        platforms: Optional[Sequence[str]] = None,
+        scan: int = 20,
+    ) -> Optional[Task]:
+        """
+        Mượn 1 task sẵn sàng (pending, hoặc leased nhưng đã hết hạn) mà host
+        đang được phép request. None → hiện chưa có task nào lấy được.
+        """
+        now = time.time()
+        self._reap_expired(now)
+
+        ready = or_(
+            and_(tasks.c.status == PENDING, tasks.c.available_at <= now),
+            and_(tasks.c.status == LEASED, tasks.c.lease_expires < now),
+        )
+        busy_hosts = select(hosts.c.host).where(hosts.c.next_allowed_at > now)
+        query = (
+            select(tasks.c.id, tasks.c.host)
+            .where(ready, tasks.c.host.not_in(busy_hosts))
+            .order_by(tasks.c.priority.desc(), tasks.c.id)
+            .limit(scan)
+        )
+        if kinds:
+            query = query.where(tasks.c.kind.in_(list(kinds)))
+        if platforms:
+            query = query.where(tasks.c.platform.in_(list(platforms)))
+
+        with self.engine.connect() as conn:
+            candidates = conn.execute(query).all()
+
+        tried_hosts = set()
+        for task_id, host in candidates:
+            if host in tried_hosts:
+                continue
+            tried_hosts.add(host)
+
+            task = self._claim(task_id, host, worker_id, ready, time.time())
+            if task is not None:
+                return task
+
+        return None
+
+    def _claim(self, task_id, host, worker_id, ready, now) -> Optional[Task]:
+        """Compare-and-set: host còn rảnh và task còn ready → lease."""
+        token = uuid.uuid4().hex
+
+        with self.engine.begin() as conn:
+            slot = conn.execute(
+                hosts.update()
+                .where(hosts.c.host == host, hosts.c.next_allowed_at <= now)
+                .values(next_allowed_at=now + hosts.c.min_interval)
+            )
+            if slot.rowcount != 1:
+                return None
+
+            claimed = conn.execute(
+                tasks.update()
+                .where(tasks.c.id == task_id, ready)
+                .values(
+                    status=LEASED,
+                    attempts=tasks.c.attempts + 1,
+                    lease_owner=worker_id,
+                    lease_token=token,
+                    lease_expires=now + self.lease_seconds,
+                    updated_at=now,
+                )
+            )
+            if claimed.rowcount != 1:
+                # Worker khác lấy mất → trả lại slot của host
+                conn.execute(
+                    hosts.update()
+                    .where(hosts.c.host == host)
+                    .values(next_allowed_at=now)
+                )
+                return None
+
+            row = conn.execute(
+                select(
+                    tasks.c.id,
+                    tasks.c.platform,
+                    tasks.c.kind,
+                    tasks.c.url,
+                    tasks.c.payload,
+                    tasks.c.attempts,
+                ).where(tasks.c.id == task_id)
+            ).one()
+
+        return Task(
+            row.id,
+            row.platform,
+            row.kind,
+            row.url,
+            json.loads(row.payload or "{}"),
+            row.attempts,
+            token,
+        )
+
+    def _reap_expired(self, now: float):
+        """Lease hết hạn và đã dùng hết attempts → failed (không lease lại nữa)."""
+        with self.engine.begin() as conn:
+            reaped = conn.execute(
+                tasks.update()
+                .where(
+                    tasks.c.status == LEASED,
+                    tasks.c.lease_expires < now,
+                    tasks.c.attempts >= self.max_attempts,
+                )
+                .values(
+                    status=FAILED,
+                    last_error="lease expired",
+                    lease_token=None,
+                    updated_at=now,
+                )
+            ).rowcount
+        if reaped:
+            logger.warning(f"💀 {reaped} task hết lease quá {self.max_attempts} lần")
+
+    # ============================================================
+    # Ack / nack
+    # ============================================================
+    def complete(
+        self,
+        task: Task,
+        record: Optional[dict] = None,
+        children: Sequence[NewTask] = (),
+        next_page: Optional[NewTask] = None,
+    ) -> bool:
+        """
+        Ack task: ghi record vào sink + thêm task con trong 1 transaction.
+
+        next_page chỉ được thêm khi children có ít nhất 1 task mới
+        (page toàn job đã có trong frontier → dừng phân trang).
+        False → lease đã mất (hết hạn và worker khác đã lấy), không ghi gì.
+        """
+        now = time.time()
+
+        with self.engine.begin() as conn:
+            done = conn.execute(
+                tasks.update()
+                .where(
+                    tasks.c.id == task.id,
+                    tasks.c.status == LEASED,
+                    tasks.c.lease_token == task.lease_token,
+                )
+                .values(
+                    status=DONE,
+                    lease_token=None,
+                    lease_expires=None,
+                    last_error=None,
+                    updated_at=now,
+                )
+            )
+            if done.rowcount != 1:
+                logger.warning(
+                    f"⚠️ Lease lost, bỏ kết quả task {task.id}",
+                    extra={"platform": task.platform, "url": task.url},
+                )
+                return False
+
+            if record is not None:
+                conn.execute(
+                    results.insert().values(
+                        task_id=task.id,
+                        platform=task.platform,
+                        url=task.url,
+                        record=json.dumps(record, ensure_ascii=False),
+                        created_at=now,
+                    )
+                )
+
+            added = self._enqueue(conn, list(children), now)
+            if next_page is not None and added:
+                self._enqueue(conn, [next_page], now)
+
+        return True
+
+    def fail(self, task: Task, error: str, retry: bool = True) -> bool:
+        """
+        Nack: trả task về pending sau backoff (attempts còn) hoặc → failed.
+        False → lease đã mất.
+        """
+        now = time.time()
+        exhausted = not retry or task.attempts >= self.max_attempts
+        values = {
+            "lease_token": None,
+            "lease_expires": None,
+            "last_error": error[:2000],
+            "updated_at": now,
+        }
+        if exhausted:
+            values["status"] = FAILED
+        else:
+            values["status"] = PENDING
+            values["available_at"] = now + self.retry_backoff * 2 ** (task.attempts - 1)
+
+        with self.engine.begin() as conn:
+            updated = conn.execute(
+                tasks.update()
+                .where(
+                    tasks.c.id == task.id,
+                    tasks.c.status == LEASED,
+                    tasks.c.lease_token == task.lease_token,
+                )
+                .values(**values)
+            )
+        return updated.rowcount == 1
+
+    def extend(self, task: Task, seconds: Optional[float] = None) -> bool:
+        """Gia hạn lease cho task chạy lâu (heartbeat)."""
+        with self.engine.begin() as conn:
+            updated = conn.execute(
+                tasks.update()
+                .where(
+                    tasks.c.id == task.id,
+                    tasks.c.status == LEASED,
+                    tasks.c.lease_token == task.lease_token,
+                )
+                .values(lease_expires=time.time() + (seconds or self.lease_seconds))
+            )
+        return updated.rowcount == 1
+
+    @contextmanager
+    def heartbeat(self, task: Task, interval: Optional[float] = None):
+        """
+        Thread nền gọi extend() mỗi interval giây (mặc định lease_seconds / 3)
+        tới khi khối with kết thúc. extend() False → lease đã mất, dừng gia hạn
+        (complete() sau đó sẽ trả về False).
+        """
+        interval = interval or self.lease_seconds / 3
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(interval):
+                try:
+                    if not self.extend(task):
+                        if stop.is_set():
+                            return  # complete() vừa chạy xong
+                        logger.warning(
+                            f"⚠️ Lease lost khi đang chạy task {task.id}",
+                            extra={"platform": task.platform, "url": task.url},
+                        )
+                        return
+                except Exception as e:
+                    # DB tạm lỗi → thử lại ở nhịp sau (lease vẫn còn hạn)
+                    logger.warning(f"⚠️ Heartbeat task {task.id} lỗi: {e}")
+
+        thread = threading.Thread(
+            target=beat, name=f"frontier-heartbeat-{task.id}", daemon=True
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    # ============================================================
+    # Sink / stats
+    # ============================================================
+    def iter_results(
+        self,
+        platform: Optional[str] = None,
+        unexported_only: bool = True,
+        batch_size: int = 500,
+    ) -> Iterator[tuple]:
+        """(task_id, record) theo thứ tự task_id."""
+        last_id = 0
+        while True:
+            query = (
+                select(results.c.task_id, results.c.record)
+                .where(results.c.task_id > last_id)
+                .order_by(results.c.task_id)
+                .limit(batch_size)
+            )
+            if platform:
+                query = query.where(results.c.platform == platform)
+            if unexported_only:
+                query = query.where(results.c.exported_at.is_(None))
+
+            with self.engine.connect() as conn:
+                rows = conn.execute(query).all()
+            if not rows:
+                return
+
+            for task_id, record in rows:
+                yield task_id, json.loads(record)
+            last_id = rows[-1].task_id
+
+    def mark_exported(self, task_ids: Sequence[int]):
+        now = time.time()
+        ids = list(task_ids)
+        with self.engine.begin() as conn:
+            for i in range(0, len(ids), 500):
+                conn.execute(
+                    results.update()
+                    .where(results.c.task_id.in_(ids[i : i + 500]))
+                    .values(exported_at=now)
+                )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """platform → {kind:status → số task}."""
+        query = select(
+            tasks.c.platform, tasks.c.kind, tasks.c.status, func.count()
+        ).group_by(tasks.c.platform, tasks.c.kind, tasks.c.status)
+
+        out: Dict[str, Dict[str, int]] = {}
+        with self.engine.connect() as conn:
+            for platform, kind, status, n in conn.execute(query):
+                out.setdefault(platform, {})[f"{kind}:{status}"] = n
+        return out
+
+    def unfinished(self) -> int:
+        """Số task chưa xong (pending + leased)."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(func.count()).where(tasks.c.status.in_([PENDING, LEASED]))
+            ).scalar_one()
+
+    def close(self):
+        self.engine.dispose()
+
+
+def _sqlite_pragmas(dbapi_conn, _):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
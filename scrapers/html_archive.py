@@ -0,0 +1,144 @@
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator, NamedTuple, Optional
+
+
+class ArchivedPage(NamedTuple):
+    url: str
+    platform: str
+    kind: str
+    sha256: str
+    fetched_at: float
+
+
+class HtmlArchive:
+    """
+    Archive HTML đã fetch, content-addressed (sha256 của nội dung).
+
+    - Blob: <root>/blobs/ab/abcdef....gz (gzip), trùng nội dung → lưu 1 lần
+    - Index SQLite: (url, sha256) → platform, kind, fetched_at
+      kind: "list" / "detail" / "list_payload" (JSON XHR của VietnamWorks)
+    - Dùng chung được giữa nhiều process (WAL + ghi blob atomic)
+    """
+
+    def __init__(self, root: str = "archive", compress_level: int = 6):
+        self.root = root
+        self.compress_level = compress_level
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(root, "index.sqlite"), check_same_thread=False, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (url, sha256)
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_kind ON pages (platform, kind, fetched_at)"
+        )
+        self._conn.commit()
+
+    # ============================================================
+    # Write
+    # ============================================================
+    def put(self, url: str, content: str, platform: str, kind: str) -> str:
+        """
+        Lưu 1 trang, trả về sha256.
+        Cùng URL + cùng nội dung → cập nhật fetched_at (nội dung A → B → A thì
+        bản mới nhất là A, không phải B).
+        """
+        data = content.encode("utf-8")
+        sha = hashlib.sha256(data).hexdigest()
+
+        path = blob_path(self.root, sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(data, self.compress_level))
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO pages (url, sha256, platform, kind, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (url, sha256) DO UPDATE SET fetched_at = excluded.fetched_at
+                """,
+                (url, sha, platform, kind, time.time()),
+            )
+            self._conn.commit()
+
+        return sha
+
+    # ============================================================
+    # Read
+    # ============================================================
+    def get(self, sha256: str) -> str:
+        return read_blob(self.root, sha256)
+
+    def iter_pages(
+        self,
+        platform: Optional[str] = None,
+        kind: Optional[str] = None,
+        latest_only: bool = True,
+    ) -> Iterator[ArchivedPage]:
+        """
+        Các trang trong archive theo thứ tự fetch.
+        latest_only → mỗi (url, kind) chỉ lấy bản fetch mới nhất.
+        """
+        where, params = [], []
+        if platform:
+            where.append("platform = ?")
+            params.append(platform)
+        if kind:
+            where.append("kind = ?")
+            params.append(kind)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+        query = f"SELECT url, platform, kind, sha256, fetched_at FROM pages {clause}"
+        if latest_only:
+            query = f"""
+                SELECT url, platform, kind, sha256, MAX(fetched_at)
+                FROM pages {clause}
+                GROUP BY url, platform, kind
+            """
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        for row in sorted(rows, key=lambda r: r[4]):
+            yield ArchivedPage(*row)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pages, blobs = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT sha256) FROM pages"
+            ).fetchone()
+        return {"pages": pages, "blobs": blobs}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def blob_path(root: str, sha256: str) -> str:
+    return os.path.join(root, "blobs", sha256[:2], f"{sha256}.gz")
+
+
+def read_blob(root: str, sha256: str) -> str:
+    """Đọc blob không cần mở index (dùng trong process con)."""
+    with open(blob_path(root, sha256), "rb") as f:
+        return gzip.decompress(f.read()).decode("utf-8")
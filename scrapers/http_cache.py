@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    backend: str
+
+
+class ResponseCache:
+    """
+    Cache response HTML trên đĩa (SQLite, body nén zlib), có giới hạn dung lượng.
+
+    - Key = URL, xoá theo LRU (accessed_at) khi vượt max_bytes
+    - requests: trong TTL → hit; quá TTL → revalidate bằng ETag / If-Modified-Since
+    - selenium: chỉ TTL (page_source không có header để revalidate)
+    - stats(): hits / misses / revalidated / stores / evictions
+    """
+
+    def __init__(
+        self,
+        path: str = "cache/http_cache.sqlite",
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: Optional[float] = 3600,
+        compress_level: int = 6,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compress_level = compress_level
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                backend TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    # ============================================================
+    # Lookup
+    # ============================================================
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT body, etag, last_modified, fetched_at, backend
+                FROM entries WHERE url = ?
+                """,
+                (url,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+
+        body, etag, last_modified, fetched_at, backend = row
+        html = zlib.decompress(body).decode("utf-8")
+        return CacheEntry(url, html, etag, last_modified, fetched_at, backend)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        if self.ttl is None:
+            return True
+        return time.time() - entry.fetched_at < self.ttl
+
+    # ============================================================
+    # Store
+    # ============================================================
+    def put(
+        self,
+        url: str,
+        html: str,
+        backend: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        body = zlib.compress(html.encode("utf-8"), self.compress_level)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO entries
+                (url, body, size, etag, last_modified, backend, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url, body, len(body), etag, last_modified, backend, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+            self._counters["stores"] += 1
+
+    def touch(self, url: str):
+        """Revalidate OK (304) → coi như vừa fetch lại."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def _evict_locked(self):
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT url, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+
+        evicted = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE url = ?", evicted)
+        self._counters["evictions"] += len(evicted)
+
+    # ============================================================
+    # Stats
+    # ============================================================
+    def record(self, event: str, nbytes: int = 0):
+        """event: hit / miss / revalidated"""
+        with self._lock:
+            self._counters[event] += 1
+            if event in ("hit", "revalidated"):
+                self._counters["bytes_saved"] += nbytes
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            stats = {
+                "hits": self._counters["hit"],
+                "revalidated": self._counters["revalidated"],
+                "misses": self._counters["miss"],
+                "stores": self._counters["stores"],
+                "evictions": self._counters["evictions"],
+                "bytes_saved": self._counters["bytes_saved"],
+                "entries": count,
+                "disk_bytes": size,
+            }
+
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["hits"] + stats["revalidated"]) / lookups, 3)
+            if lookups
+            else 0.0
+        )
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,20 +1,41 @@
 from .base_scraper import BaseScraper
-from typing import List, Dict
-import re
+from .dimensions import REMOTE, UNKNOWN, city_code
+from .salary import salary_records
+from typing import List, Dict, Optional
+import logging
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+logger = logging.getLogger(__name__)
+
 
 class ITviecScraper(BaseScraper):
-    def __init__(self, use_selenium: bool = False):
+    PLATFORM = "itviec"
+    CONTENT_SELECTORS = {
+        "list": "div.job-card",
+        # Block mô tả (server-render) — challenge page / JS shell không có
+        "detail": "section.job-content div.paragraph",
+    }
+    # Trang list sau trang cuối / search không có kết quả
+    EMPTY_MARKERS = {
+        "list": ("We couldn't find jobs matching", "Không tìm thấy việc làm")
+    }
+
+    def __init__(self, use_selenium: bool = False, pool_size: int = 3, **kwargs):
         """
         Args:
             use_selenium: True = dùng Selenium, False = dùng requests
+            pool_size: số Chrome driver warm trong pool (Selenium)
+            **kwargs: option khác của BaseScraper (cache, ...)
         """
         super().__init__(
-            "https://itviec.com", use_selenium=use_selenium, selenium_mode="fresh"
+            "https://itviec.com",
+            use_selenium=use_selenium,
+            selenium_mode="pool",
+            pool_size=pool_size,
+            **kwargs,
         )
 
     def scrape_job_list(self, url: str) -> List[Dict]:
@@ -32,8 +53,11 @@ class ITviecScraper(BaseScraper):
         # search_url = f"{self.base_url}/it-jobs/{keyword}?page={page}"
 
         # Get page HTML
-        soup = self.get_page(url)
+        soup = self.get_page(url, kind="list")
+        with self.timed("extract"):
+            return self.parse_job_list(soup)
 
+    def parse_job_list(self, soup) -> List[Dict]:
         # Find tất cả job cards
         job_cards = soup.select("div.job-card")
 
@@ -53,9 +77,14 @@ class ITviecScraper(BaseScraper):
                 jobs.append(job_data)
 
             except Exception as e:
-                print(f"Error parsing job card: {e}")
+                logger.warning(f"Error parsing job card: {e}")
                 continue
 
+        # Parse salary cả trang 1 lần
+        salaries = salary_records(job["salary"] for job in jobs)
+        for job, salary in zip(jobs, salaries):
+            job["salary"] = salary if salary["raw"] else None
+
         return jobs
 
     def _extract_title(self, card) -> str:
@@ -90,124 +119,31 @@ class ITviecScraper(BaseScraper):
         """
         location_elems = card.select("div.text-rich-grey")
 
-        # Danh sách cities hợp lệ
-        VALID_CITIES = [
-            "Ho Chi Minh",
-            "Ha Noi",
-            "Da Nang",
-            "Can Tho",
-            "Hai Phong",
-            "Binh Duong",
-            "Dong Nai",
-        ]
-
         for elem in location_elems:
             text = elem.text.strip()
 
-            # ✅ CHỈ check cities, KHÔNG check "office"
-            if text in VALID_CITIES:
+            # ✅ CHỈ lấy text là city (bảng dimensions), KHÔNG lấy
+            # work type ("At office", "Remote", "Hybrid")
+            if city_code(text) not in (UNKNOWN, REMOTE):
                 return text
 
         return None
 
-    def _extract_salary(self, card) -> Dict:
+    def _extract_salary(self, card) -> Optional[str]:
         """
-        Extract và parse salary từ job card.
-
-        Các trường hợp xử lý:
-        1. "You'll love it" - Mức lương hấp dẫn
-        2. "Up to $2200" - Mức lương cụ thể
-        3. "Sign in to view salary" - Cần đăng nhập
-        4. Các format khác: "$1500 - $2000", "15-20 triệu", etc.
+        Salary text từ job card, parse theo cả trang trong parse_job_list
+        (scrapers.salary: "You'll love it", "Up to $2200", "Sign in to view
+        salary", "$1500 - $2000", "15-20 triệu", ...).
         """
+        # Cần đăng nhập: có link sign-in dù text hiển thị khác
+        if card.select_one("a.sign-in-view-salary"):
+            return "Sign in to view salary"
 
-        # Tìm phần tử chứa thông tin lương
         salary_div = card.select_one("div.salary")
         if not salary_div:
             return None
 
-        # Lấy toàn bộ text trong salary section
-        salary_text = salary_div.get_text(strip=True)
-
-        # Trường hợp 1: "You'll love it" - Mức lương hấp dẫn
-        if "You'll love it" in salary_text:
-            return {
-                "type": "competitive",
-                "raw": "You'll love it",
-                "description": "Competitive salary with attractive benefits",
-            }
-
-        # Trường hợp 2: "Up to $XXXX" - Mức lương tối đa
-        match_up_to = re.search(r"Up to\s*\$?(\d+[.,]?\d*)", salary_text)
-        if match_up_to:
-            amount = float(match_up_to.group(1).replace(",", ""))
-            return {
-                "type": "up_to",
-                "min": None,
-                "max": amount,
-                "currency": "USD",
-                "raw": salary_text,
-            }
-
-        # Trường hợp 3: "Sign in to view salary" - Cần đăng nhập
-        sign_in_elem = card.select_one("a.sign-in-view-salary")
-        if sign_in_elem or "sign in" in salary_text.lower():
-            return {
-                "type": "login_required",
-                "raw": "Sign in to view salary",
-                "description": "Salary information requires login",
-            }
-
-        # Trường hợp 4: Khoảng lương "$1500 - $2000"
-        match_range_usd = re.search(
-            r"\$?(\d+[.,]?\d*)\s*-\s*\$?(\d+[.,]?\d*)", salary_text
-        )
-        if match_range_usd:
-            min_amount = float(match_range_usd.group(1).replace(",", ""))
-            max_amount = float(match_range_usd.group(2).replace(",", ""))
-            return {
-                "type": "range",
-                "min": min_amount,
-                "max": max_amount,
-                "currency": "USD",
-                "raw": salary_text,
-            }
-
-        # Trường hợp 5: Khoảng lương VND "15-20 triệu"
-        match_range_vnd = re.search(r"(\d+)[-\s]*(\d+)\s*[Tt]ri[eệ]u", salary_text)
-        if match_range_vnd:
-            min_amount = float(match_range_vnd.group(1)) * 1_000_000
-            max_amount = float(match_range_vnd.group(2)) * 1_000_000
-            return {
-                "type": "range",
-                "min": min_amount,
-                "max": max_amount,
-                "currency": "VND",
-                "raw": salary_text,
-                "description": f"{match_range_vnd.group(1)}-{match_range_vnd.group(2)} triệu VND",
-            }
-
-        # Trường hợp 6: Lương cố định "$1500"
-        match_single = re.search(r"\$?(\d+[.,]?\d*)\b", salary_text)
-        if match_single:
-            amount = float(match_single.group(1).replace(",", ""))
-            return {
-                "type": "fixed",
-                "min": amount,
-                "max": amount,
-                "currency": "USD" if "$" in salary_text else "VND",
-                "raw": salary_text,
-            }
-
-        # Trường hợp 7: Text mô tả khác
-        if salary_text and len(salary_text) > 3:
-            return {
-                "type": "descriptive",
-                "raw": salary_text,
-                "description": "Descriptive salary information",
-            }
-
-        return None
+        return salary_div.get_text(strip=True) or None
 
     def _extract_url(self, card) -> str:
         raw_url = card.get("data-search--job-selection-job-url-value")
@@ -240,7 +176,11 @@ class ITviecScraper(BaseScraper):
         return tags
 
     def scrape_job_detail(self, job_url: str) -> Dict:
-        soup = self.get_page(job_url)
+        soup = self.get_page(job_url, kind="detail")
+        with self.timed("extract"):
+            return self.parse_job_detail(soup, job_url)
+
+    def parse_job_detail(self, soup, job_url: str) -> Dict:
         return {
             "description": self._extract_description(soup),
             "requirements": self._extract_requirements(soup),
@@ -392,7 +332,7 @@ class ITviecScraper(BaseScraper):
                     company_info["overtime_policy"] = value
 
         except Exception as e:
-            print(f"Error extracting company info: {e}")
+            logger.warning(f"Error extracting company info: {e}")
 
         return company_info
 
@@ -441,7 +381,7 @@ class ITviecScraper(BaseScraper):
             overview["skills"] = [s.get_text(strip=True) for s in skill_elems]
 
         except Exception as e:
-            print(f"Error extracting job overview: {e}")
+            logger.warning(f"Error extracting job overview: {e}")
 
         return overview
 
@@ -0,0 +1,213 @@
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:  # pyarrow là tuỳ chọn, chỉ cần khi ghi / đọc Parquet
+    pa = None
+
+DATASET_DIR = "processed_data/jobs_parquet"
+PARTITION_COLUMNS = ["platform", "crawl_date"]
+
+# Số job / record batch (và tối đa / row group) khi ghi
+BATCH_ROWS = 50_000
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Cần cài pyarrow để ghi / đọc Parquet dataset")
+
+
+def job_schema() -> "pa.Schema":
+    """
+    1 job / dòng, salary tách thành cột số.
+    description là cột riêng → query không chọn nó thì không đọc byte nào.
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [
+            ("platform", pa.string()),
+            ("crawl_date", pa.string()),
+            ("timestamp", pa.timestamp("s", tz="UTC")),
+            ("title", pa.string()),
+            ("company", pa.string()),
+            ("location", pa.string()),
+            ("experience", pa.string()),
+            ("job_url", pa.string()),
+            ("salary_raw", pa.string()),
+            ("salary_type", pa.string()),
+            ("salary_min", pa.int64()),
+            ("salary_max", pa.int64()),
+            ("salary_avg", pa.int64()),
+            ("salary_currency", pa.string()),
+            ("requirements", pa.list_(pa.string())),
+            ("benefits", pa.list_(pa.string())),
+            ("description", pa.string()),
+        ]
+    )
+
+
+def _partitioning() -> "ds.Partitioning":
+    # Khai báo kiểu rõ ràng → crawl_date không bị đoán thành date / int
+    return ds.partitioning(
+        pa.schema([("platform", pa.string()), ("crawl_date", pa.string())]),
+        flavor="hive",
+    )
+
+
+def crawl_date(timestamp: Optional[int]) -> Optional[str]:
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _text(value) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value if v)
+    return str(value)
+
+
+def to_row(job: Dict) -> Dict:
+    """1 normalized job (JSONL) → 1 dòng theo job_schema()."""
+    salary = job.get("salary") or {}
+    timestamp = job.get("timestamp")
+
+    return {
+        "platform": job.get("platform"),
+        "crawl_date": crawl_date(timestamp),
+        "timestamp": timestamp,
+        "title": _text(job.get("title")),
+        "company": _text(job.get("company")),
+        "location": _text(job.get("location")),
+        "experience": _text(job.get("experience")),
+        "job_url": job.get("job_url"),
+        "salary_raw": _text(salary.get("raw")),
+        "salary_type": salary.get("type"),
+        "salary_min": salary.get("min"),
+        "salary_max": salary.get("max"),
+        "salary_avg": salary.get("avg"),
+        "salary_currency": salary.get("currency"),
+        "requirements": job.get("requirements") or [],
+        "benefits": job.get("benefits") or [],
+        "description": _text(job.get("description")),
+    }
+
+
+def _iter_batches(
+    jobs: Iterable[Dict], schema: "pa.Schema", batch_rows: int
+) -> Iterator["pa.RecordBatch"]:
+    rows: List[Dict] = []
+    for job in jobs:
+        rows.append(to_row(job))
+        if len(rows) >= batch_rows:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            rows = []
+    if rows:
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+# =========================
+# Write
+# =========================
+
+
+def write_jobs(
+    jobs: Iterable[Dict],
+    root: str = DATASET_DIR,
+    append: bool = False,
+    batch_rows: int = BATCH_ROWS,
+) -> int:
+    """
+    Ghi job → Parquet dataset root/platform=<p>/crawl_date=<YYYY-MM-DD>/*.parquet
+    (stream theo batch, không giữ cả dataset trong RAM).
+
+    append=False → xoá dataset cũ rồi ghi lại
+    append=True  → thêm file mới (tên theo run) vào các partition
+    """
+    _require_pyarrow()
+    schema = job_schema()
+
+    if not append and os.path.exists(root):
+        shutil.rmtree(root)
+
+    count = 0
+
+    def counted() -> Iterator["pa.RecordBatch"]:
+        nonlocal count
+        for batch in _iter_batches(jobs, schema, batch_rows):
+            count += batch.num_rows
+            yield batch
+
+    run_id = f"{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    ds.write_dataset(
+        counted(),
+        root,
+        schema=schema,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{run_id}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=batch_rows,
+    )
+    return count
+
+
+# =========================
+# Read
+# =========================
+
+
+Filters = Union[None, "pc.Expression", Dict[str, object]]
+
+
+def _to_expression(filters: Filters) -> Optional["pc.Expression"]:
+    """
+    dict → AND các điều kiện: {"platform": "itviec"} (==),
+    {"crawl_date": ["2025-01-01", "2025-01-02"]} (isin).
+    Expression pyarrow (pc.field("salary_min") > 30_000_000) → dùng nguyên.
+    """
+    if filters is None or isinstance(filters, pc.Expression):
+        return filters
+
+    expression = None
+    for column, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            condition = pc.field(column).isin(list(value))
+        else:
+            condition = pc.field(column) == value
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def open_jobs(root: str = DATASET_DIR) -> "ds.Dataset":
+    _require_pyarrow()
+    return ds.dataset(
+        root,
+        schema=job_schema(),
+        format="parquet",
+        partitioning=_partitioning(),
+    )
+
+
+def read_jobs(
+    root: str = DATASET_DIR,
+    columns: Optional[List[str]] = None,
+    filters: Filters = None,
+) -> "pa.Table":
+    """
+    Đọc dataset với column projection + predicate pushdown:
+    - filter trên platform / crawl_date → bỏ qua cả thư mục partition
+    - filter trên cột khác → bỏ row group theo min / max statistics
+    - chỉ đọc các cột trong `columns` (không chọn description → không đọc)
+
+        read_jobs(columns=["platform", "requirements"], filters={"platform": "topcv"})
+    """
+    return open_jobs(root).to_table(columns=columns, filter=_to_expression(filters))
@@ -0,0 +1,88 @@
+import json
+import logging
+import sys
+import time
+from typing import Optional
+
+# Field mặc định của LogRecord → phần còn lại là field truyền qua extra={...}
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+LOG_FORMATS = ("text", "json")
+
+
+def _extra_fields(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED}
+
+
+class KeyValueFormatter(logging.Formatter):
+    """`12:00:01 INFO  scrapers.base_scraper | message | platform=itviec url=...`"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = (
+            f"{self.formatTime(record, '%H:%M:%S')} {record.levelname:<5} "
+            f"{record.name} | {record.getMessage()}"
+        )
+
+        fields = _extra_fields(record)
+        if fields:
+            line += " | " + " ".join(f"{k}={v}" for k, v in fields.items())
+
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """1 dòng JSON / log record (để đẩy vào Loki / ELK ...)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.processName,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        payload.update(_extra_fields(record))
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def configure_logging(
+    level: str = "INFO",
+    fmt: str = "text",
+    stream=None,
+    logfile: Optional[str] = None,
+):
+    """
+    Cấu hình root logger cho crawler (gọi 1 lần / process, kể cả process con).
+
+    level: DEBUG / INFO / WARNING / ERROR
+    fmt: "text" (key=value) hoặc "json"
+    """
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format: {fmt} (choose {LOG_FORMATS})")
+
+    formatter = JsonFormatter() if fmt == "json" else KeyValueFormatter()
+
+    handlers = [logging.StreamHandler(stream or sys.stderr)]
+    if logfile:
+        handlers.append(logging.FileHandler(logfile, encoding="utf-8"))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+    root.setLevel(level.upper())
+
+    # Log của thư viện chỉ hiện khi có lỗi
+    for noisy in ("urllib3", "selenium", "WDM", "asyncio"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
@@ -0,0 +1,37 @@
+import logging
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# "auto" → lxml nếu có cài, không thì html.parser
+PARSER_BACKENDS = ("auto", "html.parser", "lxml")
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(name: str = "auto") -> str:
+    """
+    Chọn tree builder cho BeautifulSoup.
+
+    lxml (C) nhanh hơn html.parser (pure Python) nhiều lần trên trang lớn,
+    API select / select_one / find giữ nguyên → extractor không cần sửa.
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (choose {PARSER_BACKENDS})")
+
+    if name == "html.parser":
+        return name
+
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        if name == "lxml":
+            logger.warning("⚠️ lxml chưa được cài → fallback html.parser")
+        return "html.parser"
+
+    return "lxml"
+
+
+def make_soup(html: str, parser: str = "auto") -> BeautifulSoup:
+    return BeautifulSoup(html, resolve_parser(parser))
@@ -0,0 +1,176 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """
+    Token bucket cho 1 host, tự điều chỉnh rate theo AIMD.
+
+    - Response 2xx và nhanh → rate += additive_step (tăng dần)
+    - 429 / 503 / lỗi timeout / latency tăng cao → rate *= decrease_factor
+      và nghỉ exponential backoff có jitter (ưu tiên Retry-After nếu có)
+    - Dùng chung cho mọi thread / coroutine gọi cùng host (xem get_limiter)
+    """
+
+    THROTTLE_STATUS = (429, 503)
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 8.0,
+        burst: float = 2.0,
+        additive_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 5.0,
+        base_backoff: float = 2.0,
+        max_backoff: float = 120.0,
+    ):
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.additive_step = additive_step
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._backoff_until = 0.0
+        self._failures = 0
+        self._latency_ewma: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # Acquire
+    # ============================================================
+    def _reserve(self) -> float:
+        """Lấy 1 token, trả về số giây cần chờ trước khi gửi request."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+
+            # Token âm = đã hứa cho request đang chờ → các request sau chờ lâu hơn
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            return max(wait, self._backoff_until - now)
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # ============================================================
+    # Feedback (AIMD)
+    # ============================================================
+    def record(
+        self,
+        status: Optional[int],
+        latency: float,
+        error: bool = False,
+        retry_after: Optional[float] = None,
+    ):
+        """
+        Gọi sau mỗi request.
+
+        status: HTTP status (None nếu không biết, vd: Selenium)
+        error: lỗi mạng / timeout (tính là tín hiệu quá tải)
+        """
+        with self._lock:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+            throttled = error or status in self.THROTTLE_STATUS
+            slow = self._latency_ewma > self.latency_threshold
+
+            if throttled or slow:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._failures += 1
+
+                if throttled:
+                    backoff = min(
+                        self.max_backoff, self.base_backoff * 2 ** (self._failures - 1)
+                    )
+                    backoff *= random.uniform(0.5, 1.5)
+                    if retry_after:
+                        backoff = max(backoff, retry_after)
+                    self._backoff_until = max(
+                        self._backoff_until, time.monotonic() + backoff
+                    )
+
+            elif status is None or 200 <= status < 300:
+                self._failures = 0
+                self.rate = min(self.max_rate, self.rate + self.additive_step)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "host": self.host,
+                "rate": round(self.rate, 3),
+                "tokens": round(self._tokens, 3),
+                "latency_ewma": (
+                    round(self._latency_ewma, 3)
+                    if self._latency_ewma is not None
+                    else None
+                ),
+                "consecutive_failures": self._failures,
+                "backoff_remaining": round(
+                    max(0.0, self._backoff_until - time.monotonic()), 3
+                ),
+            }
+
+
+# ============================================================
+# Registry — 1 limiter / host / process
+# ============================================================
+_LIMITERS: Dict[str, HostRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(url_or_host: str, **defaults) -> HostRateLimiter:
+    """
+    Limiter dùng chung cho host của URL.
+    defaults chỉ áp dụng khi limiter được tạo lần đầu.
+    """
+    host = urlparse(url_or_host).netloc or url_or_host
+
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = HostRateLimiter(host, **defaults)
+            _LIMITERS[host] = limiter
+        return limiter
+
+
+def limiter_snapshots() -> Dict[str, dict]:
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.values())
+    return {limiter.host: limiter.snapshot() for limiter in limiters}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,261 @@
+import glob
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd là tuỳ chọn, mặc định dùng gzip
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSIONS = ("gzip", "zstd", "none")
+EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", "none": ".jsonl"}
+
+# <platform>_raw-YYYYMMDD-NNN.jsonl[.gz|.zst]
+SEGMENT_RE = re.compile(r"_raw-(\d{8})-(\d{3})\.jsonl(\.gz|\.zst)?$")
+
+
+class RawWriter:
+    """
+    Ghi raw record (JSONL) cho 1 platform, giữ file mở và ghi theo batch.
+
+    - Segment nén gzip / zstd: <platform>_raw-YYYYMMDD-NNN.jsonl.gz
+    - Sang segment mới khi vượt max_segment_bytes (tính trên dữ liệu chưa nén)
+      hoặc khi sang ngày mới
+    - flush sau mỗi flush_every record hoặc flush_interval giây;
+      fsync=True → fsync sau mỗi lần flush (bền hơn, chậm hơn)
+    - on_flush() được gọi sau mỗi lần flush có dữ liệu mới → nơi cập nhật
+      checkpoint / seen index (không bao giờ đi trước dữ liệu trên đĩa)
+    - write(record, on_written) → on_written() chạy ngay sau khi record vào
+      buffer, trước flush (cùng lock) → đếm collected / bỏ in-flight ở đây
+      thì checkpoint của lần flush đó đã tính record này
+    - Mỗi lần mở writer luôn tạo segment mới → không append vào file nén
+      có thể bị cắt dở từ lần chạy trước
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        platform_name: str,
+        compression: str = "gzip",
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        rotate_daily: bool = True,
+        flush_every: int = 50,
+        flush_interval: float = 5.0,
+        fsync: bool = False,
+        compress_level: int = 6,
+        on_flush: Optional[Callable[[], None]] = None,
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+
+        if compression == "zstd" and zstandard is None:
+            logger.warning("⚠️ zstandard chưa được cài → dùng gzip")
+            compression = "gzip"
+
+        self.directory = directory
+        self.platform_name = platform_name
+        self.compression = compression
+        self.max_segment_bytes = max_segment_bytes
+        self.rotate_daily = rotate_daily
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.compress_level = compress_level
+        self.on_flush = on_flush
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.path: Optional[str] = None
+        self.records = 0
+        self._raw: Optional[IO[bytes]] = None
+        self._stream: Optional[IO[bytes]] = None
+        self._day: Optional[str] = None
+        self._segment_bytes = 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        # RLock: on_flush có thể gọi lại flush()
+        self._lock = threading.RLock()
+
+    # ============================================================
+    # Public API
+    # ============================================================
+    def write(self, record: Dict, on_written: Optional[Callable[[], None]] = None):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+        with self._lock:
+            today = datetime.now().strftime("%Y%m%d")
+            if (
+                self._stream is None
+                or (self.rotate_daily and today != self._day)
+                or (
+                    self._segment_bytes
+                    and self._segment_bytes + len(line) > self.max_segment_bytes
+                )
+            ):
+                self._open_segment(today)
+
+            self._stream.write(line)
+            self._segment_bytes += len(line)
+            self._unflushed += 1
+            self.records += 1
+            if on_written:
+                on_written()
+
+            if (
+                self._unflushed >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            self._close_segment()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ============================================================
+    # Segments
+    # ============================================================
+    def _next_segment_path(self, day: str) -> str:
+        prefix = f"{self.platform_name}_raw-{day}-"
+        existing = glob.glob(os.path.join(self.directory, f"{prefix}*"))
+
+        seq = 0
+        for path in existing:
+            m = SEGMENT_RE.search(os.path.basename(path))
+            if m:
+                seq = max(seq, int(m.group(2)) + 1)
+
+        ext = EXTENSIONS[self.compression]
+        return os.path.join(self.directory, f"{prefix}{seq:03d}{ext}")
+
+    def _open_segment(self, day: str):
+        self._close_segment()
+
+        self.path = self._next_segment_path(day)
+        self._raw = open(self.path, "xb")
+
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(
+                fileobj=self._raw, mode="wb", compresslevel=self.compress_level
+            )
+        elif self.compression == "zstd":
+            cctx = zstandard.ZstdCompressor(level=self.compress_level)
+            self._stream = cctx.stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+        self._day = day
+        self._segment_bytes = 0
+
+    def _flush_locked(self):
+        if self._stream is None or not self._unflushed:
+            return
+
+        # gzip / zstd flush block → phần đã ghi đọc được ngay cả khi crash sau đó
+        if self.compression == "zstd":
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        else:
+            self._stream.flush()
+        if self._stream is not self._raw:
+            self._raw.flush()
+        if self.fsync:
+            os.fsync(self._raw.fileno())
+
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+        if self.on_flush:
+            self.on_flush()
+
+    def _close_segment(self):
+        if self._stream is None:
+            return
+
+        self._flush_locked()
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+
+        self._stream = None
+        self._raw = None
+
+
+# ============================================================
+# Readers
+# ============================================================
+def iter_raw_files(directory: str, platform_name: Optional[str] = None) -> List[str]:
+    """
+    Mọi file raw của platform (hoặc tất cả platform), theo thứ tự ghi:
+    file cũ <platform>_raw.jsonl trước, sau đó các segment theo ngày / số thứ tự.
+    """
+    platform = platform_name or "*"
+    legacy = sorted(glob.glob(os.path.join(directory, f"{platform}_raw.jsonl")))
+    segments = [
+        path
+        for path in glob.glob(os.path.join(directory, f"{platform}_raw-*"))
+        if SEGMENT_RE.search(os.path.basename(path))
+    ]
+    return legacy + sorted(segments)
+
+
+def open_raw(path: str) -> IO[str]:
+    """Mở file raw (plain / .gz / .zst) ở text mode."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"Cần cài zstandard để đọc {path}")
+        dctx = zstandard.ZstdDecompressor()
+        stream = dctx.stream_reader(open(path, "rb"), read_across_frames=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+
+    return open(path, encoding="utf-8")
+
+
+def iter_raw_lines(path: str) -> Iterator[str]:
+    """
+    Yield từng dòng JSON hoàn chỉnh.
+    Segment bị cắt dở (crash khi đang ghi) → dừng ở dòng đầy đủ cuối cùng.
+    """
+    errors = (EOFError, zlib.error, OSError)
+    if zstandard is not None:
+        errors += (zstandard.ZstdError,)
+
+    with open_raw(path) as f:
+        try:
+            for line in f:
+                if line.endswith("\n") and line.strip():
+                    yield line
+        except errors as e:
+            logger.warning(f"⚠️ Segment bị cắt dở: {path} ({e})")
+
+
+def iter_raw_records(paths: Iterable[str]) -> Iterator[Dict]:
+    for path in paths:
+        for line in iter_raw_lines(path):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
@@ -0,0 +1,226 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# Pattern (compile 1 lần, dùng chung cho cả cột)
+# ============================================================
+
+# "Thoả thuận" (TopCV), "Thương lượng" (VietnamWorks), "You'll love it" (ITviec)
+NEGOTIABLE_RE = re.compile(
+    r"th(?:oả|ỏa)\s*thu[ậa]n|th[ưu][ơo]ng\s*l[ưu][ợo]ng|negotiable|competitive"
+    r"|c[ạa]nh\s*tranh|you'?ll\s*love\s*it"
+)
+LOGIN_RE = re.compile(r"sign\s*in|đăng\s*nhập")
+USD_RE = re.compile(r"\$|usd")
+YEARLY_RE = re.compile(r"/\s*(?:year|năm)|per\s*year|annual")
+
+_NUM = r"\d+(?:[.,]\d+)*"
+# k = nghìn; tr / triệu / m / mil / million = triệu; tỷ / tỉ = tỷ
+_UNIT = r"k\b|tr\b|tri[ệe]u|mil(?:lion)?\b|m\b|t[ỷỉ]"
+_UP_TO = r"up\s*to|upto|up\s*~|tới|đến|lên\s*(?:tới|đến)|max"
+_FROM = r"từ|trên|from|over|min|>"
+
+# 1 regex / cột: [prefix] [$] n1 [unit1] [- | ~ | to | đến [$] n2 [unit2]]
+AMOUNT_RE = re.compile(
+    rf"(?:(?P<prefix>{_UP_TO}|{_FROM})\s*[~:]?\s*)?"
+    rf"(?:\$|usd)?\s*(?P<n1>{_NUM})\s*(?P<u1>{_UNIT})?"
+    # "đ" không được nuốt chữ đầu của "đến" (dấu nối khoảng lương)
+    rf"(?:\s*(?:\$|usd|vnđ|vnd|đ(?!ến)|₫))?"
+    rf"(?:\s*(?:-|–|~|to\b|đến)\s*(?:\$|usd)?\s*(?P<n2>{_NUM})\s*(?P<u2>{_UNIT})?)?"
+)
+UP_TO_RE = re.compile(rf"^(?:{_UP_TO})$")
+
+# "3 năm kinh nghiệm, 20 triệu", "3-5 năm", "5 - 7 years" → bỏ số năm kinh
+# nghiệm (cả khoảng) trước khi tìm số tiền
+# ("/năm" của lương theo năm đứng sau đơn vị / dấu "/", không bị bỏ)
+EXPERIENCE_RE = re.compile(
+    rf"{_NUM}(?:\s*(?:-|–|~|to\b|đến)\s*{_NUM})?"
+    r"\s*\+?\s*(?:năm|years?|yrs?)\b(?:\s*(?:of\s*)?"
+    r"(?:kinh\s*nghi[ệe]m|experience|exp)\b)?"
+)
+
+# "2,000" / "25.000.000" → bỏ dấu ngăn cách nghìn; "1,5" → "1.5"
+_THOUSANDS_RE = re.compile(r"[.,](\d{3})")
+
+MILLION_UNITS = ("tr", "triệu", "trieu", "m", "mil", "million")
+BILLION_UNITS = ("tỷ", "tỉ")
+
+# Thứ tự = độ ưu tiên khi phân loại
+SALARY_TYPES = (
+    "login_required",
+    "negotiable",
+    "range",
+    "up_to",
+    "from",
+    "fixed",
+    "descriptive",
+)
+
+
+# ============================================================
+# Vectorized engine
+# ============================================================
+
+
+def _to_number(digits: pd.Series) -> np.ndarray:
+    """Cột chuỗi số ("2,000", "1.5", NaN) → float64 (NaN nếu rỗng)."""
+    cleaned = digits.str.replace(_THOUSANDS_RE, r"\1", regex=True).str.replace(
+        ",", ".", regex=False
+    )
+    return pd.to_numeric(cleaned, errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
+    )
+
+
+def _multiplier(units: pd.Series, is_usd: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    k → 1.000; tr / triệu / M → 1.000.000; tỷ → 1.000.000.000.
+    VND không có đơn vị + số < 1000 ("10 - 15") → hiểu là triệu.
+    """
+    units = units.fillna("").to_numpy(dtype=object)
+    return np.select(
+        [
+            units == "k",
+            np.isin(units, MILLION_UNITS),
+            np.isin(units, BILLION_UNITS),
+            ~is_usd & (values < 1000),
+        ],
+        [1_000.0, 1_000_000.0, 1_000_000_000.0, 1_000_000.0],
+        default=1.0,
+    )
+
+
+def _parse_unique(values: np.ndarray) -> pd.DataFrame:
+    """Parse các chuỗi salary (đã unique) → type / min / max / avg / currency."""
+    text = (
+        pd.Series(values, dtype="string")
+        .str.strip()
+        .str.lower()
+        .str.replace(EXPERIENCE_RE, " ", regex=True)
+    )
+
+    has_text = text.fillna("").str.len().to_numpy() > 0
+    is_login = text.str.contains(LOGIN_RE, na=False).to_numpy(dtype=bool)
+    is_negotiable = text.str.contains(NEGOTIABLE_RE, na=False).to_numpy(dtype=bool)
+    is_usd = text.str.contains(USD_RE, na=False).to_numpy(dtype=bool)
+    is_yearly = text.str.contains(YEARLY_RE, na=False).to_numpy(dtype=bool)
+
+    parts = text.str.extract(AMOUNT_RE)
+    n1 = _to_number(parts["n1"])
+    n2 = _to_number(parts["n2"])
+    # "10 - 15 triệu": đơn vị ở 1 đầu áp cho cả 2
+    u1 = parts["u1"].fillna(parts["u2"])
+    u2 = parts["u2"].fillna(parts["u1"])
+    v1 = n1 * _multiplier(u1, is_usd, n1)
+    v2 = n2 * _multiplier(u2, is_usd, n2)
+
+    # Lương theo năm → theo tháng
+    v1 = np.where(is_yearly, v1 / 12, v1)
+    v2 = np.where(is_yearly, v2 / 12, v2)
+
+    prefix = parts["prefix"].fillna("")
+    is_up_to = prefix.str.match(UP_TO_RE).to_numpy(dtype=bool)
+    has_n1 = ~np.isnan(v1)
+    has_n2 = ~np.isnan(v2)
+
+    types = np.select(
+        [
+            is_login,
+            is_negotiable & ~has_n1,
+            has_n1 & has_n2,
+            has_n1 & is_up_to,
+            has_n1 & (prefix != "").to_numpy(dtype=bool),
+            has_n1,
+            has_text,
+        ],
+        list(SALARY_TYPES),
+        default=None,
+    )
+
+    is_range = types == "range"
+    low = np.where(is_range, np.fmin(v1, v2), v1)
+    high = np.where(is_range, np.fmax(v1, v2), v1)
+    minimum = np.where(np.isin(types, ("range", "from", "fixed")), low, np.nan)
+    maximum = np.where(np.isin(types, ("range", "up_to", "fixed")), high, np.nan)
+    average = (minimum + maximum) / 2
+
+    has_amount = ~np.isnan(minimum) | ~np.isnan(maximum)
+    currency = np.where(has_amount, np.where(is_usd, "USD", "VND"), None)
+
+    def as_int(values: np.ndarray) -> pd.Series:
+        return pd.Series(np.round(values)).astype("Int64")
+
+    return pd.DataFrame(
+        {
+            "type": pd.Series(types, dtype=object),
+            "min": as_int(minimum),
+            "max": as_int(maximum),
+            "avg": as_int(average),
+            "currency": pd.Series(currency, dtype=object),
+        }
+    )
+
+
+def _factorize(
+    texts: Iterable[Optional[str]],
+) -> Tuple[pd.Series, np.ndarray, pd.DataFrame]:
+    """(raw, codes, kết quả parse của từng chuỗi unique)."""
+    raw = pd.Series(list(texts), dtype=object)
+    raw = raw.where(raw.map(lambda v: isinstance(v, str)), None)
+
+    codes, uniques = pd.factorize(raw.fillna(""))
+    return raw, codes, _parse_unique(np.asarray(uniques, dtype=object))
+
+
+def parse_salaries(texts: Iterable[Optional[str]]) -> pd.DataFrame:
+    """
+    Parse cả cột salary text cùng lúc.
+
+    Salary lặp lại rất nhiều ("Thoả thuận", "10 - 15 triệu", ...) → factorize,
+    chỉ parse mỗi chuỗi khác nhau 1 lần rồi take() lại theo thứ tự input.
+
+    Trả về DataFrame (cùng thứ tự input):
+        raw | type | min | max | avg (Int64, theo tháng) | currency (VND / USD)
+    """
+    raw, codes, parsed = _factorize(texts)
+    frame = parsed.take(codes)
+    frame.index = raw.index
+    frame.insert(0, "raw", raw)
+    return frame
+
+
+# ============================================================
+# Record helpers (JSON-friendly: NA → None, Int64 → int)
+# ============================================================
+
+
+def salary_text(value: Any) -> Optional[str]:
+    """Salary trong raw record: str (TopCV / VNW) hoặc dict có "raw" (ITviec cũ)."""
+    if isinstance(value, dict):
+        value = value.get("raw")
+    return value if isinstance(value, str) else None
+
+
+def salary_records(texts: Iterable[Optional[str]]) -> List[Dict[str, Any]]:
+    """Như parse_salaries nhưng trả về list dict (đổi kiểu 1 lần / chuỗi unique)."""
+    raw, codes, parsed = _factorize(texts)
+    parsed = parsed.astype(object)
+    unique_records = parsed.where(parsed.notna(), None).to_dict("records")
+    return [{"raw": r, **unique_records[c]} for r, c in zip(raw, codes)]
+
+
+@lru_cache(maxsize=4096)
+def _parse_one(text: Optional[str]) -> tuple:
+    return tuple(salary_records([text])[0].items())
+
+
+def parse_salary(text: Optional[str]) -> Dict[str, Any]:
+    """
+    1 chuỗi salary → dict (wrapper cho code xử lý từng record).
+    Cache theo chuỗi; nhiều record → dùng parse_salaries / salary_records.
+    """
+    return dict(_parse_one(text if isinstance(text, str) else None))
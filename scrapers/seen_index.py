@@ -0,0 +1,127 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from .raw_writer import iter_raw_records
+
+logger = logging.getLogger(__name__)
+
+
+class SeenIndex:
+    """
+    Index job_url đã crawl, lưu trên đĩa (SQLite).
+
+    Mỗi URL lưu first_seen / last_seen (unix timestamp) để:
+    - bỏ qua scrape_job_detail với job đã có
+    - dừng phân trang khi cả 1 list page đều là job cũ
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                url TEXT PRIMARY KEY,
+                first_seen INTEGER NOT NULL,
+                last_seen INTEGER NOT NULL
+            )
+            """)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE url = ?", (url,)
+            ).fetchone()
+        return row is not None
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen, last_seen FROM seen WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+        return {"url": url, "first_seen": row[0], "last_seen": row[1]}
+
+    def filter_new(self, urls: Iterable[str]) -> List[str]:
+        """Trả về các URL chưa có trong index (giữ thứ tự)."""
+        urls = list(urls)
+        if not urls:
+            return []
+
+        seen = set()
+        with self._lock:
+            # SQLite giới hạn số tham số / query → chia batch
+            for i in range(0, len(urls), 500):
+                batch = urls[i : i + 500]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT url FROM seen WHERE url IN ({marks})", batch
+                ).fetchall()
+                seen.update(r[0] for r in rows)
+
+        return [u for u in urls if u not in seen]
+
+    def mark(self, urls: Iterable[str], ts: Optional[int] = None):
+        """Thêm URL mới hoặc cập nhật last_seen nếu đã có."""
+        ts = ts or int(time.time())
+        rows = [(u, ts, ts) for u in urls if u]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO seen (url, first_seen, last_seen) VALUES (?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def bootstrap_from_raw(self, paths: Iterable[str]) -> int:
+        """
+        Seed index từ các file raw đã có (jsonl / segment nén, chỉ khi index đang rỗng).
+        first_seen / last_seen lấy theo timestamp của record.
+        """
+        paths = list(paths)
+        if len(self) or not paths:
+            return 0
+
+        rows = {}
+        for raw in iter_raw_records(paths):
+            url = (raw.get("job_list_item") or {}).get("job_url")
+            if not url:
+                continue
+
+            ts = raw.get("timestamp") or int(time.time())
+            first, last = rows.get(url, (ts, ts))
+            rows[url] = (min(first, ts), max(last, ts))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (url, first_seen, last_seen) VALUES (?, ?, ?)",
+                [(u, first, last) for u, (first, last) in rows.items()],
+            )
+            self._conn.commit()
+
+        logger.info(
+            f"📇 Seen index bootstrapped: {len(rows)} urls from {len(paths)} files"
+        )
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
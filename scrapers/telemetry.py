@@ -0,0 +1,217 @@
+import bisect
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence
+
+# Bucket (giây) kiểu Prometheus, +Inf thêm tự động
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """Histogram bucket cố định (không giữ từng giá trị → bộ nhớ O(buckets))."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Ước lượng quantile = cận trên của bucket chứa nó (≤ max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return (
+                    min(self.buckets[i], self.max)
+                    if i < len(self.buckets)
+                    else self.max
+                )
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "avg": round(self.sum / self.count, 4) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 4),
+        }
+
+
+class Telemetry:
+    """
+    Metrics của crawl, theo platform.
+
+    - phase histogram (giây): driver_setup / fetch / navigation / wait /
+      parse / extract / persist
+    - counters: requests, retries, bytes_*, jobs_saved, ...
+    - errors: (phase, error class) → số lần
+    Export: summary() (JSON) và to_prometheus() (text exposition format).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.started_at = time.time()
+
+        self._lock = threading.Lock()
+        self._histograms: Dict[tuple, Histogram] = {}
+        self._counters: Dict[str, Counter] = defaultdict(Counter)
+        self._errors: Dict[str, Counter] = defaultdict(Counter)
+
+    # ============================================================
+    # Record
+    # ============================================================
+    def observe(self, platform: str, phase: str, seconds: float):
+        key = (platform or "unknown", phase)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram(self.buckets)
+            hist.observe(seconds)
+
+    @contextmanager
+    def timer(self, platform: str, phase: str) -> Iterator[None]:
+        """Đo 1 phase; lỗi → vẫn ghi thời gian + error class rồi raise lại."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.error(platform, phase, e)
+            raise
+        finally:
+            self.observe(platform, phase, time.perf_counter() - started)
+
+    def incr(self, platform: str, name: str, value: int = 1):
+        with self._lock:
+            self._counters[platform or "unknown"][name] += value
+
+    def error(self, platform: str, phase: str, error):
+        """error: exception hoặc tên class."""
+        name = error if isinstance(error, str) else type(error).__name__
+        with self._lock:
+            self._errors[platform or "unknown"][f"{phase}:{name}"] += 1
+
+    # ============================================================
+    # Export
+    # ============================================================
+    def summary(self) -> dict:
+        with self._lock:
+            platforms = defaultdict(
+                lambda: {"phases": {}, "counters": {}, "errors": {}}
+            )
+            for (platform, phase), hist in sorted(self._histograms.items()):
+                platforms[platform]["phases"][phase] = hist.summary()
+            for platform, counters in self._counters.items():
+                platforms[platform]["counters"] = dict(counters)
+            for platform, errors in self._errors.items():
+                platforms[platform]["errors"] = dict(errors)
+
+        return {
+            "started_at": int(self.started_at),
+            "duration": round(time.time() - self.started_at, 3),
+            "platforms": dict(platforms),
+        }
+
+    def to_prometheus(self, prefix: str = "crawler") -> str:
+        lines = []
+
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = {p: dict(c) for p, c in self._counters.items()}
+            errors = {p: dict(c) for p, c in self._errors.items()}
+
+        name = f"{prefix}_phase_seconds"
+        lines.append(f"# HELP {name} Thời gian từng phase crawl")
+        lines.append(f"# TYPE {name} histogram")
+        for (platform, phase), hist in histograms:
+            labels = f'platform="{platform}",phase="{phase}"'
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), hist.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {hist.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+        for counter in sorted({c for values in counters.values() for c in values}):
+            metric = f"{prefix}_{counter}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for platform, values in sorted(counters.items()):
+                if counter in values:
+                    lines.append(f'{metric}{{platform="{platform}"}} {values[counter]}')
+
+        metric = f"{prefix}_errors_total"
+        lines.append(f"# TYPE {metric} counter")
+        for platform, values in sorted(errors.items()):
+            for key, n in sorted(values.items()):
+                phase, error_class = key.split(":", 1)
+                lines.append(
+                    f'{metric}{{platform="{platform}",phase="{phase}",'
+                    f'error="{error_class}"}} {n}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: str, name: str = "crawl") -> Dict[str, str]:
+        """Ghi <name>.json + <name>.prom vào directory."""
+        os.makedirs(directory, exist_ok=True)
+        paths = {
+            "json": os.path.join(directory, f"{name}.json"),
+            "prometheus": os.path.join(directory, f"{name}.prom"),
+        }
+
+        with open(paths["json"], "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+        # textfile collector đọc file → ghi tạm rồi replace
+        tmp_path = f"{paths['prometheus']}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, paths["prometheus"])
+
+        return paths
+
+
+# ============================================================
+# Registry — 1 Telemetry / process
+# ============================================================
+_TELEMETRY: Optional[Telemetry] = None
+_TELEMETRY_LOCK = threading.Lock()
+
+
+def get_telemetry() -> Telemetry:
+    global _TELEMETRY
+    with _TELEMETRY_LOCK:
+        if _TELEMETRY is None:
+            _TELEMETRY = Telemetry()
+        return _TELEMETRY
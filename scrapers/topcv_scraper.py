@@ -1,21 +1,42 @@
 from .base_scraper import BaseScraper
 from bs4 import BeautifulSoup
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class TopCVScraper(BaseScraper):
 
+    PLATFORM = "topcv"
     BASE_URL = "https://www.topcv.vn"
-
-    def __init__(self, use_selenium=True):
-        super().__init__(self.BASE_URL, use_selenium, selenium_mode="fresh")
+    CONTENT_SELECTORS = {
+        "list": "div.job-item-search-result",
+        "detail": "div.job-description__item--content",
+    }
+    # Trang list sau trang cuối / search không có kết quả
+    EMPTY_MARKERS = {
+        "list": ("Chưa tìm thấy việc làm phù hợp", "Không tìm thấy việc làm phù hợp")
+    }
+
+    def __init__(self, use_selenium=True, pool_size=3, **kwargs):
+        super().__init__(
+            self.BASE_URL,
+            use_selenium,
+            selenium_mode="pool",
+            pool_size=pool_size,
+            **kwargs,
+        )
 
     def scrape_job_list(self, url: str):
         # url = f"https://www.topcv.vn/tim-viec-lam-{keyword}?type_keyword=1&sba=1&saturday_status=0"
 
-        soup = self.get_page(url)
+        soup = self.get_page(url, kind="list")
+        with self.timed("extract"):
+            return self.parse_job_list(soup)
 
+    def parse_job_list(self, soup):
         jobs_html = soup.select("div.job-item-search-result")
-        print(f"🔍 Found {len(jobs_html)} jobs on TopCV")
+        logger.info(f"🔍 Found {len(jobs_html)} jobs on TopCV")
 
         jobs = []
         for item in jobs_html:
@@ -45,15 +66,18 @@ class TopCVScraper(BaseScraper):
                 jobs.append(job)
 
             except Exception as e:
-                print(f"⚠️ Error parsing job card: {e}")
+                logger.warning(f"⚠️ Error parsing job card: {e}")
 
         return jobs
 
     def scrape_job_detail(self, job_url):
         soup = self.get_page(
-            job_url, wait_selector=".job-detail__information-container"
+            job_url, wait_selector=".job-detail__information-container", kind="detail"
         )
+        with self.timed("extract"):
+            return self.parse_job_detail(soup, job_url)
 
+    def parse_job_detail(self, soup, job_url):
         return {
             "description": self._extract_section(soup, "Mô tả công việc"),
             "requirements": self._extract_section(soup, "Yêu cầu ứng viên"),
@@ -1,16 +1,69 @@
 from .base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, quote_plus
+import base64
+import json
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class VietnamWorksScraper(BaseScraper):
-    def __init__(self, use_selenium=False):
+    PLATFORM = "vietnamworks"
+
+    CONTENT_SELECTORS = {
+        "list": "div.new-job-card",
+        # Heading "Mô tả công việc" / "Yêu cầu công việc" (như wait_selector)
+        "detail": "h2.sc-1671001a-5",
+    }
+    # Trang list sau trang cuối / search không có kết quả
+    EMPTY_MARKERS = {
+        "list": ("Không tìm thấy việc làm phù hợp", "Không tìm thấy kết quả phù hợp")
+    }
+
+    # API mà trang search (SPA) gọi để lấy danh sách job
+    SEARCH_API_PATTERN = "/job-search/v1.0/search"
+
+    def __init__(self, use_selenium=False, list_mode="xhr", **kwargs):
+        """
+        Args:
+            list_mode: "xhr" = bắt JSON response của API search qua
+                       Chrome performance log; "scroll" = scroll DOM như cũ
+        """
+        # Cần set trước super().__init__ vì driver được tạo trong đó
+        self.list_mode = list_mode
+
         super().__init__(
-            base_url="https://www.vietnamworks.com", use_selenium=use_selenium
+            base_url="https://www.vietnamworks.com",
+            use_selenium=use_selenium,
+            **kwargs,
         )
 
+    def _configure_chrome_options(self, chrome_options):
+        if self.list_mode == "xhr":
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            # Chỉ cần event Network (responseReceived / loadingFinished)
+            chrome_options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+            )
+
+    def _load_with_driver(self, driver, url: str, wait_selector: Optional[str]) -> str:
+        try:
+            return super()._load_with_driver(driver, url, wait_selector)
+        finally:
+            # Driver dùng chung cho list + detail: không drain sau mỗi trang
+            # detail thì buffer performance log phình tới lần list kế tiếp
+            self._drain_performance_log(driver)
+
+    def _drain_performance_log(self, driver):
+        if self.list_mode != "xhr":
+            return
+        try:
+            driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"⚠️ Không drain được performance log: {e}")
+
     # -----------------------------------------------------
     # JOB LIST - FIXED VERSION WITH SCROLL
     # -----------------------------------------------------
@@ -23,25 +76,165 @@ class VietnamWorksScraper(BaseScraper):
             use_scroll: True = dùng Selenium scroll, False = chỉ lấy jobs đầu
         """
         if use_scroll and self.use_selenium:
-            return self._scrape_with_scroll(url)
+            # Driver dùng chung với scrape_job_detail (pipeline nhiều thread)
+            with self._driver_lock:
+                # Search là SPA → kể cả auto mode vẫn cần browser
+                self._ensure_browser()
+                if self.list_mode == "xhr":
+                    jobs = self._scrape_with_xhr(url)
+                    if jobs is not None:
+                        return jobs
+                    logger.warning("⚠️ Không bắt được XHR search → fallback scroll")
+
+                return self._scrape_with_scroll(url)
 
         # Fallback: Chỉ lấy jobs có sẵn
-        soup = self.get_page(url)
+        soup = self.get_page(url, kind="list")
         if not soup:
-            print("❌ Không thể load trang")
+            logger.error("❌ Không thể load trang", extra={"url": url})
             return []
 
-        return self._parse_jobs_from_soup(soup)
+        with self.timed("extract"):
+            return self._parse_jobs_from_soup(soup)
+
+    # -----------------------------------------------------
+    # JOB LIST - XHR JSON (không scroll, không selector hash)
+    # -----------------------------------------------------
+    def _scrape_with_xhr(self, url: str) -> Optional[List[Dict]]:
+        """
+        Load trang search và lấy thẳng JSON mà SPA fetch từ API search.
+        Trả về None nếu không bắt được response nào trong wait_time.
+        """
+        driver = self.driver
+        payloads = []
+
+        def wait_for_payloads(driver):
+            payloads.extend(self._wait_for_search_payloads(driver, self.wait_time))
+
+        # Bỏ log của các trang trước
+        self._drain_performance_log(driver)
+        try:
+            # Qua rate limiter + telemetry như mọi trang Selenium khác
+            timing = self._navigate(driver, url, wait_until=wait_for_payloads)
+        finally:
+            # Request còn lại của trang search (tracking, ảnh, ...)
+            self._drain_performance_log(driver)
+
+        content = json.dumps(payloads, ensure_ascii=False)
+        self._record_page_timing(url, html_bytes=len(content), **timing)
+        if not payloads:
+            self.telemetry.error(self.PLATFORM, "wait", "XhrNotCaptured")
+            return None
+
+        # Re-parse offline: parse_search_payload trên từng payload
+        self._archive_page(url, content, "list_payload")
+
+        jobs = []
+        with self.timed("extract"):
+            for payload in payloads:
+                jobs.extend(self.parse_search_payload(payload))
+
+        logger.info(f"✅ XHR search: {len(jobs)} jobs", extra={"url": url})
+        return jobs
+
+    def _wait_for_search_payloads(self, driver, timeout: float) -> List[Dict]:
+        """Đọc Chrome performance log tới khi response API search load xong."""
+        deadline = time.monotonic() + timeout
+        pending = set()
+        payloads = []
+
+        while time.monotonic() < deadline:
+            for entry in driver.get_log("performance"):
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+
+                method = message.get("method")
+                params = message.get("params", {})
+
+                if method == "Network.responseReceived":
+                    response_url = params.get("response", {}).get("url", "")
+                    if self.SEARCH_API_PATTERN in response_url:
+                        pending.add(params.get("requestId"))
+
+                elif method == "Network.loadingFinished":
+                    request_id = params.get("requestId")
+                    if request_id in pending:
+                        pending.discard(request_id)
+                        payload = self._get_response_json(driver, request_id)
+                        if payload is not None:
+                            payloads.append(payload)
+
+            if payloads and not pending:
+                return payloads
+
+            time.sleep(0.2)
+
+        return payloads
+
+    def _get_response_json(self, driver, request_id: str) -> Optional[Dict]:
+        try:
+            result = driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            return json.loads(body)
+        except Exception as e:
+            logger.warning(f"⚠️ Không đọc được response body {request_id}: {e}")
+            return None
+
+    def parse_search_payload(self, payload: Dict) -> List[Dict]:
+        """
+        Build job cards từ JSON của API search (không cần browser).
+        Cùng schema với _parse_jobs_from_soup.
+        """
+        results = []
 
+        for item in payload.get("data") or []:
+            try:
+                job_url = item.get("jobUrl")
+                if not job_url and item.get("alias") and item.get("jobId"):
+                    job_url = f"/{item['alias']}-{item['jobId']}-jv"
+
+                locations = []
+                for loc in item.get("workingLocations") or []:
+                    city = loc.get("cityNameVI") or loc.get("cityName")
+                    if city and city not in locations:
+                        locations.append(city)
+
+                results.append(
+                    {
+                        "title": item.get("jobTitle"),
+                        "company": item.get("companyName"),
+                        "location": ", ".join(locations) or None,
+                        "salary": item.get("prettySalary"),
+                        "job_url": urljoin(self.base_url, job_url) if job_url else None,
+                    }
+                )
+
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Lỗi khi parse job XHR {item.get('jobId')}: {str(e)}"
+                )
+                continue
+
+        return results
+
+    # -----------------------------------------------------
+    # JOB LIST - SCROLL DOM
+    # -----------------------------------------------------
     def _scrape_with_scroll(self, url: str, max_scrolls: int = 5) -> List[Dict]:
         """Scroll để load thêm jobs"""
         from selenium.webdriver.common.by import By
         import time
 
         driver = self.driver
-        driver.get(url)
+        timing = self._navigate(driver, url)
 
-        print("⏳ Đang load trang...")
+        logger.debug("⏳ Đang load trang...")
         time.sleep(3)
 
         last_height = driver.execute_script("return document.body.scrollHeight")
@@ -52,7 +245,9 @@ class VietnamWorksScraper(BaseScraper):
             current_jobs = driver.find_elements(
                 By.CSS_SELECTOR, "div.search_list.view_job_item.new-job-card"
             )
-            print(f"📜 Scroll {i+1}/{max_scrolls} - Tìm thấy {len(current_jobs)} jobs")
+            logger.debug(
+                f"📜 Scroll {i+1}/{max_scrolls} - Tìm thấy {len(current_jobs)} jobs"
+            )
 
             # Scroll xuống cuối
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -65,16 +260,22 @@ class VietnamWorksScraper(BaseScraper):
             )
 
             if new_height == last_height and len(new_jobs) == jobs_count:
-                print("✅ Đã load hết jobs")
+                logger.debug("✅ Đã load hết jobs")
                 break
 
             last_height = new_height
             jobs_count = len(new_jobs)
 
         # Parse HTML sau khi scroll
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        html = driver.page_source
+        self._record_page_timing(url, html_bytes=len(html), **timing)
+        self._drain_performance_log(driver)
+        self._archive_page(url, html, "list")
+        soup = self._make_soup(html)
+        with self.timed("extract"):
+            return self._parse_jobs_from_soup(soup)
+
+    def parse_job_list(self, soup) -> List[Dict]:
         return self._parse_jobs_from_soup(soup)
 
     def _parse_jobs_from_soup(self, soup) -> List[Dict]:
@@ -92,14 +293,19 @@ class VietnamWorksScraper(BaseScraper):
         for selector in selectors:
             job_cards = soup.select(selector)
             if job_cards:
-                print(f"✅ Tìm thấy {len(job_cards)} jobs với selector: {selector}")
+                logger.info(
+                    f"✅ Tìm thấy {len(job_cards)} jobs với selector: {selector}"
+                )
                 break
 
         if not job_cards:
-            print("❌ Không tìm thấy job nào với các selector")
+            if self.is_empty_result(soup, "list"):
+                # Trang sau trang cuối → hết job, không phải lỗi selector
+                logger.info("⚠ Trang không có job nào")
+                return []
+            logger.error("❌ Không tìm thấy job nào với các selector")
             # Debug: In ra HTML để kiểm tra
-            print("🔍 HTML preview:")
-            print(soup.prettify()[:2000])
+            logger.debug(f"🔍 HTML preview:\n{soup.prettify()[:2000]}")
             return []
 
         results = []
@@ -145,13 +351,13 @@ class VietnamWorksScraper(BaseScraper):
                 }
 
                 results.append(job_data)
-                print(f"✅ Job {idx}: {job_data['title']}")
+                logger.debug(f"✅ Job {idx}: {job_data['title']}")
 
             except Exception as e:
-                print(f"⚠️ Lỗi khi parse job {idx}: {str(e)}")
+                logger.warning(f"⚠️ Lỗi khi parse job {idx}: {str(e)}")
                 continue
 
-        print(f"\n📊 Tổng cộng scrape được: {len(results)} jobs")
+        logger.info(f"📊 Tổng cộng scrape được: {len(results)} jobs")
         return results
 
     # -----------------------------------------------------
@@ -162,22 +368,23 @@ class VietnamWorksScraper(BaseScraper):
         Dùng khi VietnamWorks load jobs bằng infinite scroll
         """
         if not self.use_selenium:
-            print("⚠️ Cần bật Selenium để dùng chức năng này")
+            logger.warning("⚠️ Cần bật Selenium để dùng chức năng này")
             return self.scrape_job_list(url)
 
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
 
+        self._ensure_browser()
         driver = self.driver
-        driver.get(url)
+        timing = self._navigate(driver, url)
 
-        print("⏳ Đang load trang...")
+        logger.debug("⏳ Đang load trang...")
         time.sleep(3)
 
         # Scroll để load thêm jobs
         for i in range(max_scrolls):
-            print(f"📜 Scroll lần {i+1}/{max_scrolls}")
+            logger.debug(f"📜 Scroll lần {i+1}/{max_scrolls}")
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(2)
 
@@ -193,11 +400,15 @@ class VietnamWorksScraper(BaseScraper):
                 pass
 
         # Parse HTML sau khi scroll
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        html = driver.page_source
+        self._record_page_timing(url, html_bytes=len(html), **timing)
+        self._drain_performance_log(driver)
+        self._archive_page(url, html, "list")
+        soup = self._make_soup(html)
 
         # Dùng lại logic parse như trên
         job_cards = soup.select("div.search_list.view_job_item.new-job-card")
-        print(f"✅ Tìm thấy {len(job_cards)} jobs sau khi scroll")
+        logger.info(f"✅ Tìm thấy {len(job_cards)} jobs sau khi scroll")
 
         results = []
         for idx, job in enumerate(job_cards, 1):
@@ -228,7 +439,7 @@ class VietnamWorksScraper(BaseScraper):
                 )
 
             except Exception as e:
-                print(f"⚠️ Lỗi job {idx}: {str(e)}")
+                logger.warning(f"⚠️ Lỗi job {idx}: {str(e)}")
                 continue
 
         return results
@@ -257,11 +468,15 @@ class VietnamWorksScraper(BaseScraper):
     # -----------------------------------------------------
     def scrape_job_detail(self, job_url: str) -> Dict:
         job_url = urljoin(self.base_url, job_url)
-        soup = self.get_page(job_url, wait_selector="h2.sc-1671001a-5")
+        soup = self.get_page(job_url, wait_selector="h2.sc-1671001a-5", kind="detail")
+        with self.timed("extract"):
+            return self.parse_job_detail(soup, job_url)
 
+    def parse_job_detail(self, soup, job_url: str) -> Dict:
         if not soup:
             return {}
 
+        job_url = urljoin(self.base_url, job_url)
         sections = soup.select("div.sc-1671001a-4.gDSEwb")
 
         description = None
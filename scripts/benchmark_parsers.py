@@ -0,0 +1,281 @@
+import argparse
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import platform as py_platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from scrapers.parsers import PARSER_BACKENDS, resolve_parser
+from scripts.check_parser_parity import (
+    PAGES_DIR,
+    build_parse_scraper,
+    iter_saved_pages,
+    page_url,
+)
+
+BASELINE_FILE = "benchmarks/parsers_baseline.json"
+
+# Method bị đo thời gian riêng (inclusive: gồm cả method con)
+EXTRACTOR_PREFIXES = ("_extract", "_parse")
+
+
+# =========================
+# Corpus
+# =========================
+
+
+def load_corpus(root: str) -> Dict[Tuple[str, str], List[Tuple[str, str]]]:
+    """(platform, kind) → [(url, html)]"""
+    corpus = defaultdict(list)
+    for platform, kind, path in iter_saved_pages(root):
+        with open(path, encoding="utf-8") as f:
+            corpus[(platform, kind)].append((page_url(path), f.read()))
+    return corpus
+
+
+# =========================
+# Instrumentation
+# =========================
+
+
+def instrument(scraper) -> Dict[str, List[float]]:
+    """
+    Bọc mọi _extract* / _parse* của scraper (chỉ instance này) để đếm
+    số lần gọi và tổng thời gian. Trả về name → [calls, seconds].
+    """
+    stats = defaultdict(lambda: [0, 0.0])
+
+    for name in dir(type(scraper)):
+        if not name.startswith(EXTRACTOR_PREFIXES):
+            continue
+        method = getattr(scraper, name)
+        if not callable(method):
+            continue
+
+        def timed(*args, _method=method, _name=name, **kwargs):
+            started = time.perf_counter()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                entry = stats[_name]
+                entry[0] += 1
+                entry[1] += time.perf_counter() - started
+
+        setattr(scraper, name, functools.wraps(method)(timed))
+
+    return stats
+
+
+def parse_all(scraper, kind: str, pages: List[Tuple[str, str]]) -> float:
+    """Parse toàn bộ pages, trả về thời gian tạo soup."""
+    soup_seconds = 0.0
+
+    for url, html in pages:
+        started = time.perf_counter()
+        soup = scraper._make_soup(html)
+        soup_seconds += time.perf_counter() - started
+
+        if kind == "list":
+            scraper.parse_job_list(soup)
+        else:
+            scraper.parse_job_detail(soup, url)
+
+    return soup_seconds
+
+
+@contextlib.contextmanager
+def quiet():
+    """Parser log cho từng card → tắt logging / stdout khi đo."""
+    logging.disable(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+# =========================
+# Benchmark
+# =========================
+
+
+def bench_group(
+    platform: str,
+    kind: str,
+    pages: List[Tuple[str, str]],
+    parser: str,
+    repeat: int,
+) -> Dict:
+    scraper = build_parse_scraper(platform, parser)
+
+    # 1) Thời gian: lấy lần chạy nhanh nhất (không instrument)
+    runs = []
+    soup_seconds = 0.0
+    for _ in range(repeat):
+        with quiet():
+            started = time.perf_counter()
+            soup_seconds = parse_all(scraper, kind, pages)
+            runs.append(time.perf_counter() - started)
+    best = min(runs)
+
+    # 2) Breakdown theo extractor (1 lần, có instrument)
+    instrumented = build_parse_scraper(platform, parser)
+    stats = instrument(instrumented)
+    with quiet():
+        parse_all(instrumented, kind, pages)
+
+    # 3) Peak memory (tracemalloc làm chậm → chạy riêng)
+    tracemalloc.start()
+    try:
+        with quiet():
+            parse_all(scraper, kind, pages)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "pages": len(pages),
+        "html_bytes": sum(len(html) for _, html in pages),
+        "seconds": round(best, 6),
+        "pages_per_sec": round(len(pages) / best, 2) if best else None,
+        "soup_seconds": round(soup_seconds, 6),
+        "peak_memory_bytes": peak,
+        "extractors": {
+            name: {"calls": calls, "seconds": round(seconds, 6)}
+            for name, (calls, seconds) in sorted(
+                stats.items(), key=lambda item: -item[1][1]
+            )
+        },
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """So pages/sec với baseline, trả về các group chậm hơn threshold."""
+    regressions = []
+
+    for key in ("parser", "python"):
+        if baseline.get("meta", {}).get(key) != results["meta"][key]:
+            print(
+                f"⚠️ Baseline {key}={baseline.get('meta', {}).get(key)} "
+                f"≠ hiện tại {results['meta'][key]} → so sánh không cùng điều kiện"
+            )
+
+    for group, current in results["results"].items():
+        previous = baseline.get("results", {}).get(group)
+        if not previous or not previous.get("pages_per_sec"):
+            print(f"🆕 {group}: {current['pages_per_sec']} pages/s (không có baseline)")
+            continue
+
+        ratio = current["pages_per_sec"] / previous["pages_per_sec"]
+        mem_ratio = current["peak_memory_bytes"] / max(previous["peak_memory_bytes"], 1)
+        marker = "❌" if ratio < 1 - threshold else "✅"
+        print(
+            f"{marker} {group}: {previous['pages_per_sec']} → "
+            f"{current['pages_per_sec']} pages/s ({ratio - 1:+.1%}), "
+            f"peak mem {mem_ratio - 1:+.1%}"
+        )
+        if ratio < 1 - threshold:
+            regressions.append(group)
+
+    return regressions
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark parse list / detail trên trang HTML đã lưu"
+    )
+    parser.add_argument("--pages-dir", default=PAGES_DIR)
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        default=BASELINE_FILE,
+        help="Ghi kết quả (JSON) ra file này",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="So sánh với baseline, exit 1 nếu chậm hơn --threshold",
+    )
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # Đọc baseline trước khi ghi output (có thể là cùng 1 file)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    corpus = load_corpus(args.pages_dir)
+    if not corpus:
+        print(f"⚠️ Không tìm thấy trang nào trong {args.pages_dir}")
+        sys.exit(2)
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "python": py_platform.python_version(),
+            "parser": resolve_parser(args.parser),
+            "repeat": args.repeat,
+            "created_at": int(time.time()),
+        },
+        "results": {},
+    }
+
+    for (platform, kind), pages in sorted(corpus.items()):
+        group = f"{platform}/{kind}"
+        result = bench_group(platform, kind, pages, args.parser, args.repeat)
+        results["results"][group] = result
+
+        top = ", ".join(
+            f"{name} {stat['seconds'] * 1000:.1f}ms"
+            for name, stat in list(result["extractors"].items())[:3]
+        )
+        print(
+            f"⏱️ {group}: {result['pages']} pages | "
+            f"{result['pages_per_sec']} pages/s | "
+            f"peak {result['peak_memory_bytes'] / 1024 / 1024:.1f} MB | {top}"
+        )
+
+    # Compare với chính file output → không ghi đè baseline
+    if args.output and not (
+        baseline and os.path.abspath(args.output) == os.path.abspath(args.compare)
+    ):
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Saved → {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"❌ Regression: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import csv
+import random
+import re
+import sys
+import time
+from typing import Dict, List
+
+from scrapers.salary import _parse_one, parse_salaries, parse_salary, salary_records
+
+CORPUS_FILE = "benchmarks/salary_corpus.tsv"
+
+CHECKED_FIELDS = ("type", "min", "max", "currency")
+
+
+# =========================
+# Corpus
+# =========================
+
+
+def load_corpus(path: str) -> List[Dict]:
+    """platform | salary | type | min | max | currency (ô trống = None)."""
+    rows = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            for key in ("min", "max"):
+                row[key] = int(row[key]) if row[key] else None
+            row["currency"] = row["currency"] or None
+            rows.append(row)
+    return rows
+
+
+# =========================
+# Correctness
+# =========================
+
+
+def check(corpus: List[Dict]) -> List[str]:
+    """So parse_salaries với kết quả mong đợi, trả về các dòng sai."""
+    errors = []
+    parsed = salary_records(row["salary"] for row in corpus)
+
+    for row, result in zip(corpus, parsed):
+        diff = {
+            field: (result[field], row[field])
+            for field in CHECKED_FIELDS
+            if result[field] != row[field]
+        }
+        if diff:
+            errors.append(f"{row['platform']} | {row['salary']!r} | {diff}")
+
+    return errors
+
+
+# =========================
+# Benchmark
+# =========================
+
+
+def synthetic_column(corpus: List[Dict], rows: int, seed: int = 1) -> List[str]:
+    """
+    Lặp corpus tới `rows` dòng, thay mỗi số bằng số ngẫu nhiên cùng số chữ số
+    → nhiều chuỗi khác nhau (không chỉ đo cache / factorize).
+    """
+    rng = random.Random(seed)
+
+    def randomize(match) -> str:
+        digits = len(match.group())
+        return str(rng.randint(10 ** (digits - 1), 10**digits - 1))
+
+    templates = [row["salary"] for row in corpus]
+    return [
+        re.sub(r"\d+", randomize, templates[i % len(templates)]) for i in range(rows)
+    ]
+
+
+def best_of(func, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - started)
+    return min(runs)
+
+
+def bench(texts: List[str], scalar_rows: int, repeat: int) -> Dict[str, float]:
+    sample = texts[:scalar_rows]
+
+    def scalar_loop():
+        _parse_one.cache_clear()
+        return [parse_salary(t) for t in sample]
+
+    vectorized = best_of(lambda: parse_salaries(texts), repeat)
+    scalar = best_of(scalar_loop, repeat)
+
+    return {
+        "vectorized_rows_per_sec": round(len(texts) / vectorized),
+        "scalar_rows_per_sec": round(len(sample) / scalar),
+    }
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Kiểm tra + benchmark salary engine trên corpus salary thật"
+    )
+    parser.add_argument("--corpus", default=CORPUS_FILE)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=200_000,
+        help="Số dòng khi đo vectorized (corpus với số tiền ngẫu nhiên)",
+    )
+    parser.add_argument(
+        "--scalar-rows",
+        type=int,
+        default=2_000,
+        help="Số dòng khi đo wrapper từng record (chậm)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    errors = check(corpus)
+    for error in errors:
+        print(f"❌ {error}")
+    print(f"🎯 Corpus: {len(corpus) - len(errors)}/{len(corpus)} đúng")
+
+    texts = synthetic_column(corpus, args.rows)
+    result = bench(texts, args.scalar_rows, args.repeat)
+    print(
+        f"⏱️ {len(texts):,} rows ({len(set(texts)):,} khác nhau) | "
+        f"vectorized: {result['vectorized_rows_per_sec']:,} rows/s | "
+        f"scalar: {result['scalar_rows_per_sec']:,} rows/s | "
+        f"x{result['vectorized_rows_per_sec'] / result['scalar_rows_per_sec']:.0f}"
+    )
+
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
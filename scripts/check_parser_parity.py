@@ -0,0 +1,97 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import Iterator, Tuple
+
+from scrapers.itviec_scraper import ITviecScraper
+from scrapers.topcv_scraper import TopCVScraper
+from scrapers.vietnamworks_scraper import VietnamWorksScraper
+
+# Trang HTML đã lưu: <PAGES_DIR>/<platform>/<list|detail>/*.html
+PAGES_DIR = "saved_pages"
+
+SCRAPERS = {
+    "itviec": ITviecScraper,
+    "topcv": TopCVScraper,
+    "vietnamworks": VietnamWorksScraper,
+}
+
+
+# =========================
+# Helpers
+# =========================
+
+
+def iter_saved_pages(root: str = PAGES_DIR) -> Iterator[Tuple[str, str, str]]:
+    """Yield (platform, kind, path) cho mọi trang đã lưu."""
+    for platform in sorted(SCRAPERS):
+        for kind in ("list", "detail"):
+            pattern = os.path.join(root, platform, kind, "*.html")
+            for path in sorted(glob.glob(pattern)):
+                yield platform, kind, path
+
+
+def build_parse_scraper(platform: str, parser: str):
+    """Scraper chỉ để parse (requests mode → không mở browser)."""
+    return SCRAPERS[platform](use_selenium=False, parser=parser)
+
+
+def parse_page(scraper, kind: str, html: str, url: str):
+    soup = scraper._make_soup(html)
+    if kind == "list":
+        return scraper.parse_job_list(soup)
+    return scraper.parse_job_detail(soup, url)
+
+
+def page_url(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="So sánh output parse giữa html.parser và backend khác"
+    )
+    parser.add_argument("--pages-dir", default=PAGES_DIR)
+    parser.add_argument("--backend", default="lxml")
+    args = parser.parse_args()
+
+    baseline = {p: build_parse_scraper(p, "html.parser") for p in SCRAPERS}
+    candidate = {p: build_parse_scraper(p, args.backend) for p in SCRAPERS}
+
+    checked = 0
+    mismatches = []
+
+    for platform, kind, path in iter_saved_pages(args.pages_dir):
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+
+        url = page_url(path)
+        expected = parse_page(baseline[platform], kind, html, url)
+        actual = parse_page(candidate[platform], kind, html, url)
+        checked += 1
+
+        if json.dumps(expected, sort_keys=True) != json.dumps(actual, sort_keys=True):
+            mismatches.append(path)
+            print(f"❌ Mismatch: {path}")
+
+    print(
+        f"✅ Checked {checked} pages | backend={args.backend} | mismatches: {len(mismatches)}"
+    )
+
+    if not checked:
+        print(f"⚠️ Không tìm thấy trang nào trong {args.pages_dir}")
+        sys.exit(2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
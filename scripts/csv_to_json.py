@@ -1,8 +1,17 @@
 # scripts/csv_to_dashboard_json.py
 import csv, json
 
+from scrapers.dimensions import dimension_labels
+
 INPUT = "processed_data/job_skills_flat.csv"
 OUTPUT = "dashboard/src/data/jobs.json"
+LABELS_OUTPUT = "dashboard/src/data/dimensions.json"
+
+
+def code(value):
+    # CSV → str; thiếu code (chưa chạy enrich_dimensions) → 0
+    return int(value) if value else 0
+
 
 jobs = {}
 
@@ -15,6 +24,10 @@ with open(INPUT, encoding="utf-8") as f:
                 "platform": row["platform"],
                 "title": row["title"],
                 "location": row["location"],
+                "city": code(row.get("city")),
+                "role": code(row.get("role")),
+                "seniority": code(row.get("seniority")),
+                "cluster_id": row.get("cluster_id"),
                 "skills": [],
             }
         jobs[key]["skills"].append(row["skill"])
@@ -22,4 +35,8 @@ with open(INPUT, encoding="utf-8") as f:
 with open(OUTPUT, "w", encoding="utf-8") as f:
     json.dump(list(jobs.values()), f, ensure_ascii=False, indent=2)
 
+# code → label cho filter / chart của dashboard
+with open(LABELS_OUTPUT, "w", encoding="utf-8") as f:
+    json.dump(dimension_labels(), f, ensure_ascii=False, indent=2)
+
 print("Done")
@@ -0,0 +1,254 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from scrapers.dimensions import fold_text
+
+INPUT_FILE = "processed_data/normalized_jobs.jsonl"
+
+NUM_PERM = 128
+BANDS = 16  # 16 band x 8 row → ngưỡng LSH ≈ (1/16)^(1/8) ≈ 0.71
+SHINGLE_SIZE = 3
+THRESHOLD = 0.7
+
+# Hash (a * x + b) mod p, x < 2^32, a / b < 2^31 → không tràn uint64
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# =========================
+# Text → shingles
+# =========================
+
+
+def job_text(job: Dict) -> str:
+    parts = [job.get("title"), job.get("company"), job.get("description")]
+    return " ".join(str(p) for p in parts if p)
+
+
+def shingle_hashes(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """Word k-gram → crc32 (uint64 để nhân với hệ số hash)."""
+    words = _WORD_RE.findall(fold_text(text))
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+
+    if len(words) < k:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i : i + k]) for i in range(len(words) - k + 1)}
+
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+# =========================
+# MinHash
+# =========================
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, 1 << 31, size=(num_perm, 1)).astype(np.uint64)
+        self.b = rng.randint(0, 1 << 31, size=(num_perm, 1)).astype(np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> Optional[np.ndarray]:
+        """(num_perm,) uint32, None nếu không có shingle nào."""
+        if not hashes.size:
+            return None
+        permuted = (self.a * hashes[None, :] + self.b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+# =========================
+# LSH + union-find
+# =========================
+
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = np.arange(n)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x: int, y: int) -> bool:
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry:
+            return False
+        self.parent[max(rx, ry)] = min(rx, ry)
+        return True
+
+
+def lsh_clusters(
+    signatures: np.ndarray,
+    valid: np.ndarray,
+    bands: int = BANDS,
+    threshold: float = THRESHOLD,
+    max_reps: int = 50,
+) -> UnionFind:
+    """
+    Gom job trùng: cùng bucket ở ≥ 1 band → ứng viên → kiểm tra Jaccard
+    ước lượng (tỷ lệ minhash trùng) ≥ threshold → union.
+
+    Trong 1 bucket chỉ so với tối đa max_reps "đại diện" (không so từng cặp)
+    → bucket lớn (job template giống hệt nhau) vẫn gần tuyến tính.
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    uf = UnionFind(n)
+    indices = np.flatnonzero(valid)
+
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        buckets = defaultdict(list)
+        for i in indices:
+            buckets[block[i].tobytes()].append(i)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+
+            reps: List[int] = []
+            for i in members:
+                for rep in reps:
+                    if uf.find(i) == uf.find(rep):
+                        break
+                    similarity = np.mean(signatures[i] == signatures[rep])
+                    if similarity >= threshold:
+                        uf.union(i, rep)
+                        break
+                else:
+                    if len(reps) < max_reps:
+                        reps.append(i)
+
+    return uf
+
+
+def cluster_ids(jobs_keys: List[str], uf: UnionFind) -> List[str]:
+    """cluster_id ổn định giữa các lần chạy: hash của key nhỏ nhất trong cluster."""
+    roots = [uf.find(i) for i in range(len(jobs_keys))]
+
+    smallest: Dict[int, str] = {}
+    for root, key in zip(roots, jobs_keys):
+        if root not in smallest or key < smallest[root]:
+            smallest[root] = key
+
+    return [
+        "c_" + hashlib.sha1(smallest[root].encode("utf-8")).hexdigest()[:12]
+        for root in roots
+    ]
+
+
+# =========================
+# IO
+# =========================
+
+
+def iter_jobs(path: str) -> Iterator[Dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def dedup_file(
+    path: str,
+    num_perm: int = NUM_PERM,
+    bands: int = BANDS,
+    threshold: float = THRESHOLD,
+) -> Dict:
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) phải chia hết cho bands ({bands})")
+
+    started = time.monotonic()
+    hasher = MinHasher(num_perm)
+
+    # Pass 1: signature (chỉ giữ signature + key, không giữ cả job)
+    signatures, valid, keys, platforms = [], [], [], []
+    for idx, job in enumerate(iter_jobs(path)):
+        sig = hasher.signature(shingle_hashes(job_text(job)))
+        signatures.append(sig if sig is not None else np.zeros(num_perm, np.uint32))
+        valid.append(sig is not None)
+        keys.append(job.get("job_url") or f"#{idx}")
+        platforms.append(job.get("platform"))
+
+    if not keys:
+        return {"jobs": 0}
+
+    signatures = np.vstack(signatures)
+    uf = lsh_clusters(signatures, np.array(valid), bands, threshold)
+    ids = cluster_ids(keys, uf)
+
+    # Pass 2: ghi cluster_id, giữ nguyên thứ tự dòng (merge.py zip theo dòng)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for job, cluster_id in zip(iter_jobs(path), ids):
+            job["cluster_id"] = cluster_id
+            out.write(json.dumps(job, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+    sizes = Counter(ids)
+    cluster_platforms = defaultdict(set)
+    for cluster_id, platform in zip(ids, platforms):
+        cluster_platforms[cluster_id].add(platform)
+
+    return {
+        "jobs": len(ids),
+        "clusters": len(sizes),
+        "duplicates": len(ids) - len(sizes),
+        "largest_cluster": max(sizes.values()),
+        "cross_platform_clusters": sum(
+            1 for p in cluster_platforms.values() if len(p) > 1
+        ),
+        "seconds": round(time.monotonic() - started, 2),
+    }
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Gán cluster_id cho job trùng (MinHash + LSH) vào normalized_jobs"
+    )
+    parser.add_argument("--input", default=INPUT_FILE)
+    parser.add_argument("--num-perm", type=int, default=NUM_PERM)
+    parser.add_argument("--bands", type=int, default=BANDS)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="Jaccard ước lượng tối thiểu để coi là cùng 1 job",
+    )
+    args = parser.parse_args()
+
+    stats = dedup_file(args.input, args.num_perm, args.bands, args.threshold)
+    print(f"✅ Dedup completed | {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from typing import Dict
+
+from scrapers.dimensions import (
+    CITY_LABELS,
+    ROLE_LABELS,
+    SENIORITY_LABELS,
+    UNKNOWN,
+    dimension_codes,
+)
+
+INPUT_FILE = "processed_data/normalized_jobs.jsonl"
+
+
+def enrich_file(path: str) -> Dict:
+    """
+    Thêm city / role / seniority (int code, xem scrapers/dimensions.py) vào
+    từng job. Ghi lại tại chỗ, giữ nguyên thứ tự dòng (merge.py zip theo dòng).
+    """
+    started = time.monotonic()
+    counts = {"city": Counter(), "role": Counter(), "seniority": Counter()}
+    total = 0
+
+    tmp_path = f"{path}.tmp"
+    with open(path, encoding="utf-8") as fin, open(
+        tmp_path, "w", encoding="utf-8"
+    ) as out:
+        for line in fin:
+            if not line.strip():
+                continue
+
+            job = json.loads(line)
+            codes = dimension_codes(job)
+            job.update(codes)
+            out.write(json.dumps(job, ensure_ascii=False) + "\n")
+
+            for name, code in codes.items():
+                counts[name][code] += 1
+            total += 1
+
+    os.replace(tmp_path, path)
+
+    return {
+        "jobs": total,
+        "unknown": {name: c[UNKNOWN] for name, c in counts.items()},
+        "top_cities": {CITY_LABELS[k]: n for k, n in counts["city"].most_common(5)},
+        "top_roles": {ROLE_LABELS[k]: n for k, n in counts["role"].most_common(5)},
+        "seniority": {
+            SENIORITY_LABELS[k]: n for k, n in counts["seniority"].most_common()
+        },
+        "seconds": round(time.monotonic() - started, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Gán city / role / seniority code (int) vào normalized_jobs"
+    )
+    parser.add_argument("--input", default=INPUT_FILE)
+    args = parser.parse_args()
+
+    stats = enrich_file(args.input)
+    print(f"✅ Dimension enrichment completed | {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,18 @@ INPUT_FILE = "processed_data/job_skills_flat.jsonl"
 OUTPUT_FILE = "processed_data/job_skills_flat.csv"
 
 
-FIELDS = ["platform", "job_url", "title", "company", "location", "skill"]
+FIELDS = [
+    "platform",
+    "job_url",
+    "title",
+    "company",
+    "location",
+    "city",
+    "role",
+    "seniority",
+    "cluster_id",
+    "skill",
+]
 
 
 def export_csv():
@@ -31,6 +42,10 @@ def export_csv():
                     "title": item.get("title"),
                     "company": item.get("company"),
                     "location": item.get("location"),
+                    "city": item.get("city"),
+                    "role": item.get("role"),
+                    "seniority": item.get("seniority"),
+                    "cluster_id": item.get("cluster_id"),
                     "skill": item.get("skill"),
                 }
             )
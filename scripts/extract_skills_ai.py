@@ -1,9 +1,22 @@
+import argparse
+import asyncio
 import json
 import os
 import hashlib
+import random
 import time
+from typing import Dict, List, Optional, Tuple
+
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    OpenAI,
+    RateLimitError,
+)
+
+from scrapers.rate_limiter import parse_retry_after
 
 # =========================
 # CONFIG
@@ -17,8 +30,37 @@ MODEL_NAME = "gpt-4.1-mini"
 MAX_AI_CALLS = float("inf")
 SLEEP_BETWEEN_CALLS = 1
 
+# Async mode: số request đồng thời + budget theo tier của API key
+CONCURRENCY = 8
+REQUESTS_PER_MINUTE = 500
+TOKENS_PER_MINUTE = 200_000
+MAX_RETRIES = 6
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+# Ước lượng token trước khi gửi (tiếng Việt ~3 ký tự / token) + phần trả lời
+CHARS_PER_TOKEN = 3
+COMPLETION_TOKENS = 200
+
+# Batch mode: nhiều job / request, giới hạn theo token prompt và số job
+BATCH_TOKENS = 8_000
+BATCH_SIZE = 20
+BATCH_COMPLETION_TOKENS = 60  # / job
+# Id của job trong batch = đầu md5 của text → ổn định giữa các lần chạy
+ID_CHARS = 8
+
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# OPENAI_BASE_URL (nếu có) được SDK tự đọc → trỏ sang server giả lập để test
+_client: Optional[OpenAI] = None
+
+
+def get_client() -> OpenAI:
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
 
 # =========================
 # PROMPT
@@ -64,28 +106,71 @@ def text_hash(text: str) -> str:
     return hashlib.md5(text.encode("utf-8")).hexdigest()
 
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+def journal_path(cache_file: str) -> str:
+    return f"{cache_file}.journal"
 
 
-def save_cache(cache):
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+def load_cache(cache_file: str = CACHE_FILE) -> Dict[str, list]:
+    """
+    skill_cache.json + journal (các kết quả async chưa gộp, do lần chạy
+    trước bị dừng giữa chừng) → không gọi lại AI cho job đã có kết quả.
+    """
+    cache = {}
+    if os.path.exists(cache_file):
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+
+    journal = journal_path(cache_file)
+    if os.path.exists(journal):
+        with open(journal, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # dòng cuối ghi dở khi bị kill
+                cache[entry["hash"]] = entry["skills"]
+
+    return cache
+
+
+def save_cache(cache, cache_file: str = CACHE_FILE):
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    tmp_path = f"{cache_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(cache, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, cache_file)
 
+    # Đã gộp vào cache → journal không còn cần
+    journal = journal_path(cache_file)
+    if os.path.exists(journal):
+        os.remove(journal)
 
-def call_ai_extract(text: str) -> list:
-    prompt = f"""
-Extract technical skills from the text below.
 
-Rules:
+SKILL_RULES = """Rules:
 - Extract tools, technologies, platforms, programming languages, frameworks
 - Ignore soft skills
 - Ignore responsibilities
-- Normalize names (Python3 → Python, JS → JavaScript)
+- Normalize names (Python3 → Python, JS → JavaScript)"""
+
+BATCH_HEADER = f"""
+Extract technical skills from EACH job below, independently of the others.
+
+{SKILL_RULES}
+
+Each job starts with a line "### JOB <id>".
+
+Return ONE JSON object only, mapping every job id to its skill array:
+{{"<id>": ["Skill A", "Skill B"], "<other id>": []}}
+
+Jobs:
+"""
+
+
+def build_messages(text: str) -> List[Dict[str, str]]:
+    prompt = f"""
+Extract technical skills from the text below.
+
+{SKILL_RULES}
 
 Text:
 {text}
@@ -93,51 +178,459 @@ Text:
 Return JSON array only:
 ["Skill A", "Skill B"]
 """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
 
-    resp = client.chat.completions.create(
-        model=MODEL_NAME,
-        temperature=0,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-    )
 
+def build_batch_messages(batch: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """batch: [(job_id, text), ...] → 1 request, trả lời {job_id: [skill]}."""
+    jobs = "\n\n".join(f"### JOB {job_id}\n{text}" for job_id, text in batch)
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": BATCH_HEADER + jobs},
+    ]
+
+
+def parse_skills(content: Optional[str]) -> list:
     try:
-        data = json.loads(resp.choices[0].message.content)
+        data = json.loads(content)
         return data if isinstance(data, list) else []
     except Exception:
         return []
 
 
+def parse_batch(content: Optional[str], ids: List[str]) -> Dict[str, list]:
+    """
+    Chỉ giữ các id có trong batch với giá trị là list chuỗi.
+    Id thiếu / sai kiểu (hoặc cả response không phải JSON) → không có trong kết quả.
+    """
+    try:
+        data = json.loads(content)
+    except Exception:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    results = {}
+    for job_id in ids:
+        skills = data.get(job_id)
+        if isinstance(skills, list) and all(isinstance(s, str) for s in skills):
+            results[job_id] = skills
+    return results
+
+
+def estimate_tokens(
+    messages: List[Dict[str, str]], completion: int = COMPLETION_TOKENS
+) -> int:
+    chars = sum(len(m["content"]) for m in messages)
+    return chars // CHARS_PER_TOKEN + completion
+
+
+def call_ai_extract(text: str) -> list:
+    resp = get_client().chat.completions.create(
+        model=MODEL_NAME,
+        temperature=0,
+        messages=build_messages(text),
+    )
+    return parse_skills(resp.choices[0].message.content)
+
+
 # =========================
-# MAIN
+# ASYNC: budget rpm / tpm
 # =========================
 
 
-def main():
-    cache = load_cache()
-    ai_calls = 0
+class _Bucket:
+    """Token bucket / phút, cho phép nợ (level âm) như HostRateLimiter."""
 
-    with open(INPUT_FILE, encoding="utf-8") as f:
-        jobs = [json.loads(line) for line in f]
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate)  # burst tối đa ~1 giây
+        self.level = self.capacity
+        self.updated = time.monotonic()
 
-    results = []
+    def reserve(self, amount: float, now: float) -> float:
+        """Trừ `amount`, trả về số giây cần chờ để trả hết nợ."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= amount
+        return -self.level / self.rate if self.level < 0 else 0.0
+
+
+class RequestBudget:
+    """
+    Giới hạn requests / phút và tokens / phút cho mọi coroutine.
+
+    - acquire(tokens): giữ chỗ trước khi gửi (token ước lượng)
+    - settle(): bù chênh lệch khi response có usage thật
+    - pause(): 429 → cả nhóm tạm dừng, không chỉ coroutine bị từ chối
+    """
 
-    for job in jobs:
-        text = build_text(job)
-        if not text.strip():
+    def __init__(self, rpm: float, tpm: float):
+        self._requests = _Bucket(rpm)
+        self._tokens = _Bucket(tpm)
+        self._paused_until = 0.0
+
+    async def acquire(self, tokens: int):
+        # Không có await giữa các bước → an toàn trong 1 event loop
+        now = time.monotonic()
+        wait = max(
+            self._requests.reserve(1, now),
+            self._tokens.reserve(tokens, now),
+            self._paused_until - now,
+        )
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def settle(self, estimated: int, actual: int):
+        self._tokens.level += estimated - actual
+
+    def pause(self, seconds: float):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _backoff(attempt: int, retry_after: Optional[float]) -> float:
+    delay = min(MAX_BACKOFF, BASE_BACKOFF * 2**attempt) * random.uniform(0.5, 1.5)
+    return max(delay, retry_after or 0.0)
+
+
+async def _chat_async(
+    client: AsyncOpenAI,
+    messages: List[Dict[str, str]],
+    estimated: int,
+    budget: RequestBudget,
+    stats: Dict[str, int],
+    max_retries: int = MAX_RETRIES,
+    **params,
+) -> Optional[str]:
+    """
+    1 chat completion, có retry + backoff cho 429 / 5xx / lỗi mạng.
+    Hết lượt retry hoặc lỗi không retry được (400, 401, ...) → None.
+    """
+    for attempt in range(max_retries + 1):
+        await budget.acquire(estimated)
+        try:
+            resp = await client.chat.completions.create(
+                model=MODEL_NAME,
+                temperature=0,
+                messages=messages,
+                **params,
+            )
+        except (APIStatusError, APIConnectionError) as e:
+            status = getattr(e, "status_code", None)
+            retryable = status is None or status == 429 or status >= 500
+            if not retryable or attempt == max_retries:
+                print(f"❌ AI call failed ({status or type(e).__name__}): {e}")
+                return None
+
+            response = getattr(e, "response", None)
+            headers = response.headers if response is not None else {}
+            delay = _backoff(attempt, parse_retry_after(headers.get("retry-after")))
+            stats["retries"] += 1
+            if isinstance(e, RateLimitError):
+                stats["rate_limited"] += 1
+                budget.pause(delay)
+            await asyncio.sleep(delay)
             continue
 
-        h = text_hash(text)
+        usage = getattr(resp, "usage", None)
+        budget.settle(estimated, usage.total_tokens if usage else estimated)
+        stats["ai_calls"] += 1
+        return resp.choices[0].message.content
+
+    return None
+
+
+async def call_ai_extract_async(
+    client: AsyncOpenAI,
+    text: str,
+    budget: RequestBudget,
+    stats: Dict[str, int],
+    max_retries: int = MAX_RETRIES,
+) -> Optional[list]:
+    """Như call_ai_extract; None = gọi thất bại (không cache)."""
+    messages = build_messages(text)
+    content = await _chat_async(
+        client, messages, estimate_tokens(messages), budget, stats, max_retries
+    )
+    return None if content is None else parse_skills(content)
+
+
+async def call_ai_extract_batch(
+    client: AsyncOpenAI,
+    batch: List[Tuple[str, str]],
+    budget: RequestBudget,
+    stats: Dict[str, int],
+    max_retries: int = MAX_RETRIES,
+) -> Optional[Dict[str, list]]:
+    """
+    batch: [(hash, text), ...] → {hash: skills} cho các job trả lời hợp lệ.
+    None = cả request thất bại sau khi retry.
+    """
+    ids = {job_id(h, batch): h for h, _ in batch}
+    messages = build_batch_messages([(i, text) for i, (_, text) in zip(ids, batch)])
+    estimated = estimate_tokens(messages, BATCH_COMPLETION_TOKENS * len(batch))
+
+    content = await _chat_async(
+        client,
+        messages,
+        estimated,
+        budget,
+        stats,
+        max_retries,
+        response_format={"type": "json_object"},
+    )
+    if content is None:
+        return None
+
+    stats["batches"] += 1
+    parsed = parse_batch(content, list(ids))
+    return {ids[i]: skills for i, skills in parsed.items()}
+
+
+# =========================
+# BATCH: đóng gói job
+# =========================
+
+
+def job_id(h: str, batch: List[Tuple[str, str]]) -> str:
+    """ID_CHARS ký tự đầu của hash; trùng với job khác trong batch → cả hash."""
+    short = h[:ID_CHARS]
+    if any(other != h and other[:ID_CHARS] == short for other, _ in batch):
+        return h
+    return short
+
 
+def make_batches(
+    misses: Dict[str, str],
+    batch_tokens: int = BATCH_TOKENS,
+    batch_size: int = BATCH_SIZE,
+) -> List[List[Tuple[str, str]]]:
+    """
+    Gom các text (theo thứ tự input) thành batch ≤ batch_tokens token prompt
+    và ≤ batch_size job. Text một mình đã vượt budget → batch 1 job.
+    batch_tokens <= 0 → mỗi job 1 request.
+    """
+    if batch_tokens <= 0 or batch_size <= 1:
+        return [[item] for item in misses.items()]
+
+    overhead = len(SYSTEM_PROMPT + BATCH_HEADER) // CHARS_PER_TOKEN
+    batches: List[List[Tuple[str, str]]] = []
+    current: List[Tuple[str, str]] = []
+    tokens = overhead
+
+    for h, text in misses.items():
+        cost = len(text) // CHARS_PER_TOKEN + 10  # + dòng "### JOB <id>"
+        if current and (tokens + cost > batch_tokens or len(current) >= batch_size):
+            batches.append(current)
+            current, tokens = [], overhead
+        current.append((h, text))
+        tokens += cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# =========================
+# ASYNC: runner
+# =========================
+
+
+class OrderedWriter:
+    """
+    Ghi kết quả ra file ngay khi có, nhưng vẫn theo đúng thứ tự input
+    (normalize_skills / merge.py ghép theo dòng): job chưa xong chặn các
+    job phía sau, các job sau chờ trong bộ nhớ.
+    """
+
+    def __init__(self, path: str, entries: List[Tuple[dict, str]]):
+        self.entries = entries
+        self.next_index = 0
+        self.written = 0
+        self.file = open(path, "w", encoding="utf-8")
+
+    def flush(self, cache: Dict[str, list], failed: set):
+        while self.next_index < len(self.entries):
+            job, h = self.entries[self.next_index]
+            if h in cache:
+                skills = cache[h]
+            elif h in failed:
+                skills = []  # lần chạy sau sẽ gọi lại (không có trong cache)
+            else:
+                break
+
+            record = {"title": job.get("title"), "skills": skills}
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.next_index += 1
+            self.written += 1
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+async def extract_async(
+    entries: List[Tuple[dict, str]],
+    misses: Dict[str, str],
+    cache: Dict[str, list],
+    output: str,
+    cache_file: str,
+    concurrency: int = CONCURRENCY,
+    rpm: float = REQUESTS_PER_MINUTE,
+    tpm: float = TOKENS_PER_MINUTE,
+    max_retries: int = MAX_RETRIES,
+    batch_tokens: int = 0,
+    batch_size: int = BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    `concurrency` worker lấy việc từ queue → luôn có tối đa N request đang bay,
+    nhịp gửi do RequestBudget quyết định (không sleep cố định sau mỗi call).
+    Mỗi kết quả được append vào journal của cache ngay khi về.
+
+    batch_tokens > 0 → nhiều job / request (make_batches); job bị thiếu / sai
+    trong response được đưa lại vào queue dưới dạng request 1 job.
+    """
+    # SDK tự retry → tắt, để retry / backoff đi qua RequestBudget
+    client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+    budget = RequestBudget(rpm, tpm)
+    stats = {
+        "ai_calls": 0,
+        "batches": 0,
+        "split_retries": 0,
+        "retries": 0,
+        "rate_limited": 0,
+        "failed": 0,
+    }
+    failed: set = set()
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for batch in make_batches(misses, batch_tokens, batch_size):
+        queue.put_nowait(batch)
+
+    writer = OrderedWriter(output, entries)
+    writer.flush(cache, failed)
+
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    journal = open(journal_path(cache_file), "a", encoding="utf-8")
+
+    started = time.monotonic()
+    done = 0
+
+    def record(results: Dict[str, list], lost: List[str]):
+        nonlocal done
+        for h, skills in results.items():
+            cache[h] = skills
+            entry = {"hash": h, "skills": skills}
+            journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        journal.flush()
+
+        failed.update(lost)
+        stats["failed"] += len(lost)
+        writer.flush(cache, failed)
+
+        before = done
+        done += len(results) + len(lost)
+        if done // 50 > before // 50 or done == len(misses):
+            per_minute = done / max(time.monotonic() - started, 1e-9) * 60
+            print(
+                f"⏳ {done}/{len(misses)} | {per_minute:.0f} jobs/min | "
+                f"requests: {stats['ai_calls']} | retries: {stats['retries']}"
+            )
+
+    async def process(batch: List[Tuple[str, str]]):
+        if len(batch) == 1:
+            h, text = batch[0]
+            skills = await call_ai_extract_async(
+                client, text, budget, stats, max_retries
+            )
+            if skills is None:
+                record({}, [h])
+            else:
+                record({h: skills}, [])
+            return
+
+        results = await call_ai_extract_batch(client, batch, budget, stats, max_retries)
+        if results is None:
+            record({}, [h for h, _ in batch])
+            return
+
+        missing = [item for item in batch if item[0] not in results]
+        for item in missing:
+            queue.put_nowait([item])
+        stats["split_retries"] += len(missing)
+        record(results, [])
+
+    async def worker():
+        while True:
+            batch = await queue.get()
+            try:
+                await process(batch)
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    joined = asyncio.create_task(queue.join())
+    try:
+        finished, _ = await asyncio.wait(
+            [joined, *workers], return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in finished:
+            task.result()  # worker chỉ dừng khi có lỗi → raise lỗi đó
+    finally:
+        for task in [joined, *workers]:
+            task.cancel()
+        await asyncio.gather(joined, *workers, return_exceptions=True)
+        journal.close()
+        writer.close()
+        await client.close()
+
+    stats["jobs"] = writer.written
+    stats["seconds"] = round(time.monotonic() - started, 2)
+    return stats
+
+
+# =========================
+# MAIN
+# =========================
+
+
+def load_entries(path: str) -> Tuple[List[Tuple[dict, str]], Dict[str, str]]:
+    """
+    (job, hash) cho mỗi job có text (bỏ job rỗng như bản tuần tự)
+    + {hash: text} của mọi text khác nhau.
+    """
+    entries = []
+    texts = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            text = build_text(job)
+            if not text.strip():
+                continue
+
+            h = text_hash(text)
+            texts.setdefault(h, text)
+            entries.append((job, h))
+    return entries, texts
+
+
+def run_sync(entries, texts, cache, output, cache_file):
+    ai_calls = 0
+    results = []
+
+    for job, h in entries:
         if h in cache:
             skills = cache[h]
         else:
 
-            skills = call_ai_extract(text)
+            skills = call_ai_extract(texts[h])
             cache[h] = skills
-            save_cache(cache)
+            save_cache(cache, cache_file)
 
             ai_calls += 1
             time.sleep(SLEEP_BETWEEN_CALLS)
@@ -150,13 +643,87 @@ def main():
             }
         )
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    with open(output, "w", encoding="utf-8") as f:
         for r in results:
             f.write(json.dumps(r, ensure_ascii=False) + "\n")
 
+    return {"jobs": len(results), "ai_calls": ai_calls}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Trích xuất technical skill từ normalized_jobs bằng OpenAI"
+    )
+    parser.add_argument("--input", default=INPUT_FILE)
+    parser.add_argument("--output", default=OUTPUT_FILE)
+    parser.add_argument("--cache", default=CACHE_FILE)
+    parser.add_argument(
+        "--mode",
+        choices=["async", "batch", "sync"],
+        default="async",
+        help="async: nhiều request đồng thời | batch: async + nhiều job / request "
+        "| sync: từng job, nghỉ 1s / call",
+    )
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--rpm", type=float, default=REQUESTS_PER_MINUTE)
+    parser.add_argument("--tpm", type=float, default=TOKENS_PER_MINUTE)
+    parser.add_argument("--max-retries", type=int, default=MAX_RETRIES)
+    parser.add_argument(
+        "--batch-tokens",
+        type=int,
+        default=BATCH_TOKENS,
+        help="Batch mode: token prompt tối đa / request",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="Batch mode: số job tối đa / request",
+    )
+    args = parser.parse_args()
+
+    cache = load_cache(args.cache)
+    entries, texts = load_entries(args.input)
+
+    if args.mode == "sync":
+        stats = run_sync(entries, texts, cache, args.output, args.cache)
+    else:
+        misses = {h: t for h, t in texts.items() if h not in cache}
+        print(
+            f"🚀 {len(entries)} jobs | {len(misses)} cần gọi AI | "
+            f"mode={args.mode} concurrency={args.concurrency} "
+            f"rpm={args.rpm:g} tpm={args.tpm:g}"
+        )
+        stats = asyncio.run(
+            extract_async(
+                entries,
+                misses,
+                cache,
+                args.output,
+                args.cache,
+                concurrency=args.concurrency,
+                rpm=args.rpm,
+                tpm=args.tpm,
+                max_retries=args.max_retries,
+                batch_tokens=args.batch_tokens if args.mode == "batch" else 0,
+                batch_size=args.batch_size,
+            )
+        )
+        save_cache(cache, args.cache)
+
     print("✅ DONE")
-    print(f"Jobs processed: {len(results)}")
-    print(f"AI calls used: {ai_calls}")
+    print(f"Jobs processed: {stats['jobs']}")
+    print(f"AI calls used: {stats['ai_calls']}")
+    if args.mode != "sync":
+        if args.mode == "batch":
+            print(
+                f"Batches: {stats['batches']} | "
+                f"Retried individually: {stats['split_retries']}"
+            )
+        print(
+            f"Retries: {stats['retries']} (rate limited: {stats['rate_limited']}) | "
+            f"Failed: {stats['failed']} | {stats['seconds']}s"
+        )
 
 
 if __name__ == "__main__":
@@ -32,6 +32,12 @@ def flatten_jobs():
                     "title": job.get("title"),
                     "company": job.get("company"),
                     "location": job.get("location"),
+                    # int code (enrich_dimensions.py), 0 = không rõ
+                    "city": job.get("city"),
+                    "role": job.get("role"),
+                    "seniority": job.get("seniority"),
+                    # cùng cluster = cùng 1 job đăng nhiều nơi (dedup_jobs.py)
+                    "cluster_id": job.get("cluster_id"),
                     "skill": skill.strip(),
                 }
 
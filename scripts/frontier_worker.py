@@ -0,0 +1,358 @@
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import socket
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from scrapers.fetch_router import FETCH_MODES
+from scrapers.frontier import Frontier, NewTask, Task
+from scrapers.logging_setup import LOG_FORMATS, configure_logging
+from scrapers.raw_writer import COMPRESSIONS, RawWriter
+from scrapers.telemetry import get_telemetry
+from scripts.run_raw_scraper import (
+    PLATFORMS,
+    RAW_DIR,
+    TELEMETRY_DIR,
+    build_page_url,
+    build_scraper,
+)
+
+logger = logging.getLogger(__name__)
+
+FRONTIER_URL = os.getenv("FRONTIER_URL", "sqlite:///raw_data/frontier.sqlite")
+
+
+# =========================
+# Seed
+# =========================
+
+
+def seed(frontier: Frontier, platforms: List[str], max_pages: int) -> int:
+    """List page 1 của mỗi platform (đã có trong frontier → bỏ qua)."""
+    new_tasks = []
+    for name in platforms:
+        _, base_url = PLATFORMS[name]
+        new_tasks.append(
+            NewTask(
+                name,
+                "list",
+                build_page_url(base_url, 1),
+                {"base_url": base_url, "page": 1, "max_pages": max_pages},
+            )
+        )
+    return frontier.enqueue(new_tasks)
+
+
+# =========================
+# Run 1 task
+# =========================
+
+
+def run_list_task(frontier: Frontier, scraper, task: Task) -> bool:
+    """List page → detail task cho từng job + list task page kế tiếp."""
+    job_list = scraper.scrape_job_list(task.url)
+
+    children = [
+        NewTask(
+            task.platform,
+            "detail",
+            urljoin(scraper.base_url, job["job_url"]),
+            {"job": job},
+        )
+        for job in job_list
+        if job.get("job_url")
+    ]
+
+    payload = task.payload
+    page = payload.get("page", 1)
+    max_pages = payload.get("max_pages") or 0
+
+    next_page = None
+    if children and (not max_pages or page < max_pages):
+        next_page = NewTask(
+            task.platform,
+            "list",
+            build_page_url(payload["base_url"], page + 1),
+            {**payload, "page": page + 1},
+        )
+
+    logger.info(
+        f"📄 {task.platform} page {page}: {len(children)} jobs",
+        extra={"platform": task.platform, "url": task.url},
+    )
+    return frontier.complete(task, children=children, next_page=next_page)
+
+
+def run_detail_task(frontier: Frontier, scraper, task: Task) -> bool:
+    detail = scraper.scrape_job_detail(task.url)
+
+    record = {
+        "platform": task.platform,
+        "job_list_item": task.payload.get("job") or {"job_url": task.url},
+        "job_detail": detail,
+        "timestamp": int(time.time()),
+    }
+    saved = frontier.complete(task, record=record)
+    if saved:
+        logger.info(
+            f"✔ Saved {task.url}", extra={"platform": task.platform, "url": task.url}
+        )
+    return saved
+
+
+TASK_RUNNERS = {"list": run_list_task, "detail": run_detail_task}
+
+
+# =========================
+# Worker loop
+# =========================
+
+
+def work(
+    frontier: Frontier,
+    worker_id: str,
+    platforms: Optional[List[str]] = None,
+    kinds: Optional[List[str]] = None,
+    scraper_options: Optional[dict] = None,
+    idle_sleep: float = 2.0,
+    exit_when_empty: bool = True,
+    max_tasks: int = 0,
+) -> Dict[str, int]:
+    """
+    Lease → chạy scraper → complete / fail, tới khi frontier hết việc
+    (exit_when_empty) hoặc đủ max_tasks.
+    """
+    telemetry = get_telemetry()
+    scrapers = {}
+    stats = {"done": 0, "failed": 0, "lost": 0}
+
+    try:
+        while not max_tasks or stats["done"] + stats["failed"] < max_tasks:
+            task = frontier.lease(worker_id, kinds=kinds, platforms=platforms)
+            if task is None:
+                # Còn task leased ở worker khác → có thể sinh thêm task con
+                if exit_when_empty and not frontier.unfinished():
+                    break
+                time.sleep(idle_sleep)
+                continue
+
+            scraper = scrapers.get(task.platform)
+            if scraper is None:
+                scraper = build_scraper(task.platform, **(scraper_options or {}))
+                scrapers[task.platform] = scraper
+
+            log = {"platform": task.platform, "url": task.url}
+            try:
+                # Heartbeat: task chạy lâu hơn lease_seconds vẫn giữ lease
+                with frontier.heartbeat(task):
+                    with telemetry.timer(task.platform, f"task_{task.kind}"):
+                        completed = TASK_RUNNERS[task.kind](frontier, scraper, task)
+            except Exception as e:
+                logger.error(
+                    f"❌ Task {task.kind} failed (attempt {task.attempts}): {e}",
+                    extra=log,
+                )
+                frontier.fail(task, repr(e))
+                telemetry.incr(task.platform, "tasks_failed")
+                stats["failed"] += 1
+                continue
+
+            key = "done" if completed else "lost"
+            telemetry.incr(task.platform, f"tasks_{key}")
+            stats[key] += 1
+
+    finally:
+        for scraper in scrapers.values():
+            scraper.close()
+
+    return stats
+
+
+def _work_process(
+    db_url: str,
+    worker_id: str,
+    work_options: dict,
+    frontier_options: dict,
+    log_options: dict,
+    telemetry_dir: Optional[str],
+):
+    """Process con (spawn): frontier connection + scraper riêng."""
+    configure_logging(**log_options)
+    frontier = Frontier(db_url, **frontier_options)
+    try:
+        stats = work(frontier, worker_id, **work_options)
+        logger.info(f"🏁 {worker_id}: {stats}")
+    finally:
+        frontier.close()
+        if telemetry_dir:
+            get_telemetry().write(telemetry_dir, worker_id.replace(":", "_"))
+
+
+# =========================
+# Export sink → raw_data
+# =========================
+
+
+def export(
+    frontier: Frontier,
+    output_dir: str,
+    platforms: List[str],
+    raw_options: Optional[dict] = None,
+) -> Dict[str, int]:
+    """
+    Result chưa export → raw segment (cùng format run_raw_scraper).
+    Chỉ đánh dấu exported sau khi segment đã flush.
+    """
+    counts = {}
+
+    for platform in platforms:
+        flushed_ids: List[int] = []
+
+        def commit():
+            frontier.mark_exported(flushed_ids)
+            flushed_ids.clear()
+
+        total = 0
+        with RawWriter(
+            output_dir, platform, on_flush=commit, **(raw_options or {})
+        ) as writer:
+            for task_id, record in frontier.iter_results(platform):
+                # Thêm id trước: write có thể tự flush (→ commit) ngay bên trong
+                flushed_ids.append(task_id)
+                writer.write(record)
+                total += 1
+
+        counts[platform] = total
+        logger.info(f"📦 Export {platform}: {total} records → {output_dir}")
+
+    return counts
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Crawl phân tán qua frontier dùng chung (SQLite / Postgres)"
+    )
+    parser.add_argument(
+        "command",
+        choices=["seed", "work", "export", "stats"],
+    )
+    parser.add_argument(
+        "--db",
+        default=FRONTIER_URL,
+        help="SQLAlchemy URL (mặc định: $FRONTIER_URL hoặc SQLite trong raw_data)",
+    )
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=list(PLATFORMS),
+        default=list(PLATFORMS),
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=0,
+        help="seed: số list page tối đa / platform (0 = tới khi hết job mới)",
+    )
+    parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=["list", "detail"],
+        help="work: chỉ lấy task loại này",
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1, help="work: số worker process"
+    )
+    parser.add_argument("--max-tasks", type=int, default=0)
+    parser.add_argument(
+        "--keep-running",
+        action="store_true",
+        help="work: frontier hết việc vẫn chờ task mới",
+    )
+    parser.add_argument("--lease-seconds", type=float, default=300.0)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument(
+        "--host-interval",
+        type=float,
+        default=1.0,
+        help="Khoảng cách tối thiểu (giây) giữa 2 task cùng host, mọi worker cộng lại",
+    )
+    parser.add_argument("--fetch-mode", choices=FETCH_MODES, default="auto")
+    parser.add_argument("--output-dir", default=RAW_DIR)
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="gzip")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="text")
+    parser.add_argument("--telemetry-dir", default=TELEMETRY_DIR)
+    args = parser.parse_args()
+
+    log_options = {"level": args.log_level, "fmt": args.log_format}
+    configure_logging(**log_options)
+
+    frontier_options = {
+        "lease_seconds": args.lease_seconds,
+        "max_attempts": args.max_attempts,
+        "host_interval": args.host_interval,
+    }
+    frontier = Frontier(args.db, **frontier_options)
+
+    try:
+        if args.command == "seed":
+            added = seed(frontier, args.platforms, args.max_pages)
+            logger.info(f"🌱 Seeded {added} list tasks")
+
+        elif args.command == "stats":
+            for platform, counts in sorted(frontier.stats().items()):
+                logger.info(f"📊 {platform}: {counts}")
+
+        elif args.command == "export":
+            export(
+                frontier,
+                args.output_dir,
+                args.platforms,
+                raw_options={"compression": args.compression},
+            )
+
+        else:
+            work_options = {
+                "platforms": args.platforms,
+                "kinds": args.kinds,
+                "scraper_options": {"fetch_mode": args.fetch_mode},
+                "exit_when_empty": not args.keep_running,
+                "max_tasks": args.max_tasks,
+            }
+            host = socket.gethostname()
+
+            ctx = mp.get_context("spawn")
+            processes = [
+                ctx.Process(
+                    target=_work_process,
+                    args=(
+                        args.db,
+                        f"{host}:{os.getpid()}:{i}",
+                        work_options,
+                        frontier_options,
+                        log_options,
+                        args.telemetry_dir,
+                    ),
+                    name=f"frontier-worker-{i}",
+                )
+                for i in range(args.processes)
+            ]
+            for proc in processes:
+                proc.start()
+            for proc in processes:
+                proc.join()
+
+    finally:
+        frontier.close()
+
+
+if __name__ == "__main__":
+    main()
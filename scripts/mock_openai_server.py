@@ -0,0 +1,324 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import deque
+from typing import Iterable, Optional
+
+from aiohttp import web
+
+# =========================
+# CONFIG
+# =========================
+
+# Server giả lập /v1/chat/completions để test extract_skills_ai mà không tốn tiền:
+#   python -m scripts.mock_openai_server --rpm 300 --tpm 100000
+#   OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test \
+#       python -m scripts.extract_skills_ai --cache /tmp/skill_cache.json
+
+HOST = "127.0.0.1"
+PORT = 8765
+CHARS_PER_TOKEN = 4
+
+# "Model": chỉ nhận ra các skill có trong danh sách này (so khớp nguyên từ)
+KNOWN_SKILLS = [
+    "Python",
+    "Java",
+    "JavaScript",
+    "TypeScript",
+    "Golang",
+    "C#",
+    "C++",
+    "PHP",
+    "Ruby",
+    "Kotlin",
+    "Swift",
+    "Flutter",
+    "React",
+    "Angular",
+    "Vue",
+    "Node.js",
+    "Django",
+    "Spring Boot",
+    ".NET",
+    "Laravel",
+    "SQL",
+    "MySQL",
+    "PostgreSQL",
+    "MongoDB",
+    "Redis",
+    "Kafka",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Azure",
+    "GCP",
+    "Linux",
+    "Git",
+    "Jenkins",
+    "Terraform",
+    "Spark",
+    "Airflow",
+    "Power BI",
+    "Tableau",
+    "Selenium",
+]
+
+SKILL_RES = [
+    (skill, re.compile(rf"(?<![\w.+#]){re.escape(skill)}(?![\w+#])", re.IGNORECASE))
+    for skill in KNOWN_SKILLS
+]
+# Text của job nằm giữa "Text:" và "Return JSON" trong prompt
+TEXT_RE = re.compile(r"Text:\n(?P<text>.*)\n\nReturn JSON", re.DOTALL)
+# Batch prompt: mỗi job bắt đầu bằng "### JOB <id>"
+JOB_RE = re.compile(r"^### JOB (?P<id>\S+)\n(?P<text>.*?)(?=^### JOB |\Z)", re.M | re.S)
+
+
+def find_skills(text: str) -> list:
+    return [skill for skill, pattern in SKILL_RES if pattern.search(text)]
+
+
+def answer(prompt: str, drop_rate: float) -> str:
+    """
+    Prompt 1 job → JSON array. Batch prompt → JSON object {id: [skill]};
+    mỗi id có xác suất drop_rate bị bỏ sót hoặc trả sai kiểu (như model thật).
+    """
+    jobs = JOB_RE.findall(prompt)
+    if not jobs:
+        match = TEXT_RE.search(prompt)
+        return json.dumps(find_skills(match.group("text") if match else prompt))
+
+    result = {}
+    for job_id, text in jobs:
+        roll = random.random()
+        if roll < drop_rate / 2:
+            continue
+        result[job_id] = "n/a" if roll < drop_rate else find_skills(text)
+    return json.dumps(result)
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+# =========================
+# Rate limit (cửa sổ trượt 60s, như API thật)
+# =========================
+
+
+class SlidingWindow:
+    def __init__(self, rpm: float, tpm: float):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.events = deque()  # (time, tokens)
+        self.tokens = 0
+
+    def admit(self, tokens: int) -> float:
+        """0 nếu nhận request, ngược lại số giây nên chờ (Retry-After)."""
+        now = time.monotonic()
+        while self.events and now - self.events[0][0] >= 60:
+            self.tokens -= self.events.popleft()[1]
+
+        over_requests = self.rpm and len(self.events) + 1 > self.rpm
+        over_tokens = self.tpm and self.tokens + tokens > self.tpm
+        if over_requests or over_tokens:
+            oldest = self.events[0][0] if self.events else now
+            return max(0.1, 60 - (now - oldest))
+
+        self.events.append((now, tokens))
+        self.tokens += tokens
+        return 0.0
+
+
+# Cấu hình / trạng thái của server trong Application
+WINDOW = web.AppKey("window", SlidingWindow)
+LATENCY = web.AppKey("latency", float)
+TOKEN_LATENCY = web.AppKey("token_latency", float)
+ERROR_RATE = web.AppKey("error_rate", float)
+DROP_RATE = web.AppKey("drop_rate", float)
+FAULTS = web.AppKey("faults", deque)
+STATS = web.AppKey("stats", dict)
+
+
+# =========================
+# Handlers
+# =========================
+
+
+def error_response(status: int, message: str, kind: str, headers=None):
+    body = {"error": {"message": message, "type": kind, "code": kind}}
+    return web.json_response(body, status=status, headers=headers)
+
+
+async def chat_completions(request: web.Request) -> web.Response:
+    app = request.app
+    stats = app[STATS]
+    payload = await request.json()
+    messages = payload.get("messages") or []
+    prompt = "\n".join(m.get("content") or "" for m in messages)
+    prompt_tokens = count_tokens(prompt)
+
+    stats["requests"] += 1
+
+    # Lỗi theo kịch bản (test): N request đầu trả về đúng các status này
+    if app[FAULTS]:
+        status = app[FAULTS].popleft()
+        stats["faults"] += 1
+        if status == 429:
+            return error_response(
+                429,
+                "Rate limit reached",
+                "rate_limit_exceeded",
+                headers={"Retry-After": "0.01"},
+            )
+        return error_response(status, f"Scripted error {status}", "server_error")
+
+    wait = app[WINDOW].admit(prompt_tokens)
+    if wait:
+        stats["rate_limited"] += 1
+        return error_response(
+            429,
+            "Rate limit reached",
+            "rate_limit_exceeded",
+            headers={"Retry-After": f"{wait:.2f}"},
+        )
+
+    stats["in_flight"] += 1
+    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+    try:
+        content = answer(prompt, app[DROP_RATE])
+        completion_tokens = count_tokens(content)
+
+        # Latency = thời gian chờ cố định + thời gian sinh từng token trả lời
+        latency = app[LATENCY] + completion_tokens * app[TOKEN_LATENCY]
+        await asyncio.sleep(random.uniform(0.5 * latency, 1.5 * latency))
+
+        if random.random() < app[ERROR_RATE]:
+            stats["errors"] += 1
+            return error_response(500, "Simulated server error", "server_error")
+    finally:
+        stats["in_flight"] -= 1
+
+    stats["completed"] += 1
+    return web.json_response(
+        {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    )
+
+
+async def get_stats(request: web.Request) -> web.Response:
+    return web.json_response(request.app[STATS])
+
+
+def make_app(
+    rpm: float = 0,
+    tpm: float = 0,
+    latency: float = 0.5,
+    token_latency: float = 0.01,
+    error_rate: float = 0.0,
+    drop_rate: float = 0.0,
+    faults: Optional[Iterable[int]] = None,
+) -> web.Application:
+    """
+    rpm / tpm = 0 → không giới hạn.
+    faults: status trả về cho các request đầu tiên, vd [429, 500] (test retry).
+    """
+    app = web.Application()
+    app[WINDOW] = SlidingWindow(rpm, tpm)
+    app[LATENCY] = latency
+    app[TOKEN_LATENCY] = token_latency
+    app[ERROR_RATE] = error_rate
+    app[DROP_RATE] = drop_rate
+    app[FAULTS] = deque(faults or [])
+    app[STATS] = {
+        "requests": 0,
+        "completed": 0,
+        "rate_limited": 0,
+        "errors": 0,
+        "faults": 0,
+        "in_flight": 0,
+        "max_in_flight": 0,
+    }
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_get("/stats", get_stats)
+
+    async def print_stats(app):
+        print(f"📊 Mock stats: {app[STATS]}")
+
+    app.on_shutdown.append(print_stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Server giả lập OpenAI chat-completions (latency, 429, 5xx)"
+    )
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--rpm", type=float, default=0)
+    parser.add_argument("--tpm", type=float, default=0)
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Giây / request (±50%%)"
+    )
+    parser.add_argument(
+        "--token-latency",
+        type=float,
+        default=0.01,
+        help="Giây / token trả lời (batch lớn → trả lời lâu hơn)",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Tỉ lệ trả về 500"
+    )
+    parser.add_argument(
+        "--drop-rate",
+        type=float,
+        default=0.0,
+        help="Batch: tỉ lệ job bị thiếu / sai kiểu trong response",
+    )
+    parser.add_argument(
+        "--faults",
+        type=int,
+        nargs="*",
+        default=[],
+        help="Status trả về cho các request đầu tiên, vd: --faults 429 500",
+    )
+    args = parser.parse_args()
+
+    print(f"🧪 Mock OpenAI: http://{args.host}:{args.port}/v1")
+    web.run_app(
+        make_app(
+            args.rpm,
+            args.tpm,
+            args.latency,
+            args.token_latency,
+            args.error_rate,
+            args.drop_rate,
+            args.faults,
+        ),
+        host=args.host,
+        port=args.port,
+        print=None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,32 @@
+import argparse
+import hashlib
 import json
-import glob
 import os
-import re
-from typing import Any, List, Dict
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, List, Dict, Optional, Tuple
+
+from scrapers.job_dataset import DATASET_DIR, write_jobs
+from scrapers.raw_writer import iter_raw_files, iter_raw_lines
+from scrapers.salary import parse_salary, salary_records, salary_text
 
 RAW_DIR = "raw_data"
 OUTPUT_FILE = "processed_data/normalized_jobs.jsonl"
+STATE_FILE = "processed_data/normalize_state.json"
+
+# Mỗi chunk ~32MB raw → đủ lớn để overhead process không đáng kể
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# (path, start, end) — end=None: segment nén (không seek được), đọc từ đầu
+# và bỏ qua `start` byte (chưa nén) đầu tiên
+Chunk = Tuple[str, int, Optional[int]]
+
+# Số dòng / batch normalize (salary parse theo cả batch)
+BATCH_LINES = 10_000
+
+# Số byte đầu file dùng để nhận diện file (phát hiện file bị ghi đè / rotate)
+HEAD_BYTES = 4096
 
 
 # =========================
@@ -40,35 +61,10 @@ def normalize_text_list(field: Any) -> List[str]:
 
 def normalize_salary(salary_raw: Any) -> Dict[str, Any]:
     """
-    Chuẩn hoá salary về min / max / avg (VND)
+    Chuẩn hoá salary về type / min / max / avg + currency (VND / USD).
+    1 record; nhiều record → normalize_lines (parse cả batch 1 lần).
     """
-    salary = {"raw": None, "min": None, "max": None, "avg": None}
-
-    # itviec (object)
-    if isinstance(salary_raw, dict):
-        salary["raw"] = salary_raw.get("raw")
-        return salary
-
-    # string salary
-    if isinstance(salary_raw, str):
-        salary["raw"] = salary_raw
-
-        # Thoả thuận
-        if "thoả thuận" in salary_raw.lower():
-            return salary
-
-        # 22tr-24tr
-        numbers = re.findall(r"\d+", salary_raw)
-        values = [int(n) * 1_000_000 for n in numbers]
-
-        if len(values) >= 1:
-            salary["min"] = values[0]
-        if len(values) >= 2:
-            salary["max"] = values[1]
-        if salary["min"] and salary["max"]:
-            salary["avg"] = int((salary["min"] + salary["max"]) / 2)
-
-    return salary
+    return parse_salary(salary_text(salary_raw))
 
 
 # =========================
@@ -76,44 +72,393 @@ def normalize_salary(salary_raw: Any) -> Dict[str, Any]:
 # =========================
 
 
-def normalize_record(raw: Dict) -> Dict:
+def normalize_record(raw: Dict, salary: Optional[Dict] = None) -> Dict:
+    """salary: kết quả đã parse sẵn theo batch (None → parse riêng record này)."""
     job = raw.get("job_list_item", {})
     detail = raw.get("job_detail", {})
+    if salary is None:
+        salary = normalize_salary(job.get("salary"))
 
     return {
         "platform": raw.get("platform"),
         "title": job.get("title"),
         "company": job.get("company"),
         "location": job.get("location"),
+        "experience": job.get("experience"),
         "job_url": job.get("job_url"),
         "timestamp": raw.get("timestamp"),
-        "salary": normalize_salary(job.get("salary")),
+        "salary": salary,
         "description": detail.get("description"),
         "requirements": normalize_text_list(detail.get("requirements")),
         "benefits": normalize_text_list(detail.get("benefits")),
     }
 
 
+def normalize_lines(lines: List) -> List[str]:
+    """
+    Batch dòng raw (str / bytes) → dòng normalized (bỏ dòng JSON hỏng).
+    Salary của cả batch parse 1 lần (scrapers.salary, vectorized).
+    """
+    raws = []
+    for line in lines:
+        try:
+            raws.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+
+    salaries = salary_records(
+        salary_text((raw.get("job_list_item") or {}).get("salary")) for raw in raws
+    )
+    return [
+        json.dumps(normalize_record(raw, salary), ensure_ascii=False) + "\n"
+        for raw, salary in zip(raws, salaries)
+    ]
+
+
+# =========================
+# Chunking (byte range theo ranh giới dòng)
+# =========================
+
+
+def plan_chunks(
+    paths: List[str],
+    chunk_bytes: int = CHUNK_BYTES,
+    offsets: Optional[Dict[str, int]] = None,
+) -> List[Chunk]:
+    """
+    File .jsonl thường → các byte range ~chunk_bytes, bắt đầu / kết thúc ở
+    đầu dòng. Segment .gz / .zst → 1 chunk / file (đã bị giới hạn kích thước
+    bởi RawWriter).
+    offsets: path → watermark của lần chạy trước (chỉ đọc phần sau đó).
+    Thứ tự chunk = thứ tự file + offset → output giống hệt chạy tuần tự.
+    """
+    offsets = offsets or {}
+    chunks: List[Chunk] = []
+
+    for path in paths:
+        offset = offsets.get(path, 0)
+
+        if path.endswith((".gz", ".zst")):
+            chunks.append((path, offset, None))
+            continue
+
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            start = offset
+            while start < size:
+                end = start + chunk_bytes
+                if end >= size:
+                    end = size
+                else:
+                    # Kéo end tới hết dòng đang dở
+                    f.seek(end)
+                    f.readline()
+                    end = f.tell()
+                chunks.append((path, start, end))
+                start = end
+
+    return chunks
+
+
+def iter_chunk_lines(chunk: Chunk) -> Iterator[Tuple[Any, int]]:
+    """
+    Yield (dòng, watermark ngay sau dòng đó), chỉ dòng đầy đủ (có \\n).
+    Watermark: byte offset (file thường) / số byte chưa nén (segment nén).
+    """
+    path, start, end = chunk
+
+    if end is None:
+        consumed = 0
+        for line in iter_raw_lines(path):
+            consumed += len(line.encode("utf-8"))
+            if consumed > start:
+                yield line, consumed
+        return
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Tách theo b"\n" (không dùng splitlines: JSON có thể chứa \u2028...)
+    lines = data.split(b"\n")
+    # Phần sau \n cuối: rỗng, hoặc dòng đang ghi dở ở cuối file → bỏ
+    position = start
+    for line in lines[:-1]:
+        position += len(line) + 1
+        if line.strip():
+            yield line, position
+
+
+def normalize_chunk(task: Tuple[int, Chunk, str]) -> Tuple[str, int, int]:
+    """
+    Worker: normalize 1 chunk → part file riêng.
+    Trả về (part_path, số record, watermark sau dòng cuối đã đọc).
+    """
+    index, chunk, parts_dir = task
+    part_path = os.path.join(parts_dir, f"part-{index:06d}.jsonl")
+
+    count = 0
+    watermark = chunk[1]
+    batch = []
+    with open(part_path, "w", encoding="utf-8") as out:
+
+        def flush():
+            nonlocal count
+            normalized = normalize_lines(batch)
+            out.writelines(normalized)
+            count += len(normalized)
+            batch.clear()
+
+        for line, watermark in iter_chunk_lines(chunk):
+            batch.append(line)
+            if len(batch) >= BATCH_LINES:
+                flush()
+        flush()
+
+    return part_path, count, watermark
+
+
+# =========================
+# Run
+# =========================
+
+
+def normalize_chunks(
+    chunks: List[Chunk],
+    output_file: str,
+    workers: int = 1,
+    append: bool = False,
+) -> Tuple[int, Dict[str, int]]:
+    """
+    Chunk → (ProcessPool nếu workers > 1) → part files → nối theo thứ tự chunk.
+    map giữ thứ tự → nối được ngay khi part đầu tiên xong.
+
+    append=False → ghi file tạm rồi replace; append=True → nối vào cuối output.
+    Trả về (số record, path → watermark mới).
+    """
+    parts_dir = f"{output_file}.parts"
+    tmp_path = f"{output_file}.tmp"
+    os.makedirs(parts_dir, exist_ok=True)
+
+    total = 0
+    watermarks: Dict[str, int] = {}
+    tasks = [(i, chunk, parts_dir) for i, chunk in enumerate(chunks)]
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = (executor.map if executor else map)(normalize_chunk, tasks)
+
+        with open(output_file if append else tmp_path, "ab" if append else "wb") as out:
+            for (path, _, _), (part_path, count, watermark) in zip(chunks, results):
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+                os.remove(part_path)
+                total += count
+                watermarks[path] = watermark
+
+        if not append:
+            os.replace(tmp_path, output_file)
+    finally:
+        if executor:
+            executor.shutdown()
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return total, watermarks
+
+
+# =========================
+# Incremental state (watermark / file)
+# =========================
+
+
+def file_identity(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        head = f.read(HEAD_BYTES)
+    st = os.stat(path)
+    return {
+        "inode": st.st_ino,
+        "size": st.st_size,
+        "head_len": len(head),
+        "head": hashlib.sha1(head).hexdigest(),
+    }
+
+
+def same_file(path: str, previous: Dict[str, Any]) -> bool:
+    """Cùng file (chỉ được append): cùng inode, không nhỏ đi, đầu file không đổi."""
+    st = os.stat(path)
+    if st.st_ino != previous["inode"] or st.st_size < previous["size"]:
+        return False
+    with open(path, "rb") as f:
+        head = f.read(previous["head_len"])
+    return hashlib.sha1(head).hexdigest() == previous["head"]
+
+
+def load_state(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(path: str, state: Dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def plan_incremental(
+    files: List[str], state: Optional[Dict], output_file: str
+) -> Tuple[Optional[Dict[str, int]], str]:
+    """
+    (offsets, lý do). offsets=None → phải build lại toàn bộ.
+    File mới (segment mới) → đọc từ 0; file đã biết → đọc từ watermark.
+    """
+    if not state:
+        return None, "no state"
+    if state.get("output") != output_file or not os.path.exists(output_file):
+        return None, "output changed"
+
+    known = state.get("files", {})
+    removed = set(known) - set(files)
+    if removed:
+        return None, f"raw file removed: {sorted(removed)[0]}"
+
+    offsets = {}
+    for path in files:
+        previous = known.get(path)
+        if previous is None:
+            offsets[path] = 0
+        elif not same_file(path, previous):
+            return None, f"raw file rotated / rewritten: {path}"
+        elif os.path.getsize(path) == previous["size"]:
+            continue  # không có gì mới
+        else:
+            offsets[path] = previous["offset"]
+
+    return offsets, "incremental"
+
+
+def recover_pending_append(state: Optional[Dict]):
+    """Lần trước chết giữa lúc append → cắt output về kích thước trước đó."""
+    if not state or "pending_append" not in state:
+        return
+    pending = state.pop("pending_append")
+    output = state.get("output")
+    if output and os.path.exists(output) and os.path.getsize(output) > pending:
+        print(f"⚠️ Rollback append dở dang → {output} ({pending} bytes)")
+        with open(output, "r+b") as f:
+            f.truncate(pending)
+
+
+def iter_output_jobs(path: str, start: int = 0) -> Iterator[Dict]:
+    """Đọc lại normalized JSONL từ byte `start` (phần vừa append)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 # =========================
 # Main
 # =========================
 
 
 def main():
-    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    files = glob.glob(os.path.join(RAW_DIR, "*_raw.jsonl"))
+    parser = argparse.ArgumentParser(description="Normalize raw jobs → JSONL")
+    parser.add_argument("--raw-dir", default=RAW_DIR)
+    parser.add_argument("--output", default=OUTPUT_FILE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Số process normalize song song (1 = tuần tự)",
+    )
+    parser.add_argument(
+        "--chunk-mb",
+        type=int,
+        default=CHUNK_BYTES // (1024 * 1024),
+        help="Kích thước chunk (file .jsonl thường)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Chỉ normalize phần raw mới từ lần chạy trước (append vào output)",
+    )
+    parser.add_argument("--state", default=STATE_FILE)
+    parser.add_argument(
+        "--parquet-dir",
+        nargs="?",
+        const=DATASET_DIR,
+        help=f"Ghi thêm Parquet dataset (partition platform / crawl_date), "
+        f"mặc định {DATASET_DIR}",
+    )
+    args = parser.parse_args()
 
-    total = 0
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as out:
-        for file in files:
-            with open(file, encoding="utf-8") as f:
-                for line in f:
-                    raw = json.loads(line)
-                    norm = normalize_record(raw)
-                    out.write(json.dumps(norm, ensure_ascii=False) + "\n")
-                    total += 1
-
-    print(f"✅ Normalization completed | records: {total}")
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    # *_raw.jsonl cũ + segment nén *_raw-YYYYMMDD-NNN.jsonl.gz / .zst
+    files = iter_raw_files(args.raw_dir)
+    started = time.monotonic()
+
+    state = load_state(args.state)
+    recover_pending_append(state)
+
+    offsets, reason = None, "full run"
+    if args.incremental:
+        offsets, reason = plan_incremental(files, state, args.output)
+        if offsets is None:
+            print(f"🔁 Full rebuild ({reason})")
+
+    append = offsets is not None
+    todo = [path for path in files if not append or path in offsets]
+    # Identity lấy trước khi đọc → file được append trong lúc chạy vẫn an toàn
+    identities = {path: file_identity(path) for path in todo}
+    chunks = plan_chunks(todo, args.chunk_mb * 1024 * 1024, offsets)
+
+    new_state = {"output": args.output, "files": {}}
+    appended_from = 0
+    if append:
+        appended_from = os.path.getsize(args.output)
+        new_state["files"] = {p: v for p, v in state["files"].items() if p in files}
+        new_state["pending_append"] = appended_from
+    if args.parquet_dir:
+        # synced=False tới khi dataset ghi xong → chết giữa chừng thì lần sau build lại
+        new_state["dataset"] = {"root": args.parquet_dir, "synced": False}
+    save_state(args.state, new_state)
+
+    workers = args.workers if args.workers and args.workers > 1 else 1
+    total, watermarks = normalize_chunks(chunks, args.output, workers, append)
+
+    for path in todo:
+        offset = watermarks.get(path, (offsets or {}).get(path, 0))
+        new_state["files"][path] = {**identities[path], "offset": offset}
+    new_state.pop("pending_append", None)
+    save_state(args.state, new_state)
+
+    if args.parquet_dir:
+        previous = (state or {}).get("dataset") or {}
+        dataset_append = (
+            append
+            and previous == {"root": args.parquet_dir, "synced": True}
+            and os.path.isdir(args.parquet_dir)
+        )
+        start = appended_from if dataset_append else 0
+        rows = write_jobs(
+            iter_output_jobs(args.output, start), args.parquet_dir, dataset_append
+        )
+        new_state["dataset"]["synced"] = True
+        print(f"📦 Parquet dataset → {args.parquet_dir} (+{rows} rows)")
+
+    new_state["updated_at"] = int(time.time())
+    save_state(args.state, new_state)
+
+    print(
+        f"✅ Normalization completed ({reason}) | records: {total} | "
+        f"{time.monotonic() - started:.1f}s"
+    )
 
 
 if __name__ == "__main__":
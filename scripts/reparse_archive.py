@@ -0,0 +1,206 @@
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from scrapers.html_archive import ArchivedPage, HtmlArchive, read_blob
+from scrapers.itviec_scraper import ITviecScraper
+from scrapers.topcv_scraper import TopCVScraper
+from scrapers.vietnamworks_scraper import VietnamWorksScraper
+from scrapers.parsers import PARSER_BACKENDS
+from scrapers.raw_writer import COMPRESSIONS, RawWriter, iter_raw_files
+from scrapers.logging_setup import LOG_FORMATS, configure_logging
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "archive"
+OUTPUT_DIR = "raw_data_reparsed"
+
+SCRAPERS = {
+    "itviec": ITviecScraper,
+    "topcv": TopCVScraper,
+    "vietnamworks": VietnamWorksScraper,
+}
+
+# Mỗi process con giữ 1 scraper parse-only / platform
+_SCRAPERS: Dict[Tuple[str, str], object] = {}
+
+
+# =========================
+# Worker (process con)
+# =========================
+
+
+def get_parse_scraper(platform: str, parser: str):
+    """Scraper chỉ để parse (requests mode → không mở browser)."""
+    key = (platform, parser)
+    if key not in _SCRAPERS:
+        _SCRAPERS[key] = SCRAPERS[platform](use_selenium=False, parser=parser)
+    return _SCRAPERS[key]
+
+
+def parse_archived(task: Tuple[str, str, ArchivedPage]):
+    """
+    Parse 1 trang trong archive, không có network.
+    Trả về (url, result) — result=None nếu lỗi.
+    """
+    root, parser, page = task
+
+    try:
+        content = read_blob(root, page.sha256)
+        scraper = get_parse_scraper(page.platform, parser)
+
+        # VietnamWorks: JSON XHR search đã lưu nguyên
+        if page.kind == "list_payload":
+            jobs = []
+            for payload in json.loads(content):
+                jobs.extend(scraper.parse_search_payload(payload))
+            return page.url, jobs
+
+        soup = scraper._make_soup(content)
+        if page.kind == "list":
+            return page.url, scraper.parse_job_list(soup)
+        return page.url, scraper.parse_job_detail(soup, page.url)
+
+    except Exception as e:
+        logger.error(
+            f"❌ Re-parse failed {page.kind} {page.url}: {e}",
+            extra={"platform": page.platform, "url": page.url},
+        )
+        return page.url, None
+
+
+# =========================
+# Re-parse 1 platform
+# =========================
+
+
+def reparse_platform(
+    executor: ProcessPoolExecutor,
+    archive: HtmlArchive,
+    platform: str,
+    output_dir: str,
+    parser: str = "auto",
+    chunksize: int = 16,
+    raw_options: Optional[dict] = None,
+) -> Dict[str, int]:
+    # List page: mọi snapshot (page 1 mỗi ngày 1 danh sách job khác nhau),
+    # cũ → mới để card mới hơn ghi đè card cũ
+    lists: List[ArchivedPage] = list(
+        archive.iter_pages(platform, "list", latest_only=False)
+    )
+    lists += archive.iter_pages(platform, "list_payload", latest_only=False)
+    lists.sort(key=lambda p: p.fetched_at)
+    details = list(archive.iter_pages(platform, "detail"))
+
+    logger.info(f"🗄️ {platform}: {len(lists)} list pages, {len(details)} detail pages")
+
+    # job_url → job card (bản fetch sau ghi đè bản trước)
+    job_items = {}
+    list_tasks = [(archive.root, parser, page) for page in lists]
+    for _, jobs in executor.map(parse_archived, list_tasks, chunksize=chunksize):
+        for job in jobs or []:
+            if job.get("job_url"):
+                job_items[job["job_url"]] = job
+
+    if iter_raw_files(output_dir, platform):
+        logger.warning(
+            f"⚠️ {output_dir} đã có raw file của {platform} → segment mới ghi thêm"
+        )
+
+    stats = {"details": len(details), "saved": 0, "failed": 0, "orphan": 0}
+    detail_tasks = [(archive.root, parser, page) for page in details]
+
+    with RawWriter(output_dir, platform, **(raw_options or {})) as writer:
+        results = executor.map(parse_archived, detail_tasks, chunksize=chunksize)
+
+        # map giữ thứ tự → output theo thứ tự fetch
+        for page, (url, detail) in zip(details, results):
+            if detail is None:
+                stats["failed"] += 1
+                continue
+
+            job = job_items.get(url)
+            if job is None:
+                # Detail không có list page tương ứng trong archive
+                stats["orphan"] += 1
+                job = {"job_url": url}
+
+            writer.write(
+                {
+                    "platform": platform,
+                    "job_list_item": job,
+                    "job_detail": detail,
+                    "timestamp": int(page.fetched_at),
+                }
+            )
+            stats["saved"] += 1
+
+    return stats
+
+
+# =========================
+# Main
+# =========================
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-parse HTML trong archive → raw_data mới (không network)"
+    )
+    parser.add_argument("--archive", default=ARCHIVE_DIR)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=list(SCRAPERS),
+        default=list(SCRAPERS),
+    )
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Số process parse song song",
+    )
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="gzip")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default="text")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level, args.log_format)
+
+    if not os.path.exists(os.path.join(args.archive, "index.sqlite")):
+        logger.error(f"❌ Không tìm thấy archive: {args.archive}")
+        return
+
+    archive = HtmlArchive(args.archive)
+    started = time.monotonic()
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            for platform in args.platforms:
+                stats = reparse_platform(
+                    executor,
+                    archive,
+                    platform,
+                    args.output_dir,
+                    parser=args.parser,
+                    chunksize=args.chunksize,
+                    raw_options={"compression": args.compression},
+                )
+                logger.info(f"✅ {platform}: {stats}")
+    finally:
+        archive.close()
+
+    logger.info(
+        f"🎉 Re-parse xong trong {time.monotonic() - started:.1f}s → {args.output_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,79 @@
-import json
+import argparse
+import logging
+import multiprocessing as mp
 import os
+import queue
+import threading
 import time
+from typing import Callable, Optional
+
 from scrapers.itviec_scraper import ITviecScraper
 from scrapers.topcv_scraper import TopCVScraper
 from scrapers.vietnamworks_scraper import VietnamWorksScraper
+from scrapers.seen_index import SeenIndex
+from scrapers.http_cache import ResponseCache
+from scrapers.fetch_router import FETCH_MODES
+from scrapers.html_archive import HtmlArchive
+from scrapers.parsers import PARSER_BACKENDS
+from scrapers.checkpoint import CrawlCheckpoint
+from scrapers.raw_writer import COMPRESSIONS, RawWriter, iter_raw_files
+from scrapers.telemetry import get_telemetry
+from scrapers.logging_setup import LOG_FORMATS, configure_logging
+
+logger = logging.getLogger(__name__)
 
 RAW_DIR = "raw_data"
+TELEMETRY_DIR = "telemetry"
 os.makedirs(RAW_DIR, exist_ok=True)
 
+URL_ITVIEC = "https://itviec.com/it-jobs"
+URL_TOPCV = "https://www.topcv.vn/tim-viec-lam-cong-nghe-thong-tin-cr257?type_keyword=1&sba=1&category_family=r257&saturday_status=0"
+URL_VNW = "https://www.vietnamworks.com/viec-lam?g=5&ignoreLocation=true"
+
+# platform → (scraper class, category URL)
+PLATFORMS = {
+    "itviec": (ITviecScraper, URL_ITVIEC),
+    "topcv": (TopCVScraper, URL_TOPCV),
+    "vietnamworks": (VietnamWorksScraper, URL_VNW),
+}
+
+
+def build_scraper(
+    platform_name: str,
+    http_cache_dir: Optional[str] = None,
+    parser: str = "auto",
+    browser_profile: str = "default",
+    archive_dir: Optional[str] = None,
+    fetch_mode: str = "selenium",
+):
+    """
+    Tạo scraper cho platform (gọi được trong process con).
+    fetch_mode="auto": requests trước, chỉ mở Chrome cho trang thiếu nội dung.
+    """
+    scraper_cls, _ = PLATFORMS[platform_name]
+
+    cache = None
+    if http_cache_dir:
+        cache = ResponseCache(os.path.join(http_cache_dir, f"{platform_name}.sqlite"))
+
+    return scraper_cls(
+        fetch_mode=fetch_mode,
+        cache=cache,
+        parser=parser,
+        browser_profile=browser_profile,
+        archive=HtmlArchive(archive_dir) if archive_dir else None,
+    )
 
-def save_jsonl(path: str, data: dict):
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+def open_seen_index(platform_name: str) -> SeenIndex:
+    return SeenIndex(os.path.join(RAW_DIR, f"{platform_name}_seen.sqlite"))
+
+
+def build_page_url(base_url: str, page: int) -> str:
+    # 🔥 GIỮ NGUYÊN LOGIC NÀY
+    if page == 1:
+        return base_url
+    return f"{base_url}&page={page}" if "?" in base_url else f"{base_url}?page={page}"
 
 
 # ============================================================
@@ -22,56 +84,516 @@ def crawl_category_by_url(
     platform_name: str,
     base_url: str,
     target_jobs: int = 500,
+    progress: Optional[Callable[[dict], None]] = None,
+    seen_index: Optional[SeenIndex] = None,
+    stop_on_seen_page: bool = True,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    resume: bool = False,
+    raw_options: Optional[dict] = None,
 ):
-    print(f"\n============================")
-    print(f"📂 SCRAPING CATEGORY — {platform_name}")
-    print(f"🎯 TARGET JOBS: {target_jobs}")
-    print(f"============================\n")
+    """
+    Crawl category tới khi đủ target_jobs job MỚI.
 
-    output_file = os.path.join(RAW_DIR, f"{platform_name}_raw.jsonl")
+    seen_index: bỏ qua job_url đã crawl; nếu stop_on_seen_page thì dừng
+    phân trang khi 1 list page chỉ toàn job đã crawl.
+    checkpoint: lưu page / collected / in-flight sau mỗi bước;
+    resume=True → tiếp tục từ checkpoint chưa xong.
+    raw_options: tham số cho RawWriter (compression, max_segment_bytes, fsync...).
+    """
+    log = {"platform": platform_name}
+    telemetry = get_telemetry()
+    logger.info(
+        f"📂 SCRAPING CATEGORY — {platform_name} | 🎯 TARGET JOBS: {target_jobs}",
+        extra=log,
+    )
+
+    if seen_index is not None:
+        seen_index.bootstrap_from_raw(iter_raw_files(RAW_DIR, platform_name))
 
     page = 1
     collected = 0
+    pending = []
 
-    while collected < target_jobs:
-        # 🔥 GIỮ NGUYÊN LOGIC NÀY
-        if page == 1:
-            page_url = base_url
-        else:
-            page_url = (
-                f"{base_url}&page={page}"
-                if "?" in base_url
-                else f"{base_url}?page={page}"
+    if resume and checkpoint is not None:
+        state = checkpoint.resume_state()
+        if state:
+            page, collected = state["page"], state["collected"]
+            pending = state["in_flight"]
+            # Job đã ghi nhưng chưa kịp cập nhật checkpoint (crash giữa 2 bước)
+            if seen_index is not None:
+                pending = _drop_seen_jobs(seen_index, pending)
+            logger.info(
+                f"⏯ Resume {platform_name}: page {page}, "
+                f"collected {collected}, in-flight {len(pending)}",
+                extra=log,
             )
 
-        print(f"\n📄 Page {page} — {page_url}")
+    # job_url → job đã lấy từ list page nhưng chưa xử lý xong
+    in_flight = {}
+    # job đã ghi vào writer, chờ flush rồi mới mark seen
+    unflushed_urls = []
 
-        try:
-            job_list = scraper.scrape_job_list(page_url)
-        except Exception as e:
-            print(f"❌ Error loading page {page}: {e}")
-            break
+    def commit(done: bool = False):
+        """Gọi sau khi raw đã flush → seen index / checkpoint khớp dữ liệu trên đĩa."""
+        if seen_index is not None and unflushed_urls:
+            seen_index.mark(unflushed_urls)
+            unflushed_urls.clear()
+        if checkpoint is not None:
+            checkpoint.save(page, collected, list(in_flight.values()), done=done)
 
-        if not job_list:
-            print("⚠ No more jobs → stop.")
-            break
+    def save_checkpoint(done: bool = False):
+        writer.flush()
+        commit(done)
 
-        for job in job_list:
-            if collected >= target_jobs:
-                break
+    def report(status: str = "running"):
+        if progress:
+            progress(
+                {
+                    "platform": platform_name,
+                    "status": status,
+                    "page": page,
+                    "collected": collected,
+                    "target": target_jobs,
+                    "rate": scraper.rate_limiter.rate,
+                }
+            )
 
-            job_url = job.get("job_url")
-            if not job_url:
-                continue
+    def on_done(job_url: str, saved: bool):
+        nonlocal collected
+        in_flight.pop(job_url, None)
+        if saved:
+            collected += 1
+            unflushed_urls.append(job_url)
+        telemetry.incr(platform_name, "jobs_saved" if saved else "jobs_failed")
+        report()
+
+    finished = False
+    writer = RawWriter(RAW_DIR, platform_name, on_flush=commit, **(raw_options or {}))
+
+    with writer:
+        while collected < target_jobs:
+            if pending:
+                # Job dở dang (resume / chưa fetch ở vòng trước) → xử lý trước
+                job_list, pending = pending, []
+                logger.info(f"⏯ {len(job_list)} in-flight jobs", extra=log)
+            else:
+                page_url = build_page_url(base_url, page)
+
+                logger.info(f"📄 Page {page} — {page_url}", extra=log)
+                report()
+
+                try:
+                    with telemetry.timer(platform_name, "list_page"):
+                        job_list = scraper.scrape_job_list(page_url)
+                except Exception as e:
+                    logger.error(f"❌ Error loading page {page}: {e}", extra=log)
+                    break
+                telemetry.incr(platform_name, "list_pages")
+
+                if not job_list:
+                    logger.info("⚠ No more jobs → stop.", extra=log)
+                    finished = True
+                    break
+
+                page += 1
+
+                # Bỏ qua job đã crawl ở các lần chạy trước
+                if seen_index is not None:
+                    job_list = _drop_seen_jobs(seen_index, job_list)
+
+                    if not job_list:
+                        if stop_on_seen_page:
+                            logger.info(
+                                "⏹ Page chỉ toàn job đã crawl → stop.", extra=log
+                            )
+                            finished = True
+                            break
+                        continue
+
+            for job in job_list:
+                if job.get("job_url"):
+                    in_flight[job["job_url"]] = job
+            save_checkpoint()
+
+            # Requests (aiohttp) / auto / Selenium pool → fetch detail song song
+            if scraper.fetch_mode != "selenium" or scraper.selenium_mode == "pool":
+                _crawl_details_batch(
+                    scraper,
+                    platform_name,
+                    job_list,
+                    writer,
+                    collected,
+                    target_jobs,
+                    on_done=on_done,
+                )
+            else:
+                for job in job_list:
+                    if collected >= target_jobs:
+                        break
+
+                    job_url = job.get("job_url")
+                    if not job_url:
+                        continue
+
+                    logger.info(
+                        f"👉 Detail ({collected+1}/{target_jobs}): {job_url}",
+                        extra=log,
+                    )
+
+                    try:
+                        detail = scraper.scrape_job_detail(job_url)
+                    except Exception as e:
+                        logger.error(
+                            f"❌ Error scraping detail: {e}",
+                            extra={**log, "url": job_url},
+                        )
+                        on_done(job_url, False)
+                        continue
+
+                    raw_item = {
+                        "platform": platform_name,
+                        "job_list_item": job,
+                        "job_detail": detail,
+                        "timestamp": int(time.time()),
+                    }
+
+                    # Đếm trước flush → checkpoint khớp dữ liệu đã ghi
+                    with telemetry.timer(platform_name, "persist"):
+                        writer.write(
+                            raw_item, on_written=lambda: on_done(job_url, True)
+                        )
+                    logger.debug("✔ Saved", extra={**log, "url": job_url})
+
+            # Flush cuối mỗi vòng → list page sau lọc được job vừa ghi
+            save_checkpoint()
+            pending = list(in_flight.values())
+
+        finished = finished or collected >= target_jobs
+        save_checkpoint(done=finished)
 
-            print(f"👉 Detail ({collected+1}/{target_jobs}): {job_url}")
+    logger.info(
+        f"🎉 FINISHED {platform_name}: {collected} jobs → {writer.path}", extra=log
+    )
+    report("done")
+    return collected
+
+
+def _drop_seen_jobs(seen_index: SeenIndex, job_list: list) -> list:
+    """Giữ lại job chưa crawl (dedupe theo job_url), cập nhật last_seen job cũ."""
+    jobs_by_url = {}
+    for job in job_list:
+        job_url = job.get("job_url")
+        if job_url and job_url not in jobs_by_url:
+            jobs_by_url[job_url] = job
+
+    new_urls = seen_index.filter_new(jobs_by_url)
+    new_set = set(new_urls)
+    seen_index.mark(u for u in jobs_by_url if u not in new_set)
+
+    skipped = len(jobs_by_url) - len(new_urls)
+    if skipped:
+        logger.info(f"⏭ Skip {skipped} job đã crawl")
+
+    return [jobs_by_url[u] for u in new_urls]
+
+
+def _crawl_details_batch(
+    scraper,
+    platform_name: str,
+    job_list: list,
+    writer: RawWriter,
+    collected: int,
+    target_jobs: int,
+    on_done: Optional[Callable[[str, bool], None]] = None,
+) -> int:
+    jobs_by_url = {}
+    for job in job_list:
+        job_url = job.get("job_url")
+        if job_url and job_url not in jobs_by_url:
+            jobs_by_url[job_url] = job
+
+    # Chỉ fetch đúng số job còn thiếu
+    job_urls = list(jobs_by_url)[: max(target_jobs - collected, 0)]
+    log = {"platform": platform_name}
+    logger.info(f"⚡ Fetching {len(job_urls)} details (parallel)", extra=log)
+
+    for job_url, detail in scraper.scrape_job_details(job_urls):
+        if detail is None:
+            logger.error(
+                f"❌ Error scraping detail: {job_url}", extra={**log, "url": job_url}
+            )
+            if on_done:
+                on_done(job_url, False)
+            continue
+
+        raw_item = {
+            "platform": platform_name,
+            "job_list_item": jobs_by_url[job_url],
+            "job_detail": detail,
+            "timestamp": int(time.time()),
+        }
+
+        # Đếm trước flush → checkpoint khớp dữ liệu đã ghi
+        with get_telemetry().timer(platform_name, "persist"):
+            writer.write(
+                raw_item,
+                on_written=(lambda: on_done(job_url, True)) if on_done else None,
+            )
+        collected += 1
+        logger.info(
+            f"✔ Saved ({collected}/{target_jobs}): {job_url}",
+            extra={**log, "url": job_url},
+        )
+
+    return collected
+
+
+# ============================================================
+# PIPELINED CRAWL — list producer → detail workers → 1 writer
+# ============================================================
+_DONE = object()
+
+
+def _default_detail_workers(scraper) -> int:
+    # requests / auto: phần lớn trang không cần browser
+    if scraper.fetch_mode != "selenium":
+        return scraper.max_per_host
+    if scraper.selenium_mode == "pool":
+        return scraper.pool_size
+    # reuse / fresh: 1 driver → không song song
+    return 1
+
+
+def crawl_category_pipelined(
+    scraper,
+    platform_name: str,
+    base_url: str,
+    target_jobs: int = 500,
+    progress: Optional[Callable[[dict], None]] = None,
+    seen_index: Optional[SeenIndex] = None,
+    stop_on_seen_page: bool = True,
+    workers: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+    resume: bool = False,
+    raw_options: Optional[dict] = None,
+):
+    """
+    Giống crawl_category_by_url nhưng list page N+1 được fetch trong lúc
+    detail của page N còn đang chạy.
+
+    - producer: phân trang list → job_queue (bounded → backpressure)
+    - workers: lấy job, scrape_job_detail → result_queue (bounded)
+    - writer (thread hiện tại): ghi file, đếm collected
+
+    Mỗi worker phải "giữ chỗ" trước khi fetch (reserved ≤ target_jobs),
+    fetch lỗi thì trả chỗ → số job ghi ra không bao giờ vượt target_jobs.
+    """
+    workers = workers or _default_detail_workers(scraper)
+    job_queue = queue.Queue(maxsize=queue_size or workers * 2)
+    result_queue = queue.Queue(maxsize=workers * 2)
+    stop = threading.Event()
+
+    log = {"platform": platform_name}
+    telemetry = get_telemetry()
+    logger.info(
+        f"📂 SCRAPING CATEGORY (pipeline x{workers}) — {platform_name} | "
+        f"🎯 TARGET JOBS: {target_jobs}",
+        extra=log,
+    )
+
+    if seen_index is not None:
+        seen_index.bootstrap_from_raw(iter_raw_files(RAW_DIR, platform_name))
+
+    state = {"page": 1, "collected": 0, "reserved": 0, "exhausted": False}
+    state_lock = threading.Lock()
+    # job_url → job đã đưa vào pipeline nhưng chưa ghi / chưa fail
+    in_flight = {}
+    # job đã ghi vào writer, chờ flush rồi mới mark seen
+    unflushed_urls = []
+    resumed_jobs = []
+
+    if resume and checkpoint is not None:
+        saved = checkpoint.resume_state()
+        if saved:
+            state["page"], state["collected"] = saved["page"], saved["collected"]
+            state["reserved"] = saved["collected"]
+            resumed_jobs = saved["in_flight"]
+            if seen_index is not None:
+                resumed_jobs = _drop_seen_jobs(seen_index, resumed_jobs)
+            logger.info(
+                f"⏯ Resume {platform_name}: page {state['page']}, "
+                f"collected {state['collected']}, in-flight {len(resumed_jobs)}",
+                extra=log,
+            )
 
+    def commit(done: bool = False):
+        """Gọi sau khi raw đã flush → seen index / checkpoint khớp dữ liệu trên đĩa."""
+        with state_lock:
+            urls = list(unflushed_urls)
+            unflushed_urls.clear()
+            page, collected = state["page"], state["collected"]
+            jobs = list(in_flight.values())
+
+        if seen_index is not None and urls:
+            seen_index.mark(urls)
+        if checkpoint is not None:
+            checkpoint.save(page, collected, jobs, done=done)
+
+    def save_checkpoint(done: bool = False):
+        writer.flush()
+        commit(done)
+
+    def finish_job(job_url: str, saved: bool):
+        with state_lock:
+            in_flight.pop(job_url, None)
+            if saved:
+                state["collected"] += 1
+                unflushed_urls.append(job_url)
+        telemetry.incr(platform_name, "jobs_saved" if saved else "jobs_failed")
+
+    writer = RawWriter(RAW_DIR, platform_name, on_flush=commit, **(raw_options or {}))
+
+    def report(status: str = "running"):
+        if progress:
+            progress(
+                {
+                    "platform": platform_name,
+                    "status": status,
+                    "page": state["page"],
+                    "collected": state["collected"],
+                    "target": target_jobs,
+                    "rate": scraper.rate_limiter.rate,
+                }
+            )
+
+    def put(q: queue.Queue, item) -> bool:
+        """put có kiểm tra stop (tránh kẹt khi queue đầy)."""
+        while not stop.is_set():
             try:
-                detail = scraper.scrape_job_detail(job_url)
-            except Exception as e:
-                print(f"❌ Error scraping detail: {e}")
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reserve() -> bool:
+        with state_lock:
+            if state["reserved"] >= target_jobs:
+                return False
+            state["reserved"] += 1
+            return True
+
+    def release():
+        with state_lock:
+            state["reserved"] -= 1
+
+    # ---------- producer ----------
+    def produce():
+        try:
+            # Job dở dang từ lần chạy trước → vào queue trước
+            with state_lock:
+                for job in resumed_jobs:
+                    in_flight[job["job_url"]] = job
+            for job in resumed_jobs:
+                if not put(job_queue, job):
+                    return
+
+            while not stop.is_set():
+                # Đủ chỗ cho target → chờ (fetch lỗi có thể trả lại chỗ)
+                with state_lock:
+                    full = state["reserved"] >= target_jobs
+                if full:
+                    stop.wait(0.5)
+                    continue
+
+                page = state["page"]
+                page_url = build_page_url(base_url, page)
+                logger.info(f"📄 Page {page} — {page_url}", extra=log)
+
+                try:
+                    with telemetry.timer(platform_name, "list_page"):
+                        job_list = scraper.scrape_job_list(page_url)
+                except Exception as e:
+                    logger.error(f"❌ Error loading page {page}: {e}", extra=log)
+                    break
+                telemetry.incr(platform_name, "list_pages")
+
+                if not job_list:
+                    logger.info("⚠ No more jobs → stop.", extra=log)
+                    state["exhausted"] = True
+                    break
+
+                if seen_index is not None:
+                    job_list = _drop_seen_jobs(seen_index, job_list)
+                    if not job_list and stop_on_seen_page:
+                        logger.info("⏹ Page chỉ toàn job đã crawl → stop.", extra=log)
+                        state["exhausted"] = True
+                        break
+
+                job_list = [job for job in job_list if job.get("job_url")]
+                with state_lock:
+                    for job in job_list:
+                        in_flight[job["job_url"]] = job
+                    state["page"] = page + 1
+                save_checkpoint()
+
+                for job in job_list:
+                    if not put(job_queue, job):
+                        break
+
+                report()
+        finally:
+            for _ in range(workers):
+                put(job_queue, _DONE)
+
+    # ---------- detail workers ----------
+    def work():
+        try:
+            while not stop.is_set():
+                try:
+                    job = job_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                if job is _DONE:
+                    break
+
+                # Đủ chỗ rồi → bỏ qua (chỉ drain queue)
+                if not reserve():
+                    continue
+
+                job_url = job["job_url"]
+                logger.debug(f"👉 Detail: {job_url}", extra={**log, "url": job_url})
+                detail = scraper._scrape_job_detail_safe(job_url)
+
+                if detail is None:
+                    release()
+                    finish_job(job_url, False)
+                    continue
+
+                put(result_queue, (job, detail))
+        finally:
+            result_queue.put(_DONE)
+
+    threads = [threading.Thread(target=produce, name="list-producer", daemon=True)]
+    threads += [
+        threading.Thread(target=work, name=f"detail-worker-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+
+    # ---------- writer ----------
+    with writer:
+        finished_workers = 0
+        while finished_workers < workers:
+            item = result_queue.get()
+            if item is _DONE:
+                finished_workers += 1
                 continue
 
+            job, detail = item
             raw_item = {
                 "platform": platform_name,
                 "job_list_item": job,
@@ -79,40 +601,349 @@ def crawl_category_by_url(
                 "timestamp": int(time.time()),
             }
 
-            save_jsonl(output_file, raw_item)
-            collected += 1
-            print("   ✔ Saved")
+            # Đếm trước flush → checkpoint khớp dữ liệu đã ghi
+            with telemetry.timer(platform_name, "persist"):
+                writer.write(
+                    raw_item, on_written=lambda: finish_job(job["job_url"], True)
+                )
+            logger.info(
+                f"✔ Saved ({state['collected']}/{target_jobs}): {job['job_url']}",
+                extra={**log, "url": job["job_url"]},
+            )
+            report()
+
+            if state["collected"] >= target_jobs:
+                stop.set()
 
-            time.sleep(1.2)
+        stop.set()
+        for t in threads:
+            t.join()
 
-        page += 1
+        save_checkpoint(
+            done=state["exhausted"] or state["collected"] >= target_jobs,
+        )
 
-    print(f"\n🎉 FINISHED {platform_name}: {collected} jobs\n")
+    logger.info(
+        f"🎉 FINISHED {platform_name}: {state['collected']} jobs → {writer.path}",
+        extra=log,
+    )
+    report("done")
+    return state["collected"]
+
+
+def run_crawl(
+    scraper,
+    platform_name: str,
+    base_url: str,
+    target_jobs: int,
+    pipeline: bool = False,
+    workers: Optional[int] = None,
+    resume: bool = False,
+    **kwargs,
+):
+    kwargs["checkpoint"] = CrawlCheckpoint(platform_name, base_url)
+    kwargs["resume"] = resume
+
+    if pipeline:
+        return crawl_category_pipelined(
+            scraper, platform_name, base_url, target_jobs, workers=workers, **kwargs
+        )
+    return crawl_category_by_url(
+        scraper, platform_name, base_url, target_jobs, **kwargs
+    )
+
+
+# ============================================================
+# PARALLEL RUNNER — mỗi platform 1 process riêng
+# ============================================================
+def _crawl_platform_worker(
+    platform_name: str,
+    target_jobs: int,
+    progress_queue,
+    use_seen_index: bool = True,
+    scraper_options: Optional[dict] = None,
+    crawl_options: Optional[dict] = None,
+    log_options: Optional[dict] = None,
+    telemetry_dir: Optional[str] = TELEMETRY_DIR,
+):
+    """
+    Chạy trong process con: scraper riêng, output file riêng.
+    Mọi lỗi được báo về qua queue, không làm treo platform khác.
+    Telemetry của process ghi ra <telemetry_dir>/<platform>.json / .prom.
+    """
+    # spawn → process con không kế thừa cấu hình logging của process cha
+    configure_logging(**(log_options or {}))
+
+    _, url = PLATFORMS[platform_name]
+    scraper = None
+    seen_index = open_seen_index(platform_name) if use_seen_index else None
+
+    try:
+        scraper = build_scraper(platform_name, **(scraper_options or {}))
+        run_crawl(
+            scraper,
+            platform_name,
+            url,
+            target_jobs,
+            progress=progress_queue.put,
+            seen_index=seen_index,
+            **(crawl_options or {}),
+        )
+    except Exception as e:
+        progress_queue.put(
+            {"platform": platform_name, "status": "failed", "error": repr(e)}
+        )
+    finally:
+        if scraper:
+            scraper.close()
+        if seen_index:
+            seen_index.close()
+        if telemetry_dir:
+            get_telemetry().write(telemetry_dir, platform_name)
+
+
+def run_parallel(
+    platforms: list,
+    target_jobs: int,
+    poll_interval: float = 2.0,
+    use_seen_index: bool = True,
+    scraper_options: Optional[dict] = None,
+    crawl_options: Optional[dict] = None,
+    log_options: Optional[dict] = None,
+    telemetry_dir: Optional[str] = TELEMETRY_DIR,
+):
+    ctx = mp.get_context("spawn")
+    progress_queue = ctx.Queue()
+
+    processes = {}
+    for name in platforms:
+        proc = ctx.Process(
+            target=_crawl_platform_worker,
+            args=(
+                name,
+                target_jobs,
+                progress_queue,
+                use_seen_index,
+                scraper_options,
+                crawl_options,
+                log_options,
+                telemetry_dir,
+            ),
+            name=f"crawl-{name}",
+            daemon=False,
+        )
+        proc.start()
+        processes[name] = proc
+
+    state = {
+        name: {"status": "starting", "page": 0, "collected": 0, "target": target_jobs}
+        for name in platforms
+    }
+    started = time.time()
+    last_print = 0.0
+
+    while True:
+        try:
+            msg = progress_queue.get(timeout=poll_interval)
+            state[msg["platform"]].update(msg)
+        except queue.Empty:
+            pass
+
+        # Process chết mà không kịp báo (segfault, OOM, ...)
+        for name, proc in processes.items():
+            if not proc.is_alive() and state[name]["status"] not in ("done", "failed"):
+                if proc.exitcode not in (0, None):
+                    state[name]["status"] = "failed"
+                    state[name]["error"] = f"exit code {proc.exitcode}"
+
+        alive = any(proc.is_alive() for proc in processes.values())
+
+        if time.time() - last_print >= poll_interval or not alive:
+            last_print = time.time()
+            elapsed = int(time.time() - started)
+            line = " | ".join(
+                f"{name}: {st['collected']}/{st['target']} p{st['page']} "
+                f"{st.get('rate', 0):.2f} req/s {st['status']}"
+                for name, st in state.items()
+            )
+            logger.info(f"📊 [{elapsed}s] {line}")
+
+        if not alive and progress_queue.empty():
+            break
+
+    for proc in processes.values():
+        proc.join()
+
+    for name, st in state.items():
+        if st["status"] == "failed":
+            logger.error(
+                f"❌ {name} failed: {st.get('error')}", extra={"platform": name}
+            )
+
+    return state
 
 
 # ============================================================
 # MAIN
 # ============================================================
 def main():
-    TARGET_JOBS = 500
+    parser = argparse.ArgumentParser(description="Crawl raw jobs")
+    parser.add_argument("--target", type=int, default=500)
+    parser.add_argument(
+        "--platforms", nargs="+", choices=list(PLATFORMS), default=list(PLATFORMS)
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Crawl tất cả platform cùng lúc, mỗi platform 1 process",
+    )
+    parser.add_argument(
+        "--no-seen-index",
+        action="store_true",
+        help="Crawl lại cả job đã có trong raw_data/<platform>_seen.sqlite",
+    )
+    parser.add_argument(
+        "--http-cache",
+        metavar="DIR",
+        help="Bật cache response trên đĩa (vd: cache/http)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        default="auto",
+        help="HTML parser backend (auto = lxml nếu có cài)",
+    )
+    parser.add_argument(
+        "--browser-profile",
+        choices=["default", "fast"],
+        default="default",
+        help="fast = eager page load + chặn ảnh/font/ads/analytics",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Fetch list page kế tiếp song song với detail (producer/consumer)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Số detail worker cho --pipeline (mặc định: theo backend)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Tiếp tục từ checkpoint (raw_data/checkpoints) nếu crawl trước bị ngắt",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default="gzip",
+        help="Nén raw segment (zstd cần cài zstandard)",
+    )
+    parser.add_argument(
+        "--segment-mb",
+        type=int,
+        default=64,
+        help="Sang segment mới khi vượt N MB (chưa nén)",
+    )
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=50,
+        help="Flush raw file sau mỗi N record",
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="fsync sau mỗi lần flush (bền hơn khi mất điện, chậm hơn)",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="DIR",
+        help="Lưu HTML đã fetch vào archive (re-parse offline: scripts.reparse_archive)",
+    )
+    parser.add_argument(
+        "--fetch-mode",
+        choices=FETCH_MODES,
+        default="auto",
+        help="auto = requests trước, Selenium khi trang thiếu nội dung (học theo URL pattern)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMATS,
+        default="text",
+        help="json → 1 dòng JSON / log (kèm platform, url, attempt...)",
+    )
+    parser.add_argument(
+        "--telemetry-dir",
+        default=TELEMETRY_DIR,
+        help="Ghi metrics (JSON + Prometheus textfile) vào thư mục này",
+    )
+    args = parser.parse_args()
+
+    log_options = {"level": args.log_level, "fmt": args.log_format}
+    configure_logging(**log_options)
 
-    URL_ITVIEC = "https://itviec.com/it-jobs"
-    URL_TOPCV = "https://www.topcv.vn/tim-viec-lam-cong-nghe-thong-tin-cr257?type_keyword=1&sba=1&category_family=r257&saturday_status=0"
-    URL_VNW = "https://www.vietnamworks.com/viec-lam?g=5&ignoreLocation=true"
+    scraper_options = {
+        "http_cache_dir": args.http_cache,
+        "archive_dir": args.archive,
+        "parser": args.parser,
+        "browser_profile": args.browser_profile,
+        "fetch_mode": args.fetch_mode,
+    }
+    crawl_options = {
+        "pipeline": args.pipeline,
+        "workers": args.workers,
+        "resume": args.resume,
+        "raw_options": {
+            "compression": args.compression,
+            "max_segment_bytes": args.segment_mb * 1024 * 1024,
+            "flush_every": args.flush_every,
+            "fsync": args.fsync,
+        },
+    }
 
-    itviec = ITviecScraper(use_selenium=True)
-    topcv = TopCVScraper(use_selenium=True)
-    vnw = VietnamWorksScraper(use_selenium=True)
+    if args.parallel:
+        run_parallel(
+            args.platforms,
+            args.target,
+            use_seen_index=not args.no_seen_index,
+            scraper_options=scraper_options,
+            crawl_options=crawl_options,
+            log_options=log_options,
+            telemetry_dir=args.telemetry_dir,
+        )
+        return
+
+    scrapers = []
+    indexes = []
 
     try:
-        crawl_category_by_url(itviec, "itviec", URL_ITVIEC, TARGET_JOBS)
-        crawl_category_by_url(topcv, "topcv", URL_TOPCV, TARGET_JOBS)
-        crawl_category_by_url(vnw, "vietnamworks", URL_VNW, TARGET_JOBS)
+        for name in args.platforms:
+            _, url = PLATFORMS[name]
+            seen_index = None if args.no_seen_index else open_seen_index(name)
+            if seen_index:
+                indexes.append(seen_index)
+
+            scraper = build_scraper(name, **scraper_options)
+            scrapers.append(scraper)
+            run_crawl(
+                scraper, name, url, args.target, seen_index=seen_index, **crawl_options
+            )
 
     finally:
-        itviec.close()
-        topcv.close()
-        vnw.close()
+        for scraper in scrapers:
+            scraper.close()
+        for seen_index in indexes:
+            seen_index.close()
+
+        paths = get_telemetry().write(args.telemetry_dir, "crawl")
+        logger.info(f"📈 Telemetry → {paths['json']}, {paths['prometheus']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,86 @@
+import asyncio
+import contextlib
+
+from aiohttp import web
+
+from scrapers.html_archive import HtmlArchive
+from scrapers.http_cache import ResponseCache
+from scrapers.topcv_scraper import TopCVScraper
+
+ETAG = '"v1"'
+HTML = (
+    "<html><body><div class='job-description__item--content'>Python</div></body></html>"
+)
+
+
+@contextlib.asynccontextmanager
+async def job_server():
+    """Trang detail có ETag; If-None-Match khớp → 304. Trả về list status đã trả."""
+    statuses = []
+
+    async def job(request):
+        if request.headers.get("If-None-Match") == ETAG:
+            statuses.append(304)
+            return web.Response(status=304, headers={"ETag": ETAG})
+        statuses.append(200)
+        return web.Response(text=HTML, content_type="text/html", headers={"ETag": ETAG})
+
+    app = web.Application()
+    app.router.add_get("/viec-lam/{slug}", job)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}", statuses
+    finally:
+        await runner.cleanup()
+
+
+def make_scraper(tmp_path, ttl):
+    return TopCVScraper(
+        use_selenium=False,
+        cache=ResponseCache(str(tmp_path / "http_cache.sqlite"), ttl=ttl),
+        archive=HtmlArchive(str(tmp_path / "archive")),
+        rate_limit={"rate": 1000},
+    )
+
+
+def fetch_twice(scraper):
+    async def scenario():
+        async with job_server() as (base, statuses):
+            urls = [f"{base}/viec-lam/python-{i}" for i in range(3)]
+            first = await scraper.get_pages_async(urls, kind="detail")
+            second = await scraper.get_pages_async(urls, kind="detail")
+        return first, second, statuses
+
+    return asyncio.run(scenario())
+
+
+def test_async_fetch_hits_cache_within_ttl(tmp_path):
+    scraper = make_scraper(tmp_path, ttl=3600)
+    first, second, statuses = fetch_twice(scraper)
+
+    assert statuses == [200, 200, 200]
+    assert all(soup is not None for _, soup in first + second)
+    stats = scraper.cache.stats()
+    assert (stats["misses"], stats["hits"]) == (3, 3)
+
+
+def test_async_fetch_revalidates_expired_entries(tmp_path):
+    scraper = make_scraper(tmp_path, ttl=0)
+    _, second, statuses = fetch_twice(scraper)
+
+    assert sorted(statuses) == [200] * 3 + [304] * 3
+    # 304 → dùng lại HTML trong cache
+    assert all(soup.select_one(".job-description__item--content") for _, soup in second)
+    assert scraper.cache.stats()["revalidated"] == 3
+
+
+def test_async_fetch_archives_with_kind(tmp_path):
+    scraper = make_scraper(tmp_path, ttl=3600)
+    fetch_twice(scraper)
+
+    pages = list(scraper.archive.iter_pages("topcv", "detail"))
+    assert len(pages) == 3
@@ -0,0 +1,112 @@
+import pytest
+
+from scrapers.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.execute_script(cmd)
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.execute_script(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FlakyFactory:
+    """Tạo FakeDriver; `failures` lần gọi tiếp theo raise (Chrome không lên)."""
+
+    def __init__(self):
+        self.failures = 0
+        self.created = []
+
+    def __call__(self):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("session not created")
+        driver = FakeDriver()
+        self.created.append(driver)
+        return driver
+
+
+def test_broken_driver_replaced_on_next_checkout():
+    factory = FlakyFactory()
+    pool = DriverPool(factory, size=1)
+
+    with pytest.raises(ValueError):
+        with pool.driver() as driver:
+            driver.alive = False
+            raise ValueError("parse error")
+
+    assert driver.quit_called
+    with pool.driver() as fresh:
+        assert fresh is not driver
+    assert len(factory.created) == 2
+
+
+def test_factory_failure_does_not_shrink_pool():
+    factory = FlakyFactory()
+    pool = DriverPool(factory, size=1)
+
+    driver = pool.checkout()
+    factory.failures = 1
+    # checkin không gọi factory → không raise trong finally
+    pool.checkin(driver, broken=True)
+
+    # Lần đầu factory lỗi → exception gốc, slot được trả lại
+    with pytest.raises(RuntimeError, match="session not created"):
+        pool.checkout(timeout=1)
+    # Lần sau tạo lại được → pool vẫn đủ 1 driver
+    driver = pool.checkout(timeout=1)
+    assert driver is factory.created[-1]
+    pool.checkin(driver)
+
+
+def test_checkout_times_out_when_exhausted():
+    pool = DriverPool(FlakyFactory(), size=1)
+    driver = pool.checkout()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.05)
+
+    pool.checkin(driver)
+    assert pool.checkout(timeout=0.05) is driver
+
+
+def test_close_quits_all_drivers():
+    factory = FlakyFactory()
+    pool = DriverPool(factory, size=2)
+    pool.close()
+
+    assert all(d.quit_called for d in factory.created)
+    with pytest.raises(RuntimeError):
+        pool.checkout()
+
+
+def test_init_failure_quits_started_drivers():
+    factory = FlakyFactory()
+    real_call = factory.__call__
+
+    def third_fails():
+        if len(factory.created) == 2:
+            raise RuntimeError("session not created")
+        return real_call()
+
+    with pytest.raises(RuntimeError, match="session not created"):
+        DriverPool(third_fails, size=3)
+
+    assert len(factory.created) == 2
+    assert all(driver.quit_called for driver in factory.created)
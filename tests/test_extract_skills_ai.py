@@ -0,0 +1,210 @@
+import asyncio
+import contextlib
+import json
+import os
+
+import pytest
+from aiohttp import web
+
+from scripts import extract_skills_ai as ai
+from scripts.mock_openai_server import STATS, make_app
+
+SKILLS = ["Python", "Java", "Docker", "AWS", "SQL", "React", "Kafka", "Golang"]
+
+
+# =========================
+# Helpers
+# =========================
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(ai, "BASE_BACKOFF", 0.01)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+@contextlib.asynccontextmanager
+async def mock_server(monkeypatch, **options):
+    """Chạy mock chat-completions trên port ngẫu nhiên, trả về stats của server."""
+    options.setdefault("latency", 0.01)
+    options.setdefault("token_latency", 0.0)
+    app = make_app(**options)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{port}/v1")
+    try:
+        yield app[STATS]
+    finally:
+        await runner.cleanup()
+
+
+def write_jobs(path, count):
+    """Job i cần SKILLS[i % n] + SKILLS[(i + 1) % n]; mỗi job 1 text khác nhau."""
+    expected = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            skills = [SKILLS[i % len(SKILLS)], SKILLS[(i + 1) % len(SKILLS)]]
+            job = {
+                "title": f"Engineer {i}",
+                "description": f"Cần kinh nghiệm {skills[0]} và {skills[1]}.",
+                "requirements": [],
+            }
+            f.write(json.dumps(job, ensure_ascii=False) + "\n")
+            # Mock trả skill theo thứ tự của danh sách KNOWN_SKILLS
+            expected.append({"title": job["title"], "skills": skills})
+    return expected
+
+
+async def run_extract(tmp_path, **options):
+    """Như main(): load cache + journal → chỉ gọi AI cho text chưa có."""
+    cache_file = str(tmp_path / "skill_cache.json")
+    output = str(tmp_path / "job_skills.jsonl")
+
+    cache = ai.load_cache(cache_file)
+    entries, texts = ai.load_entries(str(tmp_path / "jobs.jsonl"))
+    misses = {h: t for h, t in texts.items() if h not in cache}
+
+    options.setdefault("rpm", 60_000)
+    options.setdefault("tpm", 10_000_000)
+    stats = await ai.extract_async(
+        entries, misses, cache, output, cache_file, **options
+    )
+    return stats, cache
+
+
+def read_output(tmp_path):
+    with open(tmp_path / "job_skills.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def normalized(records):
+    # So sánh không phụ thuộc thứ tự skill trong 1 job
+    return [{"title": r["title"], "skills": sorted(r["skills"])} for r in records]
+
+
+# =========================
+# Tests
+# =========================
+
+
+def test_output_keeps_input_order(tmp_path, monkeypatch):
+    expected = write_jobs(tmp_path / "jobs.jsonl", 40)
+
+    async def scenario():
+        # Latency ngẫu nhiên ±50% → response về không theo thứ tự gửi
+        async with mock_server(monkeypatch, latency=0.05) as server:
+            stats, _ = await run_extract(tmp_path, concurrency=8)
+        return stats, server
+
+    stats, server = asyncio.run(scenario())
+
+    assert normalized(read_output(tmp_path)) == normalized(expected)
+    assert stats["ai_calls"] == 40
+    assert server["max_in_flight"] <= 8
+
+
+def test_retries_rate_limit_and_server_errors(tmp_path, monkeypatch):
+    expected = write_jobs(tmp_path / "jobs.jsonl", 6)
+
+    async def scenario():
+        async with mock_server(monkeypatch, faults=[429, 500, 503, 429]) as server:
+            stats, cache = await run_extract(tmp_path, concurrency=2)
+        return stats, cache, server
+
+    stats, cache, server = asyncio.run(scenario())
+
+    assert stats["retries"] == 4
+    assert stats["rate_limited"] == 2
+    assert stats["failed"] == 0
+    assert server["requests"] == 6 + 4
+    assert len(cache) == 6
+    assert normalized(read_output(tmp_path)) == normalized(expected)
+
+
+def test_gives_up_without_caching(tmp_path, monkeypatch):
+    write_jobs(tmp_path / "jobs.jsonl", 2)
+
+    async def scenario():
+        # Job đầu: 500 quá max_retries; job sau: 400 (không retry)
+        async with mock_server(monkeypatch, faults=[500, 500, 500, 400]) as server:
+            stats, cache = await run_extract(tmp_path, concurrency=1, max_retries=2)
+        return stats, cache, server
+
+    stats, cache, server = asyncio.run(scenario())
+
+    assert stats["failed"] == 2
+    assert server["requests"] == 4
+    assert cache == {}
+    # Vẫn giữ 1 dòng / job (skills rỗng) để không lệch dòng với input
+    assert [r["skills"] for r in read_output(tmp_path)] == [[], []]
+
+
+def test_resumes_from_journal(tmp_path, monkeypatch):
+    expected = write_jobs(tmp_path / "jobs.jsonl", 20)
+    journal = ai.journal_path(str(tmp_path / "skill_cache.json"))
+
+    def journal_lines():
+        if not os.path.exists(journal):
+            return 0
+        with open(journal, encoding="utf-8") as f:
+            return len(f.readlines())
+
+    async def interrupted():
+        async with mock_server(monkeypatch, latency=0.05):
+            task = asyncio.create_task(run_extract(tmp_path, concurrency=2))
+            # Dừng giữa chừng khi đã có ít nhất 6 kết quả trong journal
+            while journal_lines() < 6:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    asyncio.run(interrupted())
+
+    journaled = journal_lines()
+    assert 6 <= journaled < 20
+    assert len(ai.load_cache(str(tmp_path / "skill_cache.json"))) == journaled
+
+    async def resumed():
+        async with mock_server(monkeypatch) as server:
+            stats, cache = await run_extract(tmp_path, concurrency=4)
+        return stats, cache, server
+
+    stats, cache, server = asyncio.run(resumed())
+
+    # Chỉ gọi lại các job chưa có trong journal
+    assert server["requests"] == 20 - journaled
+    assert len(cache) == 20
+    assert normalized(read_output(tmp_path)) == normalized(expected)
+
+    ai.save_cache(cache, str(tmp_path / "skill_cache.json"))
+    assert not os.path.exists(journal)
+    assert len(ai.load_cache(str(tmp_path / "skill_cache.json"))) == 20
+
+
+def test_batch_mode_retries_missing_jobs_individually(tmp_path, monkeypatch):
+    expected = write_jobs(tmp_path / "jobs.jsonl", 30)
+
+    async def scenario(drop_rate):
+        async with mock_server(monkeypatch, drop_rate=drop_rate) as server:
+            stats, _ = await run_extract(
+                tmp_path, concurrency=4, batch_tokens=ai.BATCH_TOKENS, batch_size=10
+            )
+        return stats, server
+
+    stats, server = asyncio.run(scenario(0.0))
+    assert stats["batches"] == 3
+    assert stats["split_retries"] == 0
+    assert server["requests"] == 3
+    assert normalized(read_output(tmp_path)) == normalized(expected)
+
+    # Mọi id bị thiếu / sai kiểu → mỗi job được gọi lại riêng
+    os.remove(tmp_path / "skill_cache.json.journal")
+    stats, server = asyncio.run(scenario(1.0))
+    assert stats["split_retries"] == 30
+    assert server["requests"] == 3 + 30
+    assert normalized(read_output(tmp_path)) == normalized(expected)
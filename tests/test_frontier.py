@@ -0,0 +1,192 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+from scrapers.frontier import Frontier, NewTask
+from scripts import frontier_worker
+
+# =========================
+# Helpers
+# =========================
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    # File SQLite (không dùng :memory:) → nhiều Frontier / thread dùng chung DB
+    return f"sqlite:///{tmp_path / 'frontier.sqlite'}"
+
+
+@pytest.fixture
+def make_frontier(db_url):
+    """Mỗi lần gọi = 1 "worker" với connection riêng tới cùng frontier."""
+    opened = []
+
+    def make(**options):
+        options.setdefault("host_interval", 0.0)
+        frontier = Frontier(db_url, **options)
+        opened.append(frontier)
+        return frontier
+
+    yield make
+    for frontier in opened:
+        frontier.close()
+
+
+def detail(url, platform="itviec"):
+    return NewTask(platform, "detail", url, {"job": {"job_url": url}})
+
+
+# =========================
+# Heartbeat
+# =========================
+
+
+def test_heartbeat_keeps_long_task_leased(make_frontier):
+    frontier = make_frontier(lease_seconds=0.3)
+    other = make_frontier(lease_seconds=0.3)
+    frontier.enqueue([detail("https://itviec.com/it-jobs/a-1")])
+
+    task = frontier.lease("worker-1")
+    with frontier.heartbeat(task, interval=0.05):
+        # Chạy lâu gấp ~3 lần lease_seconds
+        time.sleep(0.9)
+        assert other.lease("worker-2") is None
+
+    assert frontier.complete(task, record={"ok": True})
+    assert [record for _, record in frontier.iter_results()] == [{"ok": True}]
+
+
+def test_worker_extends_lease_while_task_runs(make_frontier, monkeypatch):
+    frontier = make_frontier(lease_seconds=0.3)
+    other = make_frontier(lease_seconds=0.3)
+    frontier.enqueue([detail("https://itviec.com/it-jobs/a-1")])
+    stolen = []
+
+    def slow_detail(frontier, scraper, task):
+        time.sleep(0.9)
+        stolen.append(other.lease("worker-2"))
+        return frontier.complete(task, record={"url": task.url})
+
+    class FakeScraper:
+        def close(self):
+            pass
+
+    monkeypatch.setitem(frontier_worker.TASK_RUNNERS, "detail", slow_detail)
+    monkeypatch.setattr(
+        frontier_worker, "build_scraper", lambda *a, **kw: FakeScraper()
+    )
+
+    stats = frontier_worker.work(frontier, "worker-1", idle_sleep=0.01)
+
+    assert stats == {"done": 1, "failed": 0, "lost": 0}
+    assert stolen == [None]
+
+
+# =========================
+# Lease / ack
+# =========================
+
+
+def test_racing_workers_only_one_wins(make_frontier):
+    make_frontier().enqueue([detail("https://itviec.com/it-jobs/a-1")])
+    workers = [make_frontier() for _ in range(8)]
+    barrier = threading.Barrier(len(workers))
+    leased = []
+
+    def race(i, frontier):
+        barrier.wait()
+        leased.append(frontier.lease(f"worker-{i}"))
+
+    threads = [
+        threading.Thread(target=race, args=(i, f)) for i, f in enumerate(workers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    winners = [task for task in leased if task is not None]
+    assert len(winners) == 1
+    assert winners[0].attempts == 1
+
+
+def test_expired_lease_is_released_then_fails(make_frontier):
+    frontier = make_frontier(lease_seconds=0.05, max_attempts=2)
+    frontier.enqueue([detail("https://itviec.com/it-jobs/a-1")])
+
+    first = frontier.lease("worker-1")
+    time.sleep(0.1)
+    # Worker 1 "chết" → hết lease → worker 2 lấy lại, attempts += 1
+    second = frontier.lease("worker-2")
+    assert second.id == first.id
+    assert second.attempts == 2
+    assert second.lease_token != first.lease_token
+
+    time.sleep(0.1)
+    # Hết max_attempts → failed, không lease lại nữa
+    assert frontier.lease("worker-3") is None
+    assert frontier.stats() == {"itviec": {"detail:failed": 1}}
+    assert frontier.unfinished() == 0
+
+
+def test_complete_with_stale_token_writes_nothing(make_frontier):
+    frontier = make_frontier(lease_seconds=0.05)
+    frontier.enqueue([detail("https://itviec.com/it-jobs/a-1")])
+
+    stale = frontier.lease("worker-1")
+    time.sleep(0.1)
+    fresh = frontier.lease("worker-2")
+
+    child = detail("https://itviec.com/it-jobs/b-2")
+    assert not frontier.complete(stale, record={"by": 1}, children=[child])
+    assert not frontier.extend(stale)
+    assert not frontier.fail(stale, "late error")
+    assert list(frontier.iter_results()) == []
+    assert frontier.unfinished() == 1
+
+    assert frontier.complete(fresh, record={"by": 2})
+    assert [record for _, record in frontier.iter_results()] == [{"by": 2}]
+
+
+def test_host_politeness_blocks_second_lease(make_frontier):
+    frontier = make_frontier(host_interval=60.0)
+    frontier.enqueue(
+        [
+            detail("https://itviec.com/it-jobs/a-1"),
+            detail("https://itviec.com/it-jobs/b-2"),
+            detail("https://www.topcv.vn/viec-lam/c/3.html", platform="topcv"),
+        ]
+    )
+
+    first = frontier.lease("worker-1")
+    second = frontier.lease("worker-2")
+    # itviec.com đang trong min_interval → chỉ host khác được lease
+    assert urlparse(first.url).netloc != urlparse(second.url).netloc
+    assert frontier.lease("worker-3") is None
+
+
+def test_next_page_only_when_children_are_new(make_frontier):
+    frontier = make_frontier()
+    page = {"base_url": "https://itviec.com/it-jobs", "page": 1}
+    frontier.enqueue([NewTask("itviec", "list", "https://itviec.com/it-jobs", page)])
+    jobs = [detail("https://itviec.com/it-jobs/a-1")]
+
+    def next_page(n):
+        url = f"https://itviec.com/it-jobs?page={n}"
+        return NewTask("itviec", "list", url, {**page, "page": n})
+
+    task = frontier.lease("worker-1", kinds=["list"])
+    assert frontier.complete(task, children=jobs, next_page=next_page(2))
+    assert frontier.stats()["itviec"] == {
+        "detail:pending": 1,
+        "list:done": 1,
+        "list:pending": 1,
+    }
+
+    # Page 2 chỉ có job đã có trong frontier → không thêm page 3
+    task = frontier.lease("worker-1", kinds=["list"])
+    assert task.url.endswith("page=2")
+    assert frontier.complete(task, children=jobs, next_page=next_page(3))
+    assert frontier.stats()["itviec"] == {"detail:pending": 1, "list:done": 2}
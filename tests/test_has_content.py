@@ -0,0 +1,66 @@
+import glob
+import os
+
+import pytest
+
+from scrapers.itviec_scraper import ITviecScraper
+from scrapers.topcv_scraper import TopCVScraper
+from scrapers.vietnamworks_scraper import VietnamWorksScraper
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "saved_pages")
+
+SCRAPERS = {
+    "itviec": ITviecScraper,
+    "topcv": TopCVScraper,
+    "vietnamworks": VietnamWorksScraper,
+}
+
+CHALLENGE_PAGE = """
+<html><head><title>Just a moment...</title></head>
+<body><div id="challenge-running">Checking your browser before accessing.</div>
+<noscript>Enable JavaScript and cookies to continue</noscript></body></html>
+"""
+
+JS_SHELL = """
+<html><head><script src="/_next/static/chunks/main.js"></script></head>
+<body><div id="__next"></div></body></html>
+"""
+
+
+@pytest.fixture(scope="module", params=sorted(SCRAPERS))
+def scraper(request):
+    # requests mode → không mở browser
+    return SCRAPERS[request.param](use_selenium=False)
+
+
+def saved_pages(platform, kind):
+    pattern = os.path.join(PAGES_DIR, platform, kind, "*.html")
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            yield f.read()
+
+
+@pytest.mark.parametrize("kind", ["list", "detail"])
+def test_saved_pages_have_content(scraper, kind):
+    pages = list(saved_pages(scraper.PLATFORM, kind))
+    assert pages
+
+    for html in pages:
+        assert scraper.has_content(scraper._make_soup(html), kind)
+
+
+@pytest.mark.parametrize("kind", ["list", "detail"])
+@pytest.mark.parametrize("html", [CHALLENGE_PAGE, JS_SHELL])
+def test_challenge_and_shell_pages_escalate(scraper, kind, html):
+    assert not scraper.has_content(scraper._make_soup(html), kind)
+
+
+def test_empty_last_list_page_is_valid(scraper):
+    marker = scraper.EMPTY_MARKERS["list"][0]
+    html = f"<html><body><main><p>{marker.upper()}.</p></main></body></html>"
+    soup = scraper._make_soup(html)
+
+    assert scraper.has_content(soup, "list")
+    assert scraper.parse_job_list(soup) == []
+    # Marker list không áp dụng cho trang detail
+    assert not scraper.has_content(soup, "detail")
@@ -0,0 +1,38 @@
+import json
+import os
+
+import pytest
+
+from scripts.check_parser_parity import (
+    build_parse_scraper,
+    iter_saved_pages,
+    page_url,
+    parse_page,
+)
+
+pytest.importorskip("lxml")
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "saved_pages")
+PAGES = list(iter_saved_pages(PAGES_DIR))
+
+
+def test_saved_pages_present():
+    kinds = {(platform, kind) for platform, kind, _ in PAGES}
+    assert len(kinds) == 6
+
+
+@pytest.mark.parametrize(
+    "platform, kind, path",
+    PAGES,
+    ids=[os.path.basename(path) for _, _, path in PAGES],
+)
+def test_lxml_matches_html_parser(platform, kind, path):
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    url = page_url(path)
+
+    expected = parse_page(build_parse_scraper(platform, "html.parser"), kind, html, url)
+    actual = parse_page(build_parse_scraper(platform, "lxml"), kind, html, url)
+
+    assert expected
+    assert json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True)
@@ -0,0 +1,36 @@
+import gzip
+import json
+
+from scrapers.raw_writer import RawWriter
+
+
+def read_segment(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_on_written_runs_before_flush_hook(tmp_path):
+    """Checkpoint lưu trong on_flush phải tính cả record vừa được flush."""
+    collected = []
+    checkpoints = []
+
+    writer = RawWriter(
+        str(tmp_path),
+        "topcv",
+        flush_every=2,
+        on_flush=lambda: checkpoints.append((writer.records, len(collected))),
+    )
+    with writer:
+        for i in range(5):
+            writer.write({"i": i}, on_written=lambda i=i: collected.append(i))
+
+    # flush sau record 2, 4 và lúc close (record 5)
+    assert checkpoints == [(2, 2), (4, 4), (5, 5)]
+    assert [r["i"] for r in read_segment(writer.path)] == collected
+
+
+def test_write_without_callback(tmp_path):
+    with RawWriter(str(tmp_path), "itviec", flush_every=1) as writer:
+        writer.write({"job_url": "https://itviec.com/it-jobs/a-1"})
+
+    assert read_segment(writer.path) == [{"job_url": "https://itviec.com/it-jobs/a-1"}]
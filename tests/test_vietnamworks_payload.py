@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from scrapers.vietnamworks_scraper import VietnamWorksScraper
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "fixtures", "vietnamworks_search_payload.json"
+)
+
+
+@pytest.fixture(scope="module")
+def payload():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    # requests mode → không mở browser
+    return VietnamWorksScraper(use_selenium=False)
+
+
+def test_parse_search_payload_builds_job_cards(scraper, payload):
+    jobs = scraper.parse_search_payload(payload)
+
+    assert len(jobs) == len(payload["data"])
+    assert jobs[0] == {
+        "title": "Senior Python Developer (Django, AWS)",
+        "company": "CÔNG TY TNHH GIẢI PHÁP PHẦN MỀM FPT",
+        "location": "Hồ Chí Minh",
+        "salary": "$1,500 - $2,500",
+        "job_url": "https://www.vietnamworks.com/senior-python-developer-django-aws-1812345-jv",
+    }
+
+
+def test_locations_deduplicated_in_order(scraper, payload):
+    jobs = scraper.parse_search_payload(payload)
+
+    # 2 chi nhánh Hà Nội + 1 Hồ Chí Minh → mỗi city 1 lần
+    assert jobs[1]["location"] == "Hà Nội, Hồ Chí Minh"
+    # cityNameVI rỗng → cityName
+    assert jobs[2]["location"] == "Ho Chi Minh"
+    # không có workingLocations → None
+    assert jobs[3]["location"] is None
+
+
+def test_job_url_fallbacks(scraper, payload):
+    jobs = scraper.parse_search_payload(payload)
+
+    # jobUrl null → alias + jobId
+    assert jobs[2]["job_url"] == (
+        "https://www.vietnamworks.com/backend-developer-golang-1811502-jv"
+    )
+    # jobUrl tương đối → ghép base_url
+    assert jobs[3]["job_url"] == (
+        "https://www.vietnamworks.com/qa-automation-engineer-1807730-jv"
+    )
+
+
+def test_same_schema_as_dom_parser(scraper, payload):
+    html = """
+    <div class="search_list view_job_item new-job-card">
+      <h2><a href="/senior-python-developer-django-aws-1812345-jv">Senior Python</a></h2>
+    </div>
+    """
+    dom_jobs = scraper.parse_job_list(scraper._make_soup(html))
+    xhr_jobs = scraper.parse_search_payload(payload)
+
+    assert set(dom_jobs[0]) == set(xhr_jobs[0])
+
+
+def test_empty_or_missing_data(scraper):
+    assert scraper.parse_search_payload({}) == []
+    assert scraper.parse_search_payload({"data": None}) == []
+
+
+class FakeSearchDriver:
+    """Driver giả: mỗi lần get() trang search → log có 1 response API search."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.visited = []
+        self.log = []
+
+    def get(self, url):
+        self.visited.append(url)
+        api = "https://ms.vietnamworks.com/job-search/v1.0/search"
+        self.log = [
+            {"message": json.dumps({"message": message})}
+            for message in (
+                {
+                    "method": "Network.responseReceived",
+                    "params": {"requestId": "1", "response": {"url": api}},
+                },
+                {"method": "Network.loadingFinished", "params": {"requestId": "1"}},
+            )
+        ]
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {"body": json.dumps(self.payload)}
+
+    def execute_script(self, script):
+        return 2048
+
+
+def test_xhr_list_goes_through_limiter_and_timings(scraper, payload, monkeypatch):
+    url = "https://www.vietnamworks.com/viec-lam?q=python"
+    driver = FakeSearchDriver(payload)
+    monkeypatch.setattr(scraper, "driver", driver)
+
+    limiter = scraper._limiter(url)
+    calls = []
+    monkeypatch.setattr(limiter, "acquire", lambda: calls.append("acquire"))
+    monkeypatch.setattr(limiter, "record", lambda *a, **kw: calls.append("record"))
+
+    jobs = scraper._scrape_with_xhr(url)
+
+    assert len(jobs) == len(payload["data"])
+    assert driver.visited == [url]
+    assert calls == ["acquire", "record"]
+    timing = scraper.page_timings[-1]
+    assert timing["url"] == url
+    assert timing["transfer_bytes"] == 2048
+    assert timing["html_bytes"] > 0
+    # Log của trang search đã được drain
+    assert driver.log == []